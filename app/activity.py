@@ -0,0 +1,145 @@
+"""
+Activity-event pipeline for the Seminars App.
+
+record_activity() writes an ``activity_events`` row for every change. The
+``activity_write_mode`` setting chooses how the row reaches the database:
+
+- ``sync`` (default): the row is added to the caller's session and commits
+  with the change it describes.
+- ``buffered``: the row is built (details JSON, ``created_at``) at call time
+  but kept off the caller's transaction. On bulk-ish paths (availability
+  autosave, uploads, workflow toggles) those transactions stay small and hold
+  the SQLite write lock for less time. Rows wait in ``session.info`` until the
+  session commits and are then handed to a process-wide buffer; a rollback
+  drops them, so an event is still never written for a change that did not
+  commit. A background task writes the buffer with one executemany INSERT
+  every ``activity_flush_interval_ms``, in its own short transaction.
+
+The buffer is flushed at once when it reaches ``activity_buffer_max_events``,
+and when the app shuts down. Until a flush, the activity feed can lag the
+change by up to one interval. Buffering only applies while the writer task
+runs (started by the app lifespan); scripts and tests that use
+record_activity() without it keep writing synchronously.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session as OrmSession
+
+from app.core import get_engine, settings
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODES = ("sync", "buffered")
+
+_PENDING_KEY = "pending_activity"
+
+_rows: List[dict] = []
+_rows_lock = threading.Lock()
+_flush_lock = threading.Lock()  # one INSERT at a time keeps rows in order
+_writer: Optional[asyncio.Task] = None
+
+
+def buffering() -> bool:
+    """True when record_activity() should defer events to the buffer."""
+    return settings.activity_write_mode == "buffered" and _writer is not None and not _writer.done()
+
+
+def defer(db: OrmSession, row: dict) -> None:
+    """Hold an event row until ``db`` commits."""
+    db.info.setdefault(_PENDING_KEY, []).append(row)
+
+
+def pending_count() -> int:
+    with _rows_lock:
+        return len(_rows)
+
+
+def enqueue(rows: List[dict]) -> None:
+    with _rows_lock:
+        _rows.extend(rows)
+        full = len(_rows) >= settings.activity_buffer_max_events
+    if full or not buffering():
+        # Back-pressure, or the writer stopped while the session was open:
+        # the committing request writes the batch itself
+        flush()
+
+
+def flush(engine=None) -> int:
+    """Write every buffered event with one executemany INSERT; returns the count."""
+    from app.models import ActivityEvent  # Import here to avoid circular imports
+
+    with _flush_lock:
+        with _rows_lock:
+            rows = _rows[:]
+            _rows.clear()
+        if not rows:
+            return 0
+        try:
+            with (engine or get_engine()).begin() as conn:
+                conn.execute(insert(ActivityEvent.__table__), rows)
+        except Exception:
+            with _rows_lock:
+                _rows[:0] = rows  # keep them for the next attempt, oldest first
+            raise
+    return len(rows)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _hand_over_on_commit(session: OrmSession) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        enqueue(rows)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _drop_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def _flush_forever(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        if not pending_count():
+            continue
+        try:
+            await run_in_threadpool(flush)
+        except Exception as e:  # keep the loop alive; the rows stay buffered
+            logger.error(f"Activity flush failed: {e}")
+
+
+def start_writer() -> Optional[asyncio.Task]:
+    """Start the buffered writer on the running loop (None in sync mode)."""
+    global _writer
+    if settings.activity_write_mode not in WRITE_MODES:
+        logger.warning(f"Unknown activity_write_mode {settings.activity_write_mode!r}; writing synchronously")
+        return None
+    if settings.activity_write_mode != "buffered":
+        return None
+    interval = max(settings.activity_flush_interval_ms, 10) / 1000
+    _writer = asyncio.create_task(_flush_forever(interval), name="activity-writer")
+    return _writer
+
+
+async def stop_writer(task: Optional[asyncio.Task]) -> None:
+    """Stop the writer and flush what is still buffered."""
+    global _writer
+    if task is None:
+        return
+    _writer = None  # events recorded from now on are written synchronously
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    try:
+        written = await run_in_threadpool(flush)
+        if written:
+            logger.info(f"Flushed {written} buffered activity events at shutdown")
+    except Exception as e:
+        logger.error(f"Could not flush {pending_count()} buffered activity events at shutdown: {e}")
@@ -19,20 +19,26 @@ from typing import Optional, Dict, List
 from contextlib import contextmanager
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from sqlmodel import Session, select, delete, text
+from sqlmodel import Session, select, delete, func, text
 
 # Import models
 from app.models import (
     Speaker, Room, Seminar, SemesterPlan, SeminarSlot, 
     SpeakerSuggestion, SpeakerAvailability, SpeakerToken,
     SeminarDetails, SpeakerWorkflow, ActivityEvent, 
-    UploadedFile, AvailabilitySlot, SQLModel
+    UploadedFile, AvailabilitySlot, OutboxEvent, UploadSession, SQLModel
 )
 
 # Import core utilities (no circular dependency)
-from app.core import get_engine, settings, record_activity, get_current_user
+from app.core import get_db, get_engine, settings, record_activity, get_current_user
+from app.counters import rebuild_counters
+from app.search import rebuild_search_index
+from app.speaker_tokens import clear_token_cache
+from app.versioning import reset_epoch
+from app import blobs, maintenance, outbox, reconcile
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/admin/db", tags=["Database Admin"])
@@ -210,14 +216,13 @@ def _count_records(db: Session) -> Dict[str, int]:
         Speaker, Room, Seminar, SemesterPlan, SeminarSlot,
         SpeakerSuggestion, SpeakerAvailability, SpeakerToken,
         SeminarDetails, SpeakerWorkflow, ActivityEvent, 
-        UploadedFile, AvailabilitySlot
+        UploadedFile, AvailabilitySlot, OutboxEvent, UploadSession
     ]
     
     counts = {}
     for table in tables:
         try:
-            count = db.exec(select(table)).all()
-            counts[table.__tablename__] = len(count)
+            counts[table.__tablename__] = db.exec(select(func.count()).select_from(table)).one()
         except Exception as e:
             counts[table.__tablename__] = -1  # Error counting
     
@@ -619,6 +624,9 @@ def _migrate_backup_schema(db_path: Path, backup_schema: Dict[str, list]) -> boo
             'semester_plans': {
                 'created_at': 'DATETIME DEFAULT CURRENT_TIMESTAMP'
             },
+            'uploaded_files': {
+                'sha256': 'TEXT'
+            },
             'seminar_details': {
                 'ticket_purchase_info': 'TEXT',
                 'contact_number': 'TEXT',
@@ -715,6 +723,26 @@ async def confirm_restore(
             migration_success = _migrate_backup_schema(db_path, backup_schema)
             if not migration_success:
                 logger.warning("Schema migration completed with warnings")
+
+        # 5b. Cached token lookups describe the old database; backups may
+        # also predate the search index (or carry a stale one)
+        clear_token_cache()
+        reset_epoch()
+        try:
+            # Tables added since the backup was taken (e.g. outbox_events); idempotent
+            SQLModel.metadata.create_all(get_engine())
+        except Exception as e:
+            logger.warning(f"Could not create missing tables after restore: {e}")
+        try:
+            with Session(get_engine()) as db:
+                rebuild_search_index(db)
+        except Exception as e:
+            logger.warning(f"Could not rebuild search index after restore: {e}")
+        try:
+            with Session(get_engine()) as db:
+                rebuild_counters(db)
+        except Exception as e:
+            logger.warning(f"Could not rebuild dashboard counters after restore: {e}")
         
         # 6. Mark token as used
         _mark_token_used(request.confirmation_token)
@@ -828,6 +856,8 @@ async def confirm_reset(
             # Recreate with empty schema
             engine = get_engine()
             SQLModel.metadata.create_all(engine)
+            clear_token_cache()
+            reset_epoch()
         
         # 3. Optionally add synthetic data
         synthetic_stats = None
@@ -932,3 +962,151 @@ async def migrate_ticket_purchase_info(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Migration failed: {str(e)}"
         )
+
+
+@router.post("/search/rebuild")
+async def rebuild_search(
+    user: dict = Depends(get_current_user)
+):
+    """
+    Rebuild the full-text search indexes from the base tables.
+    Safe to run at any time; the triggers keep the index current afterwards.
+    """
+    _require_owner(user)
+    
+    try:
+        with Session(get_engine()) as db:
+            result = rebuild_search_index(db)
+            record_activity(
+                db,
+                event_type="search_index_rebuilt",
+                summary="Full-text search index rebuilt",
+                actor=user.get('id', 'unknown'),
+                details=result
+            )
+            db.commit()
+    except Exception as e:
+        logger.error(f"Search index rebuild failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Search index rebuild failed: {str(e)}"
+        )
+    
+    return {"success": True, **result}
+
+
+@router.post("/maintenance/sweep")
+async def run_maintenance_sweep(
+    user: dict = Depends(get_current_user)
+):
+    """
+    Run the maintenance sweeper now: delete long-expired speaker tokens and
+    availability/workflow rows whose suggestion no longer exists.
+    """
+    _require_owner(user)
+    
+    try:
+        report = await run_in_threadpool(maintenance.run_sweep, actor=user.get('id', 'unknown'))
+    except Exception as e:
+        logger.error(f"Maintenance sweep failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Maintenance sweep failed: {str(e)}"
+        )
+    
+    return {"success": True, **report}
+
+
+@router.get("/maintenance/sweep")
+async def last_maintenance_sweep(
+    user: dict = Depends(get_current_user)
+):
+    """Report from the most recent sweep (scheduled or manual) since startup."""
+    _require_owner(user)
+    return {
+        "interval_seconds": settings.maintenance_sweep_interval_seconds,
+        "last_sweep": maintenance.last_sweep_report,
+    }
+
+
+@router.get("/outbox")
+async def get_outbox_status(
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """Webhook outbox: events per delivery status, recent failures and the last dispatch."""
+    _require_owner(user)
+    return outbox.outbox_status(db)
+
+
+@router.post("/outbox/dispatch")
+async def dispatch_outbox(
+    user: dict = Depends(get_current_user)
+):
+    """Deliver the next batch of due outbox events now."""
+    _require_owner(user)
+    return await run_in_threadpool(outbox.dispatch_once)
+
+
+@router.post("/outbox/retry")
+async def retry_failed_outbox_events(
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """Queue events that exhausted their delivery attempts again."""
+    _require_owner(user)
+    return {"success": True, "requeued": outbox.retry_failed(db)}
+
+
+@router.post("/uploads/dedupe")
+async def dedupe_uploads(
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """Move uploads stored before content addressing into the shared blob store."""
+    _require_owner(user)
+    report = await run_in_threadpool(blobs.dedupe_existing, db)
+    if report["migrated"]:
+        record_activity(
+            db,
+            event_type="uploads_deduplicated",
+            summary=f"Moved {report['migrated']} uploaded files to the blob store",
+            actor=user.get('id', 'unknown'),
+            details=report,
+        )
+        db.commit()
+    return {"success": True, **report}
+
+
+@router.post("/uploads/reconcile")
+async def reconcile_uploads(
+    purge: bool = Query(False, description="Delete orphaned files instead of only reporting them"),
+    min_age_seconds: int = Query(3600, ge=0, description="Ignore files modified more recently than this"),
+    user: dict = Depends(get_current_user)
+):
+    """
+    Compare the uploads directory with the uploaded_files table: orphaned files,
+    rows whose file is missing, and the bytes that purging would reclaim.
+    """
+    _require_owner(user)
+    report = await run_in_threadpool(reconcile.reconcile, purge=purge, min_age_seconds=min_age_seconds)
+    if purge and report["purged_files"]:
+        with Session(get_engine()) as db:
+            record_activity(
+                db,
+                event_type="uploads_reconciled",
+                summary=f"Purged {report['purged_files']} orphaned upload files ({report['purged_bytes']} bytes)",
+                actor=user.get('id', 'unknown'),
+                details={key: report[key] for key in ("orphans", "purged_files", "purged_bytes", "missing_files")},
+            )
+            db.commit()
+    return {"success": True, **report}
+
+
+@router.get("/uploads/reconcile")
+async def last_uploads_reconcile(
+    user: dict = Depends(get_current_user)
+):
+    """Report from the most recent reconcile run since startup."""
+    _require_owner(user)
+    return {"last_reconcile": reconcile.last_reconcile_report}
@@ -0,0 +1,146 @@
+"""
+Streamed ZIP archives of uploaded files.
+
+Organizers download every file for a seminar (or for all seminars of a
+semester plan) before the event. iter_zip() builds the archive on the fly.
+zipfile writes into a small in-memory sink, and the sink is drained after
+every chunk. Output goes straight to the response, with no temp file. Memory
+stays at about one chunk whatever the archive size. Because the sink cannot
+seek, zipfile writes sizes and CRCs in data descriptors after each member.
+
+Formats that are already compressed (images, PDFs, office documents, media,
+archives) are stored; everything else is deflated. Files missing from disk are
+listed in ``MISSING.txt`` inside the archive, so they are not silently absent.
+
+The generator runs in the threadpool under StreamingResponse. When the client
+disconnects, the response stops pulling from it and closing the generator
+closes the open file.
+"""
+
+import logging
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.core import settings
+from app.models import Seminar, UploadedFile
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+# Content that deflate cannot shrink meaningfully
+STORED_EXTENSIONS = {
+    "jpg", "jpeg", "png", "gif", "webp", "heic", "avif", "pdf",
+    "docx", "xlsx", "pptx", "odt", "ods", "odp", "key", "pages", "epub",
+    "zip", "gz", "tgz", "bz2", "xz", "7z", "rar",
+    "mp3", "m4a", "aac", "ogg", "mp4", "m4v", "mov", "mkv", "webm", "avi",
+}
+STORED_CONTENT_PREFIXES = ("image/", "audio/", "video/", "application/zip", "application/pdf", "application/x-7z")
+
+_UNSAFE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+
+@dataclass
+class ArchiveEntry:
+    arcname: str
+    path: Path
+    compress_type: int
+    date_time: tuple
+
+
+class _Sink:
+    """Write-only, unseekable buffer that zipfile writes into."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def _safe(name: str, fallback: str) -> str:
+    cleaned = _UNSAFE.sub("_", name or "").strip(" .")
+    return cleaned[:120] or fallback
+
+
+def compress_type_for(record: UploadedFile) -> int:
+    ext = (record.original_extension or "").lower()
+    content_type = (record.content_type or "").lower()
+    if ext in STORED_EXTENSIONS or content_type.startswith(STORED_CONTENT_PREFIXES):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def seminar_folder(seminar: Seminar) -> str:
+    return _safe(f"{seminar.date.isoformat()} {seminar.title}", f"seminar-{seminar.id}")
+
+
+def archive_entries(files: Iterable[UploadedFile], folders: Dict[int, str]) -> List[ArchiveEntry]:
+    """One entry per file, at ``<folder>/<category>/<name>``; duplicate names get a suffix."""
+    uploads_dir = Path(settings.uploads_dir)
+    entries: List[ArchiveEntry] = []
+    used = set()
+    for record in files:
+        folder = folders.get(record.seminar_id, f"seminar-{record.seminar_id}")
+        category = _safe(record.file_category or "other", "other")
+        name = _safe(record.original_filename, f"file-{record.id}")
+        arcname = f"{folder}/{category}/{name}"
+        if arcname in used:
+            stem, dot, ext = name.rpartition(".")
+            name = f"{stem} ({record.id}).{ext}" if dot and stem else f"{name} ({record.id})"
+            arcname = f"{folder}/{category}/{name}"
+        used.add(arcname)
+        uploaded_at = record.uploaded_at or datetime(1980, 1, 1)
+        entries.append(ArchiveEntry(
+            arcname=arcname,
+            path=uploads_dir / record.storage_filename,
+            compress_type=compress_type_for(record),
+            date_time=max(uploaded_at, datetime(1980, 1, 1)).timetuple()[:6],
+        ))
+    return entries
+
+
+def iter_zip(entries: List[ArchiveEntry], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a ZIP archive of ``entries`` in pieces of about ``chunk_size`` bytes."""
+    sink = _Sink()
+    missing: List[str] = []
+    with zipfile.ZipFile(sink, "w", allowZip64=True) as zf:
+        for entry in entries:
+            try:
+                src = open(entry.path, "rb")
+            except FileNotFoundError:
+                missing.append(entry.arcname)
+                continue
+            with src:
+                info = zipfile.ZipInfo(entry.arcname, date_time=entry.date_time)
+                info.compress_type = entry.compress_type
+                # lets zipfile decide on ZIP64 up front; fstat, as the blob may be unlinked by now
+                info.file_size = os.fstat(src.fileno()).st_size
+                with zf.open(info, "w") as dst:
+                    for chunk in iter(lambda: src.read(chunk_size), b""):
+                        dst.write(chunk)
+                        if len(sink.buffer) >= chunk_size:
+                            yield sink.drain()
+            yield sink.drain()
+        if missing:
+            logger.warning(f"{len(missing)} files missing from disk while building an archive")
+            zf.writestr("MISSING.txt", "Files not found on the server:\n" + "\n".join(missing) + "\n")
+    yield sink.drain()
+
+
+def archive_filename(label: str, when: Optional[datetime] = None) -> str:
+    return f"{_safe(label, 'files')}-{(when or datetime.utcnow()).strftime('%Y%m%d')}.zip"
@@ -3,33 +3,15 @@ External speaker availability page - redesigned from scratch.
 - Always updatable (loads existing data, auto-saves on change)
 - Same input method as internal: calendar with click, shift-click for ranges, quick actions
 - Data format consistent with internal: { date, preference } per date
+- Static shell: identical for every token; the token is read from the URL and
+  speaker/plan data comes from GET /api/v1/seminars/speaker-tokens/{token}/availability
 """
 
-import json
+from app.templates import get_external_header_with_logos, get_invalid_token_message_html
 
-from app.templates import get_external_header_with_logos
 
-
-def get_availability_page_html(
-    speaker_name,
-    speaker_email,
-    speaker_affiliation,
-    suggested_topic,
-    semester_plan,
-    token,
-    semester_start=None,
-    semester_end=None,
-    allowed_slot_dates=None,
-):
+def get_availability_page_shell():
     """Generate the external availability page with calendar UX matching internal form."""
-    if not semester_start:
-        semester_start = "2025-01-01"
-    if not semester_end:
-        semester_end = "2025-06-30"
-
-    allowed_slot_dates = sorted(set(allowed_slot_dates or []))
-    allowed_slot_dates_json = json.dumps(allowed_slot_dates)
-
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -261,11 +243,11 @@ def get_availability_page_html(
 
             <div class="card-body">
                 <div class="info-banner">
-                    <div class="info-row"><span class="info-label">Name:</span><span class="info-value">{speaker_name}</span></div>
-                    <div class="info-row"><span class="info-label">Email:</span><span class="info-value">{speaker_email or 'N/A'}</span></div>
-                    <div class="info-row"><span class="info-label">Affiliation:</span><span class="info-value">{speaker_affiliation or 'N/A'}</span></div>
-                    <div class="info-row"><span class="info-label">Topic:</span><span class="info-value">{suggested_topic or 'TBD'}</span></div>
-                    <div class="info-row"><span class="info-label">Semester:</span><span class="info-value">{semester_plan or 'TBD'}</span></div>
+                    <div class="info-row"><span class="info-label">Name:</span><span class="info-value" data-field="speaker_name" data-fallback="">…</span></div>
+                    <div class="info-row"><span class="info-label">Email:</span><span class="info-value" data-field="speaker_email" data-fallback="N/A">…</span></div>
+                    <div class="info-row"><span class="info-label">Affiliation:</span><span class="info-value" data-field="speaker_affiliation" data-fallback="N/A">…</span></div>
+                    <div class="info-row"><span class="info-label">Topic:</span><span class="info-value" data-field="suggested_topic" data-fallback="TBD">…</span></div>
+                    <div class="info-row"><span class="info-label">Semester:</span><span class="info-value" data-field="semester_plan" data-fallback="TBD">…</span></div>
                 </div>
 
                 <div class="section">
@@ -303,16 +285,17 @@ def get_availability_page_html(
     </div>
 
     <script>
-        const TOKEN = '{token}';
+        const TOKEN = decodeURIComponent(window.location.pathname.split('/').filter(Boolean).pop() || '');
         const API_BASE = '/api/v1/seminars/speaker-tokens';
-        const SEMESTER_START = new Date('{semester_start}');
-        const SEMESTER_END = new Date('{semester_end}');
-        const ALLOWED_DATES = new Set({allowed_slot_dates_json});
+        let SEMESTER_START = null;
+        let SEMESTER_END = null;
+        let ALLOWED_DATES = new Set();
 
         const monthNames = ['January','February','March','April','May','June','July','August','September','October','November','December'];
         const weekDays = ['Sun','Mon','Tue','Wed','Thu','Fri','Sat'];
 
-        let currentMonth = new Date(SEMESTER_START);
+        let currentMonth = new Date();
+        currentMonth.setDate(1);
         let selectedDates = new Set();
         let lastSelectedDate = null;
         let isShiftPressed = false;
@@ -331,6 +314,7 @@ def get_availability_page_html(
         }}
 
         function isInSemester(d) {{
+            if (!SEMESTER_START || !SEMESTER_END) return false;
             const t = d.getTime();
             return t >= SEMESTER_START.getTime() && t <= SEMESTER_END.getTime();
         }}
@@ -350,11 +334,27 @@ def get_availability_page_html(
             return days;
         }}
 
+        function showInvalidLink() {{
+            document.querySelector('.container').innerHTML = `{get_invalid_token_message_html()}`;
+        }}
+
+        function applyPageData(data) {{
+            document.querySelectorAll('[data-field]').forEach(el => {{
+                el.textContent = data[el.dataset.field] || el.dataset.fallback || '';
+            }});
+            ALLOWED_DATES = new Set(data.allowed_slot_dates || []);
+            SEMESTER_START = data.semester_start ? parseDateStr(data.semester_start) : null;
+            SEMESTER_END = data.semester_end ? parseDateStr(data.semester_end) : null;
+            if (SEMESTER_START) currentMonth = new Date(SEMESTER_START.getFullYear(), SEMESTER_START.getMonth(), 1);
+        }}
+
         async function loadData() {{
             try {{
-                const res = await fetch(`${{API_BASE}}/${{TOKEN}}/availability`);
+                const res = await fetch(`${{API_BASE}}/${{encodeURIComponent(TOKEN)}}/availability`);
+                if (res.status === 404) {{ showInvalidLink(); return; }}
                 if (!res.ok) return;
                 const data = await res.json();
+                applyPageData(data);
                 selectedDates.clear();
                 (data.availability || []).forEach(a => {{
                     if (a.date && ALLOWED_DATES.has(a.date)) selectedDates.add(a.date);
@@ -378,7 +378,7 @@ def get_availability_page_html(
             const availabilities = sorted.map(d => ({{ date: d, preference: 'available' }}));
 
             try {{
-                const res = await fetch(`${{API_BASE}}/${{TOKEN}}/submit-availability`, {{
+                const res = await fetch(`${{API_BASE}}/${{encodeURIComponent(TOKEN)}}/submit-availability`, {{
                     method: 'POST',
                     headers: {{ 'Content-Type': 'application/json' }},
                     body: JSON.stringify({{ availabilities }})
@@ -0,0 +1,211 @@
+"""
+Content-addressed upload storage for the Seminars App.
+
+Uploaded bytes are stored once per distinct content, at
+``<uploads_dir>/blobs/<sha[:2]>/<sha[2:4]>/<sha256>``. UploadedFile rows point
+at that path through ``storage_filename``, so a CV uploaded by the speaker and
+again by an organizer takes the space of one file. Readers need no changes.
+Rows from before this layout keep their flat ``<uuid>.bin`` names until
+dedupe_existing() migrates them.
+
+``file_blobs`` holds one row per stored blob with a reference count. SQLite
+triggers on uploaded_files maintain it on insert, delete and re-pointing, so
+every delete path counts, including seminar deletion and raw SQL. After
+UploadedFile rows are deleted, release() removes blobs whose count reached
+zero. The maintenance sweeper also calls collect() for anything a failed
+request left behind.
+
+Placing a blob and committing its row happen under one process-wide lock, as
+does collecting, so a blob that a new upload is about to reference is never
+removed. The app runs as a single process. The lock is held across file
+moves, unlinks and commits, so it is only ever taken in the threadpool
+(run_in_threadpool) or in background threads, never on the event loop.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, event, text
+from sqlmodel import Session, SQLModel, select
+
+from app.core import settings
+from app.derivatives import remove_derivatives
+from app.models import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR = "blobs"
+
+_HASH_CHUNK = 1024 * 1024
+
+blob_lock = threading.RLock()
+
+_IS_BLOB = f"LIKE '{BLOB_DIR}/%'"
+
+_BLOB_DDL = [
+    "CREATE TABLE IF NOT EXISTS file_blobs ("
+    "sha256 TEXT PRIMARY KEY, size INTEGER NOT NULL DEFAULT 0, ref_count INTEGER NOT NULL DEFAULT 0)",
+    "CREATE TRIGGER IF NOT EXISTS uploaded_files_blob_ref_i AFTER INSERT ON uploaded_files "
+    f"WHEN NEW.storage_filename {_IS_BLOB} BEGIN "
+    "INSERT INTO file_blobs (sha256, size, ref_count) VALUES (NEW.sha256, NEW.file_size, 1) "
+    "ON CONFLICT(sha256) DO UPDATE SET ref_count = ref_count + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS uploaded_files_blob_ref_d AFTER DELETE ON uploaded_files "
+    f"WHEN OLD.storage_filename {_IS_BLOB} BEGIN "
+    "UPDATE file_blobs SET ref_count = ref_count - 1 WHERE sha256 = OLD.sha256; END",
+    "CREATE TRIGGER IF NOT EXISTS uploaded_files_blob_ref_u AFTER UPDATE OF storage_filename, sha256 ON uploaded_files BEGIN "
+    f"UPDATE file_blobs SET ref_count = ref_count - 1 WHERE OLD.storage_filename {_IS_BLOB} AND sha256 = OLD.sha256; "
+    "INSERT INTO file_blobs (sha256, size, ref_count) "
+    f"SELECT NEW.sha256, NEW.file_size, 1 WHERE NEW.storage_filename {_IS_BLOB} "
+    "ON CONFLICT(sha256) DO UPDATE SET ref_count = ref_count + 1; END",
+]
+
+
+def ensure_blob_refs(conn) -> bool:
+    """Create file_blobs and its triggers; backfill the counts if the table was just created."""
+    existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+    if "uploaded_files" not in existing:
+        return False
+    created = "file_blobs" not in existing
+    for statement in _BLOB_DDL:
+        conn.execute(text(statement))
+    if created:
+        conn.execute(text(
+            "INSERT INTO file_blobs (sha256, size, ref_count) "
+            f"SELECT sha256, MAX(file_size), COUNT(*) FROM uploaded_files WHERE storage_filename {_IS_BLOB} GROUP BY sha256"
+        ))
+    return created
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_blob_refs(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        ensure_blob_refs(connection)
+
+
+def uploads_root() -> Path:
+    return Path(settings.uploads_dir)
+
+
+def blob_relpath(sha256: str) -> str:
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def is_blob(storage_filename: str) -> bool:
+    return storage_filename.startswith(f"{BLOB_DIR}/")
+
+
+def place(source: Path, sha256: str) -> Tuple[str, bool]:
+    """Move a finished file into the store; returns its storage_filename and whether it is new.
+
+    When the blob already exists the new copy is dropped instead. Call with
+    blob_lock held, up to the commit of the row that references the blob.
+    """
+    relpath = blob_relpath(sha256)
+    target = uploads_root() / relpath
+    if target.exists():
+        source.unlink(missing_ok=True)
+        return relpath, False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, target)
+    return relpath, True
+
+
+def unplace(sha256: str) -> None:
+    """Undo place() of a new blob whose row was not committed (blob_lock still held)."""
+    (uploads_root() / blob_relpath(sha256)).unlink(missing_ok=True)
+
+
+def collect(db: Session, sha256s: Optional[Sequence[str]] = None) -> int:
+    """Remove blobs that no UploadedFile references (only ``sha256s`` when given)."""
+    query = "SELECT sha256 FROM file_blobs WHERE ref_count <= 0"
+    params: Dict[str, object] = {}
+    statement = text(query)
+    if sha256s is not None:
+        if not sha256s:
+            return 0
+        statement = text(query + " AND sha256 IN :shas").bindparams(bindparam("shas", expanding=True))
+        params = {"shas": list(sha256s)}
+    with blob_lock:
+        doomed = [row[0] for row in db.connection().execute(statement, params)]
+        for sha256 in doomed:
+            (uploads_root() / blob_relpath(sha256)).unlink(missing_ok=True)
+            remove_derivatives(sha256)
+        if doomed:
+            db.connection().execute(
+                text("DELETE FROM file_blobs WHERE ref_count <= 0 AND sha256 IN :shas").bindparams(
+                    bindparam("shas", expanding=True)
+                ),
+                {"shas": doomed},
+            )
+        db.commit()
+    if doomed:
+        logger.info(f"Removed {len(doomed)} unreferenced upload blobs")
+    return len(doomed)
+
+
+def stored_location(record: UploadedFile) -> Tuple[str, Optional[str]]:
+    """What release() needs to know about a row that is about to be deleted."""
+    return record.storage_filename, record.sha256
+
+
+def release(db: Session, locations: Iterable[Tuple[str, Optional[str]]]) -> None:
+    """After deleted UploadedFile rows were committed, remove files nothing references."""
+    shas: List[str] = []
+    for storage_filename, sha256 in locations:
+        if is_blob(storage_filename):
+            shas.append(sha256)
+        else:
+            (uploads_root() / storage_filename).unlink(missing_ok=True)
+    if shas:
+        collect(db, shas)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedupe_existing(db: Session) -> dict:
+    """Move flat ``<uuid>.bin`` uploads into the blob store, sharing identical content.
+
+    Each file is hashed, placed (or dropped as a duplicate) and its row
+    re-pointed in its own commit; the old file is removed after that commit.
+    Safe to re-run: migrated rows are skipped.
+    """
+    rows = db.exec(select(UploadedFile).where(UploadedFile.storage_filename.not_like(f"{BLOB_DIR}/%"))).all()
+    report = {"migrated": 0, "missing": 0, "bytes_before": 0, "bytes_freed": 0}
+    for row in rows:
+        legacy = uploads_root() / row.storage_filename
+        if not legacy.exists():
+            report["missing"] += 1
+            continue
+        size = legacy.stat().st_size
+        sha256 = file_sha256(legacy)
+        staged = legacy.with_name(f".{legacy.name}.dedupe")
+        os.link(legacy, staged)  # place() consumes the source; keep the original until the row commits
+        with blob_lock:
+            row.storage_filename, created = place(staged, sha256)
+            row.sha256 = sha256
+            db.add(row)
+            try:
+                db.commit()
+            except Exception:
+                db.rollback()
+                if created:
+                    unplace(sha256)
+                raise
+        legacy.unlink(missing_ok=True)
+        report["migrated"] += 1
+        report["bytes_before"] += size
+        if not created:
+            report["bytes_freed"] += size
+    if report["migrated"]:
+        logger.info(f"Upload dedupe: {report}")
+    return report
@@ -0,0 +1,217 @@
+"""
+Response compression for the Seminars App.
+
+Negotiates brotli or gzip from the request's Accept-Encoding header and
+compresses text-like responses (HTML pages, JSON lists, ICS feeds) above a
+size threshold. Responses that already carry a Content-Encoding - such as the
+precompressed frontend assets served by app.static_assets - pass through
+untouched, so those never cost per-request CPU. So do responses that offer
+byte ranges (file downloads): a range is a slice of the identity bytes, so a
+compressed full response and a resumed 206 could not be joined.
+"""
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # Optional dependency: fall back to gzip-only when brotli is missing
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/manifest+json",
+    "image/svg+xml",
+)
+
+
+def brotli_available() -> bool:
+    return brotli is not None
+
+
+def _parse_accept_encoding(value: str) -> dict:
+    """Parse an Accept-Encoding header into {coding: q}."""
+    accepted = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        coding, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def select_encoding(accept_encoding: str, available: Optional[tuple] = None) -> Optional[str]:
+    """Pick the best content coding the client accepts ("br", "gzip" or None)."""
+    if not accept_encoding:
+        return None
+    if available is None:
+        available = ("br", "gzip") if brotli is not None else ("gzip",)
+    accepted = _parse_accept_encoding(accept_encoding)
+    best = None
+    best_q = 0.0
+    for coding in available:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = (content_type or "").lower()
+    return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_CONTENT_TYPES)
+
+
+class _Compressor:
+    """Streaming compressor with a uniform interface for gzip and brotli."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+            self._gz = None
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._br is not None:
+            return self._br.process(data)
+        return self._gz.compress(data)
+
+    def flush(self) -> bytes:
+        if self._br is not None:
+            return self._br.flush()
+        return self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing text-like responses with brotli or gzip."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+        self.buffer = b""
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                # Range offsets refer to the identity bytes; a gzip 200 would not match a later 206
+                or headers.get("accept-ranges", "none") != "none"
+                or message["status"] in (204, 206, 304)
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.downstream(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            if not self.passthrough and self.compressor is None and self.start_message is not None:
+                # http.response.pathsend carries the body itself: send it as-is
+                self.passthrough = True
+                await self.downstream(self.start_message)
+                if self.buffer:
+                    await self.downstream({"type": "http.response.body", "body": self.buffer, "more_body": True})
+                    self.buffer = b""
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            self.buffer += body
+            if not more_body and len(self.buffer) < self.middleware.minimum_size:
+                # Small response: not worth the CPU, send as-is.
+                await self.downstream(self.start_message)
+                await self.downstream({"type": "http.response.body", "body": self.buffer})
+                return
+            if more_body and len(self.buffer) < self.middleware.minimum_size:
+                return
+            await self._start_compressing(streaming=more_body)
+            body, self.buffer = self.buffer, b""
+
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+            if chunk:
+                await self.downstream({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+            if self.start_message is not None:
+                # Whole body arrived in one message: we can send an exact length.
+                headers = MutableHeaders(raw=self.start_message["headers"])
+                headers["Content-Length"] = str(len(chunk))
+                await self.downstream(self.start_message)
+                self.start_message = None
+            await self.downstream({"type": "http.response.body", "body": chunk})
+
+    async def _start_compressing(self, streaming: bool) -> None:
+        self.compressor = _Compressor(
+            self.encoding,
+            gzip_level=self.middleware.gzip_level,
+            brotli_quality=self.middleware.brotli_quality,
+        )
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The representation changed, so a strong validator no longer applies.
+            headers["ETag"] = f"W/{etag}"
+        if streaming:
+            await self.downstream(self.start_message)
+            self.start_message = None
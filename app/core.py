@@ -6,6 +6,7 @@ This module contains shared resources to avoid circular imports.
 
 import logging
 import json
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
@@ -27,10 +28,46 @@ class Settings(BaseSettings):
     editor_password: str = ""  # Set via EDITOR_PASSWORD env var for limited editor access
     database_url: str = "/data/seminars.db"
     uploads_dir: str = "/data/uploads"
+    upload_max_bytes: int = 200 * 1024 * 1024  # uploads without a per-category limit (see app/uploads.py)
+    upload_session_ttl_hours: int = 24  # resumable uploads idle this long are discarded (see app/resumable.py)
+    image_derivative_workers: int = 2  # processes rendering photo thumbnails (see app/derivatives.py); 0 disables
     auth_service_url: str = "https://inacio-auth.fly.dev"
     app_url: str = "https://seminars-app.fly.dev"
     feature_semester_plan_v2: bool = False
     fallback_mirror_dir: str = "fallback-mirror"
+
+    # Response compression (gzip/brotli) for HTML pages and JSON lists
+    compression_minimum_size: int = 1024
+    precompress_static_assets: bool = True  # Write .br/.gz siblings for frontend/dist at startup
+
+    # Speaker token resolution cache (see app/speaker_tokens.py)
+    speaker_token_cache_size: int = 2048
+    speaker_token_cache_ttl_seconds: int = 300
+
+    # /api/external/upcoming response cache; writes to seminars/speakers/rooms also invalidate it
+    external_upcoming_cache_ttl_seconds: int = 30
+
+    # Background maintenance sweeper (see app/maintenance.py); 0 disables the schedule
+    maintenance_sweep_interval_seconds: int = 3600
+    maintenance_sweep_batch_size: int = 500
+    expired_token_retention_days: int = 30  # keep expired tokens this long for support lookups
+
+    # Webhook delivery of change events from the outbox (see app/outbox.py)
+    webhook_urls: str = ""  # comma-separated; empty disables the outbox
+    webhook_secret: str = ""  # signs each batch with HMAC-SHA256 when set
+    webhook_timeout_seconds: float = 5.0
+    outbox_poll_interval_seconds: float = 2.0
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 10
+    outbox_retry_base_seconds: float = 5.0
+    outbox_retry_max_seconds: float = 900.0
+    outbox_retention_days: int = 7  # delivered events are swept after this long
+
+    # Activity events (see app/activity.py): "sync" writes them in the caller's
+    # transaction, "buffered" batches them into one INSERT per interval
+    activity_write_mode: str = "sync"
+    activity_flush_interval_ms: int = 250
+    activity_buffer_max_events: int = 1000  # a fuller buffer is written at once
     
     # Email settings (SMTP)
     smtp_host: str = ""  # e.g., smtp.gmail.com
@@ -94,6 +131,25 @@ def get_db():
         yield session
 
 
+@contextmanager
+def read_transaction(db: Session):
+    """Run a group of reads against one consistent SQLite snapshot.
+
+    pysqlite only opens a transaction before writes, so consecutive SELECTs
+    can otherwise see different commits. ORM objects are expired on exit;
+    serialize them inside the block.
+    """
+    conn = db.connection()
+    started = not conn.connection.dbapi_connection.in_transaction
+    if started:
+        conn.exec_driver_sql("BEGIN")
+    try:
+        yield db
+    finally:
+        if started:
+            db.rollback()
+
+
 def record_activity(
     db: Session,
     event_type: str,
@@ -104,10 +160,11 @@ def record_activity(
     actor: Optional[str] = None,
     details: Optional[dict] = None,
 ):
-    """Record an activity event."""
-    from app.models import ActivityEvent  # Import here to avoid circular imports
-    
-    evt = ActivityEvent(
+    """Record an activity event (in ``db``'s transaction, or buffered; see app/activity.py)."""
+    from app import activity  # Import here to avoid circular imports
+    from app.models import ActivityEvent
+
+    row = dict(
         semester_plan_id=semester_plan_id,
         event_type=event_type,
         summary=summary,
@@ -115,8 +172,12 @@ def record_activity(
         entity_id=entity_id,
         actor=actor,
         details_json=json.dumps(details or {}, ensure_ascii=True),
+        created_at=datetime.utcnow(),
     )
-    db.add(evt)
+    if activity.buffering():
+        activity.defer(db, row)
+        return
+    db.add(ActivityEvent(**row))
 
 
 # ============================================================================
@@ -0,0 +1,175 @@
+"""
+Materialized dashboard counters for the Seminars App.
+
+The stats endpoints are polled by dashboards, so they must not count rows on
+every request. SQLite triggers keep three small tables up to date on every
+INSERT, UPDATE or DELETE (ORM, bulk updates, raw SQL and restores alike):
+
+- ``seminar_day_counts``: per seminar date, the number of seminars and of
+  seminars with each checklist flag still open. "Upcoming" and "pending"
+  depend on today's date, so they are the sum of the rows from today on;
+  that is one row per future seminar day, not per seminar.
+- ``plan_slot_counts``: per semester plan, slots and assigned slots (fill rate).
+- ``table_row_counts``: row totals for the tables the dashboards report.
+
+The tables and triggers are created whenever SQLModel.metadata.create_all runs
+and backfilled when first created. rebuild_counters() recomputes them from
+the base tables, e.g. after restoring a backup.
+"""
+
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlmodel import Session, SQLModel
+
+logger = logging.getLogger(__name__)
+
+CHECKLIST_FLAGS = ("room_booked", "announcement_sent", "calendar_invite_sent", "website_updated", "catering_ordered")
+
+# Flags that make an upcoming seminar count as "pending tasks" in /api/external/stats
+PENDING_TASK_FLAGS = ("room_booked", "announcement_sent", "calendar_invite_sent")
+
+COUNTED_TABLES = ("speakers", "seminars", "speaker_suggestions", "semester_plans")
+
+_DAY_COLUMNS = ["seminars"] + [f"{flag}_pending" for flag in CHECKLIST_FLAGS] + ["tasks_pending"]
+
+
+def _day_values(row: str, sign: str) -> List[str]:
+    """Column deltas contributed by the seminar ``row`` (NEW or OLD)."""
+    values = [f"{sign}1"] + [f"{sign}({row}.{flag} = 0)" for flag in CHECKLIST_FLAGS]
+    values.append(f"{sign}(" + " OR ".join(f"{row}.{flag} = 0" for flag in PENDING_TASK_FLAGS) + ")")
+    return values
+
+
+def _day_upsert(row: str, sign: str) -> str:
+    columns = ", ".join(_DAY_COLUMNS)
+    values = ", ".join(_day_values(row, sign))
+    updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in _DAY_COLUMNS)
+    return (
+        f"INSERT INTO seminar_day_counts (day, {columns}) VALUES ({row}.date, {values}) "
+        f"ON CONFLICT(day) DO UPDATE SET {updates}"
+    )
+
+
+def _slot_upsert(row: str, sign: str) -> str:
+    return (
+        "INSERT INTO plan_slot_counts (semester_plan_id, slots, assigned) "
+        f"VALUES ({row}.semester_plan_id, {sign}1, {sign}({row}.assigned_seminar_id IS NOT NULL)) "
+        "ON CONFLICT(semester_plan_id) DO UPDATE SET "
+        "slots = slots + excluded.slots, assigned = assigned + excluded.assigned"
+    )
+
+
+def _row_count_ddl(table: str) -> List[str]:
+    bump = "UPDATE table_row_counts SET row_count = row_count {} 1 WHERE name = '" + table + "'"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_row_count_i AFTER INSERT ON {table} BEGIN {bump.format('+')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_row_count_d AFTER DELETE ON {table} BEGIN {bump.format('-')}; END",
+    ]
+
+
+def _counter_ddl() -> List[str]:
+    day_columns = ", ".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in _DAY_COLUMNS)
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS seminar_day_counts (day TEXT PRIMARY KEY, {day_columns})",
+        "CREATE TABLE IF NOT EXISTS plan_slot_counts ("
+        "semester_plan_id INTEGER PRIMARY KEY, slots INTEGER NOT NULL DEFAULT 0, assigned INTEGER NOT NULL DEFAULT 0)",
+        "CREATE TABLE IF NOT EXISTS table_row_counts (name TEXT PRIMARY KEY, row_count INTEGER NOT NULL DEFAULT 0)",
+        f"CREATE TRIGGER IF NOT EXISTS seminars_day_count_i AFTER INSERT ON seminars BEGIN {_day_upsert('NEW', '')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS seminars_day_count_d AFTER DELETE ON seminars BEGIN {_day_upsert('OLD', '-')}; END",
+        "CREATE TRIGGER IF NOT EXISTS seminars_day_count_u AFTER UPDATE OF date, "
+        + ", ".join(CHECKLIST_FLAGS)
+        + f" ON seminars BEGIN {_day_upsert('OLD', '-')}; {_day_upsert('NEW', '')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS seminar_slots_count_i AFTER INSERT ON seminar_slots BEGIN {_slot_upsert('NEW', '')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS seminar_slots_count_d AFTER DELETE ON seminar_slots BEGIN {_slot_upsert('OLD', '-')}; END",
+        "CREATE TRIGGER IF NOT EXISTS seminar_slots_count_u AFTER UPDATE OF semester_plan_id, assigned_seminar_id "
+        f"ON seminar_slots BEGIN {_slot_upsert('OLD', '-')}; {_slot_upsert('NEW', '')}; END",
+    ]
+    for table in COUNTED_TABLES:
+        statements.extend(_row_count_ddl(table))
+    return statements
+
+
+def _backfill(conn) -> None:
+    day_sums = ", ".join(
+        ["COUNT(*)"]
+        + [f"SUM({flag} = 0)" for flag in CHECKLIST_FLAGS]
+        + ["SUM(" + " OR ".join(f"{flag} = 0" for flag in PENDING_TASK_FLAGS) + ")"]
+    )
+    conn.execute(text("DELETE FROM seminar_day_counts"))
+    conn.execute(text(
+        f"INSERT INTO seminar_day_counts (day, {', '.join(_DAY_COLUMNS)}) "
+        f"SELECT date, {day_sums} FROM seminars GROUP BY date"
+    ))
+    conn.execute(text("DELETE FROM plan_slot_counts"))
+    conn.execute(text(
+        "INSERT INTO plan_slot_counts (semester_plan_id, slots, assigned) "
+        "SELECT semester_plan_id, COUNT(*), COUNT(assigned_seminar_id) FROM seminar_slots GROUP BY semester_plan_id"
+    ))
+    conn.execute(text("DELETE FROM table_row_counts"))
+    for table in COUNTED_TABLES:
+        conn.execute(text(f"INSERT INTO table_row_counts (name, row_count) SELECT '{table}', COUNT(*) FROM {table}"))
+
+
+def ensure_counters(conn) -> bool:
+    """Create the counter tables and triggers; backfill if they were just created."""
+    existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+    if not {"seminars", "seminar_slots", *COUNTED_TABLES} <= existing:
+        return False
+    created = "table_row_counts" not in existing
+    for statement in _counter_ddl():
+        conn.execute(text(statement))
+    if created:
+        _backfill(conn)
+    return created
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_counters(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        ensure_counters(connection)
+
+
+def rebuild_counters(db: Session) -> None:
+    """Recompute every counter from the base tables."""
+    conn = db.connection()
+    ensure_counters(conn)
+    _backfill(conn)
+    db.commit()
+
+
+def dashboard_counts(db: Session, today: Optional[date] = None) -> Dict[str, object]:
+    """Upcoming seminars, open checklist items per flag and table totals."""
+    today = today or date.today()
+    sums = ", ".join(f"COALESCE(SUM({c}), 0)" for c in _DAY_COLUMNS)
+    row = db.connection().execute(
+        text(f"SELECT {sums} FROM seminar_day_counts WHERE day >= :today"), {"today": today.isoformat()}
+    ).one()
+    totals = dict(db.connection().execute(text("SELECT name, row_count FROM table_row_counts")).all())
+    upcoming, *flag_counts, tasks_pending = row
+    return {
+        "upcoming_seminars": upcoming,
+        "pending_tasks": tasks_pending,
+        "pending_by_task": dict(zip(CHECKLIST_FLAGS, flag_counts)),
+        "totals": {table: totals.get(table, 0) for table in COUNTED_TABLES},
+    }
+
+
+def plan_fill_rates(db: Session) -> List[Dict[str, object]]:
+    """Slots and assigned slots per semester plan."""
+    rows = db.connection().execute(text(
+        "SELECT p.id, p.name, COALESCE(c.slots, 0), COALESCE(c.assigned, 0) "
+        "FROM semester_plans p LEFT JOIN plan_slot_counts c ON c.semester_plan_id = p.id ORDER BY p.id"
+    )).all()
+    return [
+        {
+            "plan_id": plan_id,
+            "name": name,
+            "slots": slots,
+            "assigned": assigned,
+            "fill_rate": round(assigned / slots, 4) if slots else 0.0,
+        }
+        for plan_id, name, slots, assigned in rows
+    ]
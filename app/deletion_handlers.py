@@ -87,7 +87,8 @@ def delete_seminar_robust(seminar_id: int, db: Session) -> dict:
     - Delete seminar details
     - Keep speaker (they might have other seminars)
     """
-    from app.main import Seminar, SeminarSlot, UploadedFile, SeminarDetails, Path, settings
+    from app.main import Seminar, SeminarSlot, UploadedFile, SeminarDetails
+    from app import blobs
     
     seminar = db.get(Seminar, seminar_id)
     if not seminar:
@@ -102,15 +103,12 @@ def delete_seminar_robust(seminar_id: int, db: Session) -> dict:
         slot.status = 'available'
         logger.info(f"Cleared seminar reference from slot {slot.id}")
     
-    # Delete uploaded files from disk
+    # Delete uploaded files; their stored content is released after the commit
     files_stmt = select(UploadedFile).where(UploadedFile.seminar_id == seminar_id)
     files = db.exec(files_stmt).all()
-    deleted_files = 0
+    locations = [blobs.stored_location(file) for file in files]
+    deleted_files = len(files)
     for file in files:
-        file_path = Path(settings.uploads_dir) / file.storage_filename
-        if file_path.exists():
-            file_path.unlink()
-            deleted_files += 1
         db.delete(file)
     
     # Delete seminar details
@@ -122,6 +120,7 @@ def delete_seminar_robust(seminar_id: int, db: Session) -> dict:
     title = seminar.title
     db.delete(seminar)
     db.commit()
+    blobs.release(db, locations)
     
     return {
         "success": True,
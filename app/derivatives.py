@@ -0,0 +1,165 @@
+"""
+Resized image derivatives (thumbnails, web size) for uploaded photos.
+
+Speaker photos arrive straight from phones and cameras, often several
+megabytes each, and used to be served at full resolution everywhere. Each
+image upload now gets smaller JPEG variants:
+
+- ``thumb``: longest edge 320 px, for lists and the fallback mirror.
+- ``web``: longest edge 1280 px, for viewing in the browser.
+
+Derivatives are keyed by the content hash and the variant, and cached at
+``uploads_dir/derivatives/<sha[:2]>/<sha256>-<variant>.jpg``. Identical photos
+(see app.blobs) therefore share them, and a derivative never needs
+invalidating. They are rendered in a process pool, so decoding and resampling
+large images neither holds the GIL nor blocks the event loop:
+
+- schedule() queues every variant right after an upload (fire and forget).
+- derivative_for() returns the cached file, or renders it on demand and
+  waits, e.g. when the background job has not finished yet or for files
+  uploaded before derivatives existed. Concurrent requests for the same
+  derivative share one render.
+
+Pillow is optional. Without it, or for content it cannot decode, downloads
+fall back to the original file.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.core import settings
+from app.models import UploadedFile
+
+try:  # Optional dependency: without Pillow the originals are served
+    import PIL
+except ImportError:  # pragma: no cover - exercised only without Pillow installed
+    PIL = None
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_DIR = "derivatives"
+
+# variant -> (longest edge in pixels, JPEG quality)
+VARIANTS: Dict[str, Tuple[int, int]] = {
+    "thumb": (320, 75),
+    "web": (1280, 82),
+}
+
+# Formats Pillow decodes that are worth resizing (not SVG, not animated GIF)
+IMAGE_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp", "image/tiff", "image/bmp"}
+
+MAX_SOURCE_PIXELS = 80_000_000  # refuse decompression bombs
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_inflight_lock = threading.Lock()
+_inflight: Dict[Tuple[str, str], Future] = {}
+
+
+def available() -> bool:
+    return PIL is not None and settings.image_derivative_workers > 0
+
+
+def is_derivable(record: UploadedFile) -> bool:
+    return bool(record.sha256) and (record.content_type or "").lower() in IMAGE_CONTENT_TYPES
+
+
+def derivative_path(sha256: str, variant: str) -> Path:
+    return Path(settings.uploads_dir) / DERIVATIVE_DIR / sha256[:2] / f"{sha256}-{variant}.jpg"
+
+
+def remove_derivatives(sha256: str) -> None:
+    """Delete every cached derivative of a blob that is being removed."""
+    for path in (Path(settings.uploads_dir) / DERIVATIVE_DIR / sha256[:2]).glob(f"{sha256}-*"):
+        path.unlink(missing_ok=True)
+
+
+def render(source: str, target: str, max_edge: int, quality: int) -> int:
+    """Write a JPEG of ``source`` scaled to fit ``max_edge``; runs in a worker process."""
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = MAX_SOURCE_PIXELS
+    with Image.open(source) as original:
+        original.draft("RGB", (max_edge, max_edge))  # JPEG: decode at reduced scale
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "L"):
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        partial = f"{target}.{os.getpid()}.tmp"
+        image.save(partial, "JPEG", quality=quality, optimize=True, progressive=True)
+    os.replace(partial, target)
+    return os.path.getsize(target)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs threads (uvicorn, the threadpool) is unsafe
+            _pool = ProcessPoolExecutor(max_workers=settings.image_derivative_workers, mp_context=get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(sha256: str, source: Path, variant: str) -> Future:
+    """Render one derivative, sharing the job with any render of it already running."""
+    key = (sha256, variant)
+    max_edge, quality = VARIANTS[variant]
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future
+        future = _get_pool().submit(render, str(source), str(derivative_path(sha256, variant)), max_edge, quality)
+        _inflight[key] = future
+
+    def _done(done: Future) -> None:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        error = None if done.cancelled() else done.exception()
+        if isinstance(error, BrokenProcessPool):
+            shutdown_pool()  # a worker died; the next render starts a fresh pool
+        if error is not None:
+            logger.warning(f"Could not render {variant} derivative of {sha256[:12]}: {error}")
+
+    future.add_done_callback(_done)
+    return future
+
+
+def schedule(record: UploadedFile, source: Path) -> None:
+    """Queue every missing derivative of a freshly uploaded image."""
+    if not available() or not is_derivable(record):
+        return
+    for variant in VARIANTS:
+        if not derivative_path(record.sha256, variant).exists():
+            _submit(record.sha256, source, variant)
+
+
+async def derivative_for(record: UploadedFile, source: Path, variant: str) -> Optional[Path]:
+    """Path of the ``variant`` derivative, rendered now if needed; None to serve the original."""
+    if not available() or not is_derivable(record) or variant not in VARIANTS:
+        return None
+    target = derivative_path(record.sha256, variant)
+    if target.exists():
+        return target
+    try:
+        await asyncio.wrap_future(_submit(record.sha256, source, variant))
+    except Exception:  # logged by the done callback; fall back to the original
+        return None
+    return target if target.exists() else None
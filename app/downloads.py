@@ -0,0 +1,221 @@
+"""
+File downloads with validators, conditional requests and byte ranges.
+
+Uploads are immutable once stored (content-addressed by SHA-256, see
+app.blobs), so the stored hash is a strong ETag that never needs to touch the
+file. serve_upload() answers:
+
+- ``If-None-Match`` / ``If-Modified-Since`` with 304 when the client copy is
+  current. Responses carry ``Cache-Control: private, no-cache``, so browsers
+  revalidate (with auth) instead of downloading again.
+- ``Range: bytes=...`` with 206 and the requested slice, so an interrupted
+  download of a large recording or slide deck resumes where it stopped.
+  ``If-Range`` guards the resume against a changed file. Unsatisfiable
+  ranges get 416. Multi-range requests are answered with the whole file, as
+  RFC 9110 allows.
+
+A full file is sent zero-copy through the ``http.response.pathsend``
+extension when the ASGI server offers it. Ranges, and servers without it,
+get the file streamed in chunks read off the event loop. (The
+``http.response.zerocopysend`` extension is not used: the function
+middlewares, ``@app.middleware("http")``, cannot relay it.)
+"""
+
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+
+from app.models import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = "private, no-cache"
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def file_etag(record: UploadedFile, stat_result: os.stat_result) -> str:
+    """Strong ETag from the stored hash; a weak one from mtime and size for files without one."""
+    if record.sha256:
+        return f'"{record.sha256}"'
+    return f'W/"{int(stat_result.st_mtime)}-{stat_result.st_size}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _none_match(header: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison."""
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag.strip()) for tag in header.split(",")}
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """The ``[start, end)`` slice for a single byte range; None when the header is to be ignored."""
+    match = _RANGE.match(header.replace(" ", ""))
+    if not match:
+        return None  # other units, multiple ranges or malformed: send the whole file
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = int(last) + 1 if last else size
+        if last and end <= start:
+            return None
+    elif last:
+        start, end = max(size - int(last), 0), size
+        if int(last) == 0:
+            raise RangeNotSatisfiable()
+    else:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, min(end, size)
+
+
+def content_disposition(filename: str, disposition: str = "attachment") -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+
+class UploadFileResponse(Response):
+    """Sends ``[start, end)`` of a file; a full file zero-copy when the server supports pathsend."""
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: Path,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: Dict[str, str],
+        media_type: str,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.end = end
+        self.full = status_code == 200
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers({**headers, "content-length": str(end - start)})
+
+    async def __call__(self, scope, receive, send) -> None:
+        extensions = scope.get("extensions") or {}
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        if self.full and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+
+        try:
+            f = await run_in_threadpool(open, self.path, "rb")
+        except FileNotFoundError:  # removed since the request was validated
+            await Response(status_code=404)(scope, receive, send)
+            return
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await self._stream(f, send)
+        finally:
+            await run_in_threadpool(f.close)
+
+    async def _stream(self, f, send) -> None:
+        remaining = self.end - self.start
+        await run_in_threadpool(f.seek, self.start)
+        while remaining > 0:
+            chunk = await run_in_threadpool(f.read, min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            logger.warning(f"{self.path} ended {remaining} bytes early")
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def serve_upload(request: Request, record: UploadedFile, path: Path, variant: Optional[str] = None) -> Response:
+    """Response for downloading ``record`` stored at ``path`` (304, 206, 416 or 200).
+
+    ``variant`` names the image derivative (see app.derivatives) at ``path``;
+    it is served inline as JPEG with an ETag of its own.
+    """
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except FileNotFoundError:
+        logger.error(f"File not found on disk: {path}")
+        raise HTTPException(status_code=404, detail="File not found on disk")
+
+    size = stat_result.st_size
+    etag = file_etag(record, stat_result)
+    if variant:
+        etag = f'{etag[:-1]}-{variant}"'
+    modified = record.uploaded_at.replace(tzinfo=timezone.utc) if record.uploaded_at else (
+        datetime.fromtimestamp(stat_result.st_mtime, timezone.utc)
+    )
+    last_modified = formatdate(modified.timestamp(), usegmt=True)
+    validators = {"etag": etag, "last-modified": last_modified, "cache-control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _none_match(if_none_match, etag):
+            return Response(status_code=304, headers=validators)
+    elif (since := request.headers.get("if-modified-since")) and _not_modified_since(since, modified):
+        return Response(status_code=304, headers=validators)
+
+    filename = record.original_filename or "file"
+    media_type = record.content_type or "application/octet-stream"
+    disposition = "attachment"
+    if variant:
+        filename = f"{filename.rsplit('.', 1)[0]}-{variant}.jpg"
+        media_type, disposition = "image/jpeg", "inline"
+    headers = {
+        **validators,
+        "accept-ranges": "bytes",
+        "content-disposition": content_disposition(filename, disposition),
+    }
+    start, end, status_code = 0, size, 200
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range needs a strong match; otherwise the client gets the current file in full
+    if range_header and (if_range is None or (not etag.startswith("W/") and if_range in (etag, last_modified))):
+        try:
+            requested = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            return Response(status_code=416, headers={**validators, "content-range": f"bytes */{size}"})
+        if requested is not None:
+            start, end = requested
+            status_code = 206
+            headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+
+    return UploadFileResponse(path, start, end, status_code, headers, media_type)
@@ -0,0 +1,92 @@
+"""
+Fast JSON responses for large list endpoints.
+
+By default FastAPI validates a handler's return value against its
+response_model, converts it with jsonable_encoder and encodes it with the
+stdlib json module. Each is a full pass over every item. For outputs the app
+builds itself that is wasted work:
+
+- FastJSONResponse encodes plain dicts/lists with orjson in one pass (dates and
+  datetimes natively), and returning it skips response_model validation.
+- model_list_response() runs ORM rows through a pydantic TypeAdapter once and
+  lets pydantic-core write the JSON bytes directly.
+- splice_raw_field() embeds JSON that is already stored as text (activity
+  details_json) as raw bytes, instead of json.loads() followed by re-encoding.
+
+orjson is optional; without it the stdlib encoder is used with the same output.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+try:  # Optional dependency: fall back to the stdlib encoder when orjson is missing
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson; trusted content is not re-validated."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RawJSONResponse(Response):
+    """Response for a body that is already encoded JSON bytes."""
+
+    media_type = "application/json"
+
+
+def splice_raw_field(encoded_object: bytes, key: str, raw_value: Optional[str]) -> bytes:
+    """Append ``"key": <raw_value>`` to an encoded JSON object without decoding either.
+
+    ``raw_value`` must be JSON the app wrote itself (e.g. by json.dumps); empty
+    or missing values become null.
+    """
+    raw = raw_value.encode("utf-8") if raw_value else b"null"
+    separator = b"" if encoded_object == b"{}" else b","
+    return encoded_object[:-1] + separator + dumps(key) + b":" + raw + b"}"
+
+
+def json_array(encoded_items: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(encoded_items) + b"]"
+
+
+def json_object(encoded_members: Mapping[str, bytes]) -> bytes:
+    """Assemble a JSON object from already-encoded member values."""
+    return b"{" + b",".join(dumps(key) + b":" + value for key, value in encoded_members.items()) + b"}"
+
+
+def model_list_response(
+    adapter: TypeAdapter,
+    rows: Any,
+    headers: Optional[Mapping[str, str]] = None,
+) -> RawJSONResponse:
+    """Validate ``rows`` (ORM objects or column rows) once and serialize in pydantic-core."""
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return RawJSONResponse(content=body, headers=dict(headers or {}))
@@ -6,7 +6,6 @@ authentication service (inacio-auth.fly.dev).
 """
 
 import os
-import json
 import subprocess
 from html import escape as html_escape
 from urllib.parse import quote
@@ -16,42 +15,97 @@ import logging
 import time
 from datetime import datetime, date as date_type, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Literal
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends, HTTPException, Request, UploadFile, File, Form, Query
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from sqlmodel import Session, select
+from sqlalchemy import case, func, update as sql_update
 from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import OperationalError
 
 # Import all models from models module
 from app.models import (
     SQLModel, Speaker, Room, Seminar, SemesterPlan, SeminarSlot,
     SpeakerSuggestion, SpeakerAvailability, SpeakerToken,
     SeminarDetails, SpeakerWorkflow, ActivityEvent,
-    UploadedFile, AvailabilitySlot
+    UploadedFile, AvailabilitySlot, UploadSession
 )
 
 # Import core utilities
-from app.core import settings, get_engine, get_db, record_activity, verify_token, get_current_user, create_editor_token
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from app.core import settings, get_engine, get_db, record_activity, verify_token, get_current_user, create_editor_token, read_transaction
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 # Import logging configuration
 from app.logging_config import init_logging, log_audit, log_request
 
+# Response compression and precompressed frontend assets
+from app.compression import CompressionMiddleware
+from app.static_assets import (
+    InMemoryFile,
+    PrecompressedBody,
+    PrecompressedStaticFiles,
+    REVALIDATE_CACHE_CONTROL,
+    etag_matches,
+    precompress_directory,
+)
+
+# Full-text search (FTS5 indexes are created on metadata.create_all)
+from app import search as fulltext
+
+# Bounded in-process TTL cache (single-flight on misses)
+from app.caching import TTLCache
+
+# Cached speaker token resolution shared by all token endpoints
+from app.speaker_tokens import TokenContext, invalidate_seminars, require_token, resolve_token
+
+# Streaming multipart uploads (hashing, size limits, fsync)
+from app.uploads import UPLOAD_OPENAPI, StoredUpload, receive_upload
+from app import activity, blobs, derivatives, resumable
+from app.archives import archive_entries, archive_filename, iter_zip, seminar_folder
+from app.downloads import content_disposition, serve_upload
+
+# Periodic cleanup of expired tokens and orphaned speaker rows
+from app.maintenance import start_sweeper, stop_sweeper
+
+# Change events for webhooks, written in the same transaction as the change
+from app import outbox
+
+# Opt-in keyset pagination for list endpoints
+from app.pagination import PAGE_SIZE_MAX, PAGINATION_HEADERS, paginate
+
+# Trigger-maintained dashboard counters (created on metadata.create_all)
+from app.counters import dashboard_counts, plan_fill_rates
+
+# Table-version ETags for conditional GETs
+from app.versioning import VERSIONED_TABLES, VersionETagMiddleware, current_epoch, table_versions, versioned
+
+# orjson/pydantic-core serialization for large list responses
+from app.fast_json import (
+    FastJSONResponse,
+    RawJSONResponse,
+    dumps,
+    json_array,
+    json_object,
+    model_list_response,
+    splice_raw_field,
+)
+
 # Import templates
 from app.templates import (
-    get_invalid_token_html,
     get_external_header_with_logos,
 )
-from app.availability_page import get_availability_page_html
+from app.availability_page import get_availability_page_shell
 
 # Import speaker info page
-from app.speaker_info_v6 import get_speaker_info_page_v6
+from app.speaker_info_v6 import get_speaker_info_page_shell
+from app.speaker_status_page import get_speaker_status_page_shell
 
 # Import robust deletion handlers
 from app.deletion_handlers import (
@@ -102,6 +156,15 @@ class SpeakerResponse(BaseModel):
     cv_path: Optional[str]
     photo_path: Optional[str]
 
+class SpeakerSummaryResponse(BaseModel):
+    """List-view projection of a speaker (?view=summary)."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    name: str
+    affiliation: Optional[str]
+    email: Optional[str]
+
 class RoomCreate(BaseModel):
     name: str
     capacity: Optional[int] = None
@@ -144,6 +207,24 @@ class SeminarUpdate(BaseModel):
     catering_ordered: Optional[bool] = None
     notes: Optional[str] = None
 
+SEMINAR_BATCH_MAX = 500
+
+class SeminarBatchItem(SeminarUpdate):
+    seminar_id: int
+
+class SeminarBatchUpdate(BaseModel):
+    items: List[SeminarBatchItem] = Field(min_length=1, max_length=SEMINAR_BATCH_MAX)
+
+class UploadSessionCreate(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(ge=0)
+    content_type: str = "application/octet-stream"
+    category: Optional[str] = None
+    sha256: Optional[str] = Field(default=None, pattern="^[0-9a-fA-F]{64}$")
+
+class UploadSessionComplete(BaseModel):
+    sha256: Optional[str] = Field(default=None, pattern="^[0-9a-fA-F]{64}$")
+
 class SeminarResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
@@ -175,6 +256,25 @@ class SeminarResponse(BaseModel):
             return v.name
         return str(v) if v else None
 
+class SeminarSummaryResponse(BaseModel):
+    """List-view projection of a seminar (?view=summary): no texts, no nested objects."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    title: str
+    date: date_type
+    start_time: str
+    end_time: Optional[str]
+    status: str
+    speaker_id: int
+    speaker_name: Optional[str]
+    room: Optional[str]
+
+SPEAKER_LIST = TypeAdapter(List[SpeakerResponse])
+SPEAKER_SUMMARY_LIST = TypeAdapter(List[SpeakerSummaryResponse])
+SEMINAR_LIST = TypeAdapter(List[SeminarResponse])
+SEMINAR_SUMMARY_LIST = TypeAdapter(List[SeminarSummaryResponse])
+
 # Semester Planning Pydantic Models
 class SemesterPlanCreate(BaseModel):
     name: str
@@ -280,6 +380,11 @@ class SpeakerTokenResponse(BaseModel):
 class SpeakerTokenVerifyRequest(BaseModel):
     token: str
 
+class SpeakerTokenBulkCreate(BaseModel):
+    semester_plan_id: int
+    token_type: str  # 'availability', 'info' or 'status'
+    suggestion_ids: Optional[List[int]] = None  # default: every suggestion in the plan
+
 class SpeakerAvailabilitySubmit(BaseModel):
     availabilities: List[SpeakerAvailabilityCreate]
 
@@ -450,6 +555,9 @@ def get_or_create_workflow(db: Session, suggestion_id: int) -> SpeakerWorkflow:
     db.flush()
     return workflow
 
+# Status page steps in order; see build_speaker_status
+SPEAKER_STATUS_STEPS = ("waiting_availability", "date_assigned", "info_received", "proposal_approved")
+
 def build_speaker_status(workflow: Optional[SpeakerWorkflow], suggestion: SpeakerSuggestion) -> dict:
     """Build simplified speaker status with 4-step flow driven only by workflow checkboxes."""
     if not workflow:
@@ -584,6 +692,7 @@ def refresh_fallback_mirror(db: Session):
                     pass
     files_dir.mkdir(exist_ok=True)
     file_mirror_names: dict[int, str] = {}
+    file_thumb_names: dict[int, str] = {}
     for f in files:
         src = uploads_base / f.storage_filename
         if src.exists():
@@ -591,10 +700,22 @@ def refresh_fallback_mirror(db: Session):
             mirror_name = f"{f.id}_{safe_filename(f.original_filename or 'file')}{ext}"
             dst = files_dir / mirror_name
             try:
-                shutil.copy2(src, dst)
+                try:  # blobs are immutable, so a hardlink is as good as a copy
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
                 file_mirror_names[f.id] = f"files/{mirror_name}"
             except Exception as e:
                 logger.warning(f"Could not copy file {f.id} to fallback mirror: {e}")
+        # Photos are previewed from their cached thumbnail instead of the original
+        thumb = derivatives.derivative_path(f.sha256, "thumb") if derivatives.is_derivable(f) else None
+        if thumb is not None and thumb.exists() and f.id in file_mirror_names:
+            thumb_name = f"{f.id}_thumb.jpg"
+            try:
+                os.link(thumb, files_dir / thumb_name)
+                file_thumb_names[f.id] = f"files/{thumb_name}"
+            except OSError:
+                pass
 
     # -------------------------------------------------------------------------
     # File 1: recovery.html - Human-readable backup for emergency recovery
@@ -647,7 +768,13 @@ def refresh_fallback_mirror(db: Session):
         if sem_files:
             file_links = []
             for f in sem_files:
-                if f.id in file_mirror_names:
+                if f.id in file_thumb_names:
+                    file_links.append(
+                        f'<a href="{quote(file_mirror_names[f.id], safe="/")}">'
+                        f'<img src="{quote(file_thumb_names[f.id], safe="/")}" alt="{esc(f.original_filename)}" '
+                        f'loading="lazy" style="max-height:120px;vertical-align:middle"></a>'
+                    )
+                elif f.id in file_mirror_names:
                     file_links.append(f'<a href="{quote(file_mirror_names[f.id], safe="/")}">{esc(f.original_filename)}</a>')
                 else:
                     file_links.append(esc(f.original_filename))
@@ -857,6 +984,20 @@ async def run_data_migration(engine):
                 else:
                     logger.error(f"Error adding seminar_details.{col_name}: {e}")
         
+        # Add sha256 to uploaded_files if not exists (content hash, computed on upload)
+        try:
+            conn.execute(text("ALTER TABLE uploaded_files ADD COLUMN sha256 TEXT"))
+            conn.commit()
+            logger.info("Added uploaded_files.sha256 column")
+        except Exception as e:
+            if "duplicate column name" in str(e):
+                logger.info("uploaded_files.sha256 already exists")
+            else:
+                logger.error(f"Error adding uploaded_files.sha256: {e}")
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_uploaded_files_sha256 ON uploaded_files (sha256)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_uploaded_files_storage_filename ON uploaded_files (storage_filename)"))
+        conn.commit()
+        
         # Migrate data: update seminars with slot_id from seminar_slots
         try:
             result = conn.execute(text("""
@@ -932,6 +1073,13 @@ async def lifespan(app: FastAPI):
     
     # Run data migration
     await run_data_migration(eng)
+    # Precompress any frontend assets the image build did not already cover
+    if settings.precompress_static_assets:
+        try:
+            stats = await run_in_threadpool(precompress_directory, FRONTEND_DIST_DIR)
+            logger.info(f"Frontend assets precompressed: {stats}")
+        except OSError as e:
+            logger.warning(f"Could not precompress frontend assets: {e}")
     # Build initial fallback mirror snapshot
     with Session(eng) as session:
         try:
@@ -939,7 +1087,14 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Initial fallback mirror generation failed: {e}")
     
+    sweeper = start_sweeper()
+    dispatcher = outbox.start_dispatcher()
+    activity_writer = activity.start_writer()
     yield
+    await activity.stop_writer(activity_writer)
+    await outbox.stop_dispatcher(dispatcher)
+    await stop_sweeper(sweeper)
+    derivatives.shutdown_pool()
 
 app = FastAPI(title="Seminars App", lifespan=lifespan)
 
@@ -948,7 +1103,10 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGINATION_HEADERS,
 )
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+app.add_middleware(VersionETagMiddleware)
 
 # Request logging middleware
 @app.middleware("http")
@@ -992,9 +1150,11 @@ _PROJECT_ROOT = _APP_DIR.parent
 FRONTEND_DIST_DIR = _PROJECT_ROOT / "frontend" / "dist"
 FRONTEND_ASSETS_DIR = FRONTEND_DIST_DIR / "assets"
 IMG_DIR = _PROJECT_ROOT / "img"
+SPA_INDEX = InMemoryFile(FRONTEND_DIST_DIR / "index.html")
 
 # check_dir=False avoids import-time crashes when frontend artifacts are not bundled yet.
-app.mount("/assets", StaticFiles(directory=str(FRONTEND_ASSETS_DIR), check_dir=False), name="assets")
+# Vite content-hashes every bundle name, so assets are served precompressed and immutable.
+app.mount("/assets", PrecompressedStaticFiles(directory=str(FRONTEND_ASSETS_DIR), check_dir=False), name="assets")
 if IMG_DIR.exists():
     app.mount("/img", StaticFiles(directory=str(IMG_DIR)), name="img")
 if not FRONTEND_ASSETS_DIR.exists():
@@ -1211,10 +1371,10 @@ def _build_public_calendar_content(request: Request, term_name: str, seminars: L
 # ============================================================================
 
 @app.get("/", response_class=HTMLResponse)
-async def index():
-    index_file = FRONTEND_DIST_DIR / "index.html"
-    if not index_file.exists():
-        logger.warning(f"Frontend index file not found: {index_file}")
+async def index(request: Request):
+    index_content = SPA_INDEX.get()
+    if index_content is None:
+        logger.warning(f"Frontend index file not found: {SPA_INDEX.path}")
         return HTMLResponse(
             content=(
                 "<html><body style='font-family:sans-serif;padding:2rem'>"
@@ -1226,8 +1386,10 @@ async def index():
             status_code=503,
         )
 
-    with index_file.open("r") as f:
-        return f.read()
+    headers = {"ETag": index_content.etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), index_content.etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=index_content.body, headers=headers)
 
 @app.get("/public", response_class=HTMLResponse)
 async def public_page(request: Request, db: Session = Depends(get_db)):
@@ -1686,79 +1848,23 @@ async def public_calendar_feed(request: Request, db: Session = Depends(get_db)):
     )
 
 # Speaker token pages (public, no auth required)
+# The pages are static shells, identical for every token: the page reads the
+# token from its URL and fetches its data from the JSON token endpoints, so the
+# HTML is rendered and compressed once per process and cacheable by browsers.
+SPEAKER_PAGE_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+SPEAKER_AVAILABILITY_SHELL = PrecompressedBody(get_availability_page_shell().encode("utf-8"), cache_control=SPEAKER_PAGE_CACHE_CONTROL)
+SPEAKER_INFO_SHELL = PrecompressedBody(get_speaker_info_page_shell().encode("utf-8"), cache_control=SPEAKER_PAGE_CACHE_CONTROL)
+SPEAKER_STATUS_SHELL = PrecompressedBody(get_speaker_status_page_shell().encode("utf-8"), cache_control=SPEAKER_PAGE_CACHE_CONTROL)
+
 @app.get("/speaker/availability/{token}", response_class=HTMLResponse)
-async def speaker_availability_page(token: str, db: Session = Depends(get_db)):
+async def speaker_availability_page(token: str, request: Request):
     """Public page for speaker to submit availability. Always updatable (no used_at check)."""
-    # Verify token - allow viewing even if previously submitted (speakers can edit anytime)
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.expires_at > datetime.utcnow(),
-        SpeakerToken.token_type == "availability"
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        return HTMLResponse(content=get_invalid_token_html(), status_code=404)
-    
-    suggestion = db_token.suggestion
-    plan = db.get(SemesterPlan, suggestion.semester_plan_id) if suggestion.semester_plan_id else None
-    
-    # Get slot dates for this plan (all slots) and derive calendar range from them
-    semester_start = None
-    semester_end = None
-    allowed_slot_dates: List[str] = []
-    if plan:
-        slots = db.exec(
-            select(SeminarSlot)
-            .where(SeminarSlot.semester_plan_id == plan.id)
-            .order_by(SeminarSlot.date)
-        ).all()
-
-        allowed_slot_dates = [slot.date.isoformat() for slot in slots]
-
-        if slots:
-            dates = [slot.date for slot in slots]
-            semester_start = min(dates).isoformat()
-            semester_end = max(dates).isoformat()
-    
-    return HTMLResponse(content=get_availability_page_html(
-        speaker_name=suggestion.speaker_name,
-        speaker_email=suggestion.speaker_email,
-        speaker_affiliation=suggestion.speaker_affiliation,
-        suggested_topic=suggestion.suggested_topic,
-        semester_plan=plan.name if plan else None,
-        token=token,
-        semester_start=semester_start,
-        semester_end=semester_end,
-        allowed_slot_dates=allowed_slot_dates,
-    ))
+    return SPEAKER_AVAILABILITY_SHELL.response(request.headers)
 
 @app.get("/speaker/info/{token}", response_class=HTMLResponse)
-async def speaker_info_page(token: str, db: Session = Depends(get_db)):
+async def speaker_info_page(token: str, request: Request):
     """Public page for speaker to submit detailed info."""
-    # Verify token - allow viewing even if used, but not expired
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.expires_at > datetime.utcnow(),
-        SpeakerToken.token_type == "info"
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        return HTMLResponse(content=get_invalid_token_html(), status_code=404)
-    
-    suggestion = db_token.suggestion
-    seminar = db_token.seminar
-    
-    return HTMLResponse(content=get_speaker_info_page_v6(
-        speaker_name=suggestion.speaker_name,
-        speaker_email=suggestion.speaker_email,
-        speaker_affiliation=suggestion.speaker_affiliation,
-        seminar_title=seminar.title if seminar else None,
-        seminar_date=seminar.date.strftime('%B %d, %Y') if seminar else None,
-        token=token,
-        seminar_id=seminar.id if seminar else None
-    ))
+    return SPEAKER_INFO_SHELL.response(request.headers)
 
 @app.get("/test-js", response_class=HTMLResponse)
 async def test_js_page():
@@ -1865,10 +1971,28 @@ async def test_speaker_info_page():
 # API Routes - Speakers
 # ============================================================================
 
-@app.get("/api/speakers", response_model=List[SpeakerResponse])
-async def list_speakers(db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
-    statement = select(Speaker).order_by(Speaker.name)
-    return db.exec(statement).all()
+@app.get("/api/speakers", response_model=List[SpeakerResponse], dependencies=[Depends(versioned("speakers"))])
+async def list_speakers(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=200, description="Name prefix"),
+    view: str = Query("full", pattern="^(full|summary)$"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    summary = view == "summary"
+    if summary:
+        statement = select(Speaker.id, Speaker.name, Speaker.affiliation, Speaker.email)
+    else:
+        statement = select(Speaker)
+    if q:
+        statement = statement.where(Speaker.name.startswith(q, autoescape=True))
+    rows = paginate(db, statement, (Speaker.name, Speaker.id), response, limit, cursor, include_total)
+    if summary:
+        return model_list_response(SPEAKER_SUMMARY_LIST, rows, response.headers)
+    return rows
 
 @app.post("/api/speakers", response_model=SpeakerResponse)
 async def create_speaker(speaker: SpeakerCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -1911,10 +2035,18 @@ async def delete_speaker(speaker_id: int, db: Session = Depends(get_db), user: d
     return result
 
 # Additional endpoints for frontend compatibility (/api/v1/seminars/*)
-@app.get("/api/v1/seminars/speakers", response_model=List[SpeakerResponse])
-async def list_speakers_v1(db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
-    statement = select(Speaker).order_by(Speaker.name)
-    return db.exec(statement).all()
+@app.get("/api/v1/seminars/speakers", response_model=List[SpeakerResponse], dependencies=[Depends(versioned("speakers"))])
+async def list_speakers_v1(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=200, description="Name prefix"),
+    view: str = Query("full", pattern="^(full|summary)$"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    return await list_speakers(response, q, view, limit, cursor, include_total, db, user)
 
 @app.post("/api/v1/seminars/speakers", response_model=SpeakerResponse)
 async def create_speaker_v1(speaker: SpeakerCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -1950,10 +2082,20 @@ async def delete_speaker_v1(speaker_id: int, db: Session = Depends(get_db), user
 # API Routes - Rooms
 # ============================================================================
 
-@app.get("/api/rooms", response_model=List[RoomResponse])
-async def list_rooms(db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
-    statement = select(Room).order_by(Room.name)
-    return db.exec(statement).all()
+@app.get("/api/rooms", response_model=List[RoomResponse], dependencies=[Depends(versioned("rooms"))])
+async def list_rooms(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=200, description="Name prefix"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    statement = select(Room)
+    if q:
+        statement = statement.where(Room.name.startswith(q, autoescape=True))
+    return paginate(db, statement, (Room.name, Room.id), response, limit, cursor, include_total)
 
 @app.post("/api/rooms", response_model=RoomResponse)
 async def create_room(room: RoomCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -1978,22 +2120,59 @@ async def delete_room(room_id: int, db: Session = Depends(get_db), user: dict =
 # API Routes - Seminars
 # ============================================================================
 
-@app.get("/api/seminars", response_model=List[SeminarResponse])
-async def list_seminars(
+def _seminar_list_statement(
+    summary: bool = False,
     upcoming: bool = False,
     in_plan_only: bool = False,
-    db: Session = Depends(get_db),
-    user: dict = Depends(get_current_user)
+    orphaned: bool = False,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    status: Optional[str] = None,
+    plan_id: Optional[int] = None,
+    q: Optional[str] = None,
 ):
-    statement = select(Seminar).options(
-        selectinload(Seminar.room),
-        selectinload(Seminar.speaker),
-        selectinload(Seminar.assigned_slot).selectinload(SeminarSlot.plan)
-    ).order_by(Seminar.date)
+    """Filtered (unordered) seminar list query shared by the list endpoints."""
+    if summary:
+        statement = (
+            select(
+                Seminar.id,
+                Seminar.title,
+                Seminar.date,
+                Seminar.start_time,
+                Seminar.end_time,
+                Seminar.status,
+                Seminar.speaker_id,
+                Speaker.name.label("speaker_name"),
+                Room.name.label("room"),
+            )
+            .select_from(Seminar)
+            .outerjoin(Speaker, Speaker.id == Seminar.speaker_id)
+            .outerjoin(Room, Room.id == Seminar.room_id)
+        )
+    else:
+        statement = select(Seminar).options(
+            selectinload(Seminar.room),
+            selectinload(Seminar.speaker),
+            selectinload(Seminar.assigned_slot).selectinload(SeminarSlot.plan)
+        )
     
     if upcoming:
         today = date_type.today()
         statement = statement.where(Seminar.date >= today)
+    if date_from:
+        statement = statement.where(Seminar.date >= date_from)
+    if date_to:
+        statement = statement.where(Seminar.date <= date_to)
+    if status:
+        statement = statement.where(Seminar.status == status)
+    if q:
+        statement = statement.where(Seminar.title.startswith(q, autoescape=True))
+    if plan_id is not None:
+        plan_subq = select(SeminarSlot.assigned_seminar_id).where(
+            SeminarSlot.semester_plan_id == plan_id,
+            SeminarSlot.assigned_seminar_id.isnot(None),
+        )
+        statement = statement.where(Seminar.id.in_(plan_subq))
     
     if in_plan_only:
         # Only seminars that are assigned to a slot in a semester plan
@@ -2001,8 +2180,45 @@ async def list_seminars(
             SeminarSlot.assigned_seminar_id.isnot(None)
         ).distinct()
         statement = statement.where(Seminar.id.in_(assigned_subq))
+    elif orphaned:
+        # Only seminars NOT assigned to any slot (orphans)
+        assigned_subq = select(SeminarSlot.assigned_seminar_id).where(
+            SeminarSlot.assigned_seminar_id.isnot(None)
+        ).distinct()
+        statement = statement.where(~Seminar.id.in_(assigned_subq))
     
-    return db.exec(statement).all()
+    return statement
+
+@app.get("/api/seminars", response_model=List[SeminarResponse], dependencies=[Depends(versioned("seminars", "speakers", "rooms", "seminar_slots"))])
+async def list_seminars(
+    response: Response,
+    upcoming: bool = False,
+    in_plan_only: bool = False,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    status: Optional[str] = None,
+    plan_id: Optional[int] = None,
+    q: Optional[str] = Query(None, max_length=200, description="Title prefix"),
+    view: str = Query("full", pattern="^(full|summary)$"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    summary = view == "summary"
+    statement = _seminar_list_statement(
+        summary=summary,
+        upcoming=upcoming,
+        in_plan_only=in_plan_only,
+        date_from=date_from,
+        date_to=date_to,
+        status=status,
+        plan_id=plan_id,
+        q=q,
+    )
+    rows = paginate(db, statement, (Seminar.date, Seminar.id), response, limit, cursor, include_total)
+    return model_list_response(SEMINAR_SUMMARY_LIST if summary else SEMINAR_LIST, rows, response.headers)
 
 @app.post("/api/seminars", response_model=SeminarResponse)
 async def create_seminar(seminar: SeminarCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -2055,45 +2271,45 @@ async def update_seminar(seminar_id: int, update: SeminarUpdate, db: Session = D
 async def delete_seminar(seminar_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     require_admin(user)
     ensure_legacy_writes_allowed()
-    result = delete_seminar_robust(seminar_id, db)
+    result = await run_in_threadpool(delete_seminar_robust, seminar_id, db)  # releases blobs
     if not result["success"]:
         raise HTTPException(status_code=404, detail=result["error"])
     refresh_fallback_mirror(db)
     return result
 
 # Additional endpoints for frontend compatibility (/api/v1/seminars/*)
-@app.get("/api/v1/seminars/seminars", response_model=List[SeminarResponse])
+@app.get("/api/v1/seminars/seminars", response_model=List[SeminarResponse], dependencies=[Depends(versioned("seminars", "speakers", "rooms", "seminar_slots"))])
 async def list_seminars_v1(
+    response: Response,
     upcoming: bool = False,
     in_plan_only: bool = False,
     orphaned: bool = False,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    status: Optional[str] = None,
+    plan_id: Optional[int] = None,
+    q: Optional[str] = Query(None, max_length=200, description="Title prefix"),
+    view: str = Query("full", pattern="^(full|summary)$"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    statement = select(Seminar).options(
-        selectinload(Seminar.room),
-        selectinload(Seminar.speaker),
-        selectinload(Seminar.assigned_slot).selectinload(SeminarSlot.plan)
-    ).order_by(Seminar.date)
-    
-    if upcoming:
-        today = date_type.today()
-        statement = statement.where(Seminar.date >= today)
-    
-    if in_plan_only:
-        # Only seminars that are assigned to a slot in a semester plan
-        assigned_subq = select(SeminarSlot.assigned_seminar_id).where(
-            SeminarSlot.assigned_seminar_id.isnot(None)
-        ).distinct()
-        statement = statement.where(Seminar.id.in_(assigned_subq))
-    elif orphaned:
-        # Only seminars NOT assigned to any slot (orphans)
-        assigned_subq = select(SeminarSlot.assigned_seminar_id).where(
-            SeminarSlot.assigned_seminar_id.isnot(None)
-        ).distinct()
-        statement = statement.where(~Seminar.id.in_(assigned_subq))
-    
-    return db.exec(statement).all()
+    summary = view == "summary"
+    statement = _seminar_list_statement(
+        summary=summary,
+        upcoming=upcoming,
+        in_plan_only=in_plan_only,
+        orphaned=orphaned,
+        date_from=date_from,
+        date_to=date_to,
+        status=status,
+        plan_id=plan_id,
+        q=q,
+    )
+    rows = paginate(db, statement, (Seminar.date, Seminar.id), response, limit, cursor, include_total)
+    return model_list_response(SEMINAR_SUMMARY_LIST if summary else SEMINAR_LIST, rows, response.headers)
 
 @app.post("/api/v1/seminars/seminars", response_model=SeminarResponse)
 async def create_seminar_v1(seminar: SeminarCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -2110,6 +2326,69 @@ async def get_seminar_v1(seminar_id: int, db: Session = Depends(get_db), user: d
         raise HTTPException(status_code=404, detail="Seminar not found")
     return seminar
 
+# Declared before /seminars/{seminar_id} so "batch" is not parsed as an id
+@app.patch("/api/v1/seminars/seminars/batch")
+async def batch_update_seminars_v1(data: SeminarBatchUpdate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    """Apply partial updates to many seminars in one transaction.
+
+    Unknown ids are reported per item and do not block the rest. Changed
+    fields are written with one bulk UPDATE by primary key, and a single
+    SEMINARS_BATCH_UPDATED event lists every change.
+    """
+    seminar_ids = [item.seminar_id for item in data.items]
+    if len(set(seminar_ids)) != len(seminar_ids):
+        raise HTTPException(status_code=400, detail="Each seminar_id may appear only once per batch")
+
+    seminars = {s.id: s for s in db.exec(select(Seminar).where(Seminar.id.in_(seminar_ids))).all()}
+    now = datetime.utcnow()
+    results: List[dict] = []
+    rows: List[dict] = []
+    all_changes: List[dict] = []
+    for item in data.items:
+        seminar = seminars.get(item.seminar_id)
+        if seminar is None:
+            results.append({"seminar_id": item.seminar_id, "status": "not_found", "changes": []})
+            continue
+        update_data = item.model_dump(exclude_unset=True, exclude={"seminar_id"})
+        before = {key: getattr(seminar, key) for key in update_data}
+        changes = _build_activity_changes(before, update_data)
+        if not changes:
+            results.append({"seminar_id": seminar.id, "status": "unchanged", "changes": []})
+            continue
+        rows.append({"id": seminar.id, "updated_at": now, **{c["field"]: update_data[c["field"]] for c in changes}})
+        results.append({"seminar_id": seminar.id, "status": "updated", "changes": changes})
+        all_changes.extend(
+            {**c, "label": f"{seminar.title}: {c['label']}", "seminar_id": seminar.id} for c in changes
+        )
+
+    if rows:
+        # Old and new speakers: the bulk UPDATE bypasses the ORM hooks that invalidate token contexts
+        touched_speakers = {seminars[row["id"]].speaker_id for row in rows} | {
+            row["speaker_id"] for row in rows if "speaker_id" in row
+        }
+        db.exec(sql_update(Seminar), params=rows)
+        outbox.enqueue_seminar_updates(
+            db.connection(), {row["id"]: sorted(set(row) - {"id"}) for row in rows}
+        )
+        record_activity(
+            db=db,
+            event_type="SEMINARS_BATCH_UPDATED",
+            summary=f"Updated {len(rows)} seminar{'s' if len(rows) != 1 else ''}",
+            entity_type="seminar",
+            actor=user.get("id"),
+            details=_activity_details_from_changes(all_changes, {"seminar_ids": [row["id"] for row in rows]}),
+        )
+        db.commit()
+        invalidate_seminars([row["id"] for row in rows], touched_speakers)
+        refresh_fallback_mirror(db)
+
+    return {
+        "updated": len(rows),
+        "unchanged": sum(1 for r in results if r["status"] == "unchanged"),
+        "not_found": sum(1 for r in results if r["status"] == "not_found"),
+        "results": results,
+    }
+
 @app.patch("/api/v1/seminars/seminars/{seminar_id}", response_model=SeminarResponse)
 async def update_seminar_v1(seminar_id: int, update: SeminarUpdate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     seminar = db.get(Seminar, seminar_id)
@@ -2141,7 +2420,7 @@ async def update_seminar_v1(seminar_id: int, update: SeminarUpdate, db: Session
 @app.delete("/api/v1/seminars/seminars/{seminar_id}")
 async def delete_seminar_v1(seminar_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     require_admin(user)
-    result = delete_seminar_robust(seminar_id, db)
+    result = await run_in_threadpool(delete_seminar_robust, seminar_id, db)  # releases blobs
     if not result["success"]:
         raise HTTPException(status_code=404, detail=result["error"])
     refresh_fallback_mirror(db)
@@ -2452,7 +2731,7 @@ async def update_seminar_details_v1(
 # API Routes - Semester Planning
 # ============================================================================
 
-@app.get("/api/v1/seminars/semester-plans", response_model=List[SemesterPlanResponse])
+@app.get("/api/v1/seminars/semester-plans", response_model=List[SemesterPlanResponse], dependencies=[Depends(versioned("semester_plans"))])
 async def list_semester_plans(db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     statement = select(SemesterPlan).order_by(SemesterPlan.created_at.desc())
     return db.exec(statement).all()
@@ -2487,7 +2766,7 @@ async def create_semester_plan(plan: SemesterPlanCreate, db: Session = Depends(g
     refresh_fallback_mirror(db)
     return db_plan
 
-@app.get("/api/v1/seminars/semester-plans/{plan_id}", response_model=SemesterPlanResponse)
+@app.get("/api/v1/seminars/semester-plans/{plan_id}", response_model=SemesterPlanResponse, dependencies=[Depends(versioned("semester_plans"))])
 async def get_semester_plan(plan_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     plan = db.get(SemesterPlan, plan_id)
     if not plan:
@@ -2524,7 +2803,7 @@ async def update_semester_plan(plan_id: int, update: SemesterPlanCreate, db: Ses
 @app.delete("/api/v1/seminars/semester-plans/{plan_id}")
 async def delete_semester_plan(plan_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     require_admin(user)
-    result = delete_semester_plan_robust(plan_id, db)
+    result = await run_in_threadpool(delete_semester_plan_robust, plan_id, db)  # releases blobs
     if not result["success"]:
         raise HTTPException(status_code=404, detail=result["error"])
     refresh_fallback_mirror(db)
@@ -2534,7 +2813,7 @@ async def delete_semester_plan(plan_id: int, db: Session = Depends(get_db), user
 # API Routes - Seminar Slots
 # ============================================================================
 
-@app.get("/api/v1/seminars/semester-plans/{plan_id}/slots", response_model=List[SeminarSlotResponse])
+@app.get("/api/v1/seminars/semester-plans/{plan_id}/slots", response_model=List[SeminarSlotResponse], dependencies=[Depends(versioned("seminar_slots"))])
 async def list_slots(plan_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
     statement = select(SeminarSlot).where(SeminarSlot.semester_plan_id == plan_id).order_by(SeminarSlot.date)
     return db.exec(statement).all()
@@ -2649,40 +2928,57 @@ async def unassign_slot(slot_id: int, db: Session = Depends(get_db), user: dict
 # API Routes - Speaker Suggestions
 # ============================================================================
 
-@app.get("/api/v1/seminars/speaker-suggestions", response_model=List[SpeakerSuggestionResponse])
+def _suggestion_payload(s: SpeakerSuggestion) -> dict:
+    """Speaker suggestion with its availability (load availability eagerly)."""
+    return {
+        "id": s.id,
+        "suggested_by": s.suggested_by,
+        "suggested_by_email": s.suggested_by_email,
+        "speaker_id": s.speaker_id,
+        "speaker_name": s.speaker_name,
+        "speaker_email": s.speaker_email,
+        "speaker_affiliation": s.speaker_affiliation,
+        "suggested_topic": s.suggested_topic,
+        "reason": s.reason,
+        "priority": s.priority,
+        "status": s.status,
+        "semester_plan_id": s.semester_plan_id,
+        "created_at": s.created_at,
+        "availability": [{"date": a.date.isoformat(), "preference": a.preference} for a in s.availability],
+    }
+
+@app.get("/api/v1/seminars/speaker-suggestions", response_model=List[SpeakerSuggestionResponse], dependencies=[Depends(versioned("speaker_suggestions", "speaker_availability"))])
 async def list_speaker_suggestions(
+    response: Response,
     plan_id: Optional[int] = Query(None),
+    status: Optional[str] = None,
+    q: Optional[str] = Query(None, max_length=200, description="Speaker name prefix"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    statement = select(SpeakerSuggestion)
+    statement = select(SpeakerSuggestion).options(selectinload(SpeakerSuggestion.availability))
     if plan_id:
         statement = statement.where(SpeakerSuggestion.semester_plan_id == plan_id)
-    statement = statement.order_by(SpeakerSuggestion.created_at.desc())
-    
-    suggestions = db.exec(statement).all()
+    if status:
+        statement = statement.where(SpeakerSuggestion.status == status)
+    if q:
+        statement = statement.where(SpeakerSuggestion.speaker_name.startswith(q, autoescape=True))
+    
+    suggestions = paginate(
+        db,
+        statement,
+        (SpeakerSuggestion.created_at, SpeakerSuggestion.id),
+        response,
+        limit,
+        cursor,
+        include_total,
+        descending=True,
+    )
     
-    # Convert to response with availability
-    result = []
-    for s in suggestions:
-        avail = [{"date": a.date.isoformat(), "preference": a.preference} for a in s.availability]
-        result.append({
-            "id": s.id,
-            "suggested_by": s.suggested_by,
-            "suggested_by_email": s.suggested_by_email,
-            "speaker_id": s.speaker_id,
-            "speaker_name": s.speaker_name,
-            "speaker_email": s.speaker_email,
-            "speaker_affiliation": s.speaker_affiliation,
-            "suggested_topic": s.suggested_topic,
-            "reason": s.reason,
-            "priority": s.priority,
-            "status": s.status,
-            "semester_plan_id": s.semester_plan_id,
-            "created_at": s.created_at,
-            "availability": avail
-        })
-    return result
+    return FastJSONResponse([_suggestion_payload(s) for s in suggestions], headers=dict(response.headers))
 
 @app.post("/api/v1/seminars/speaker-suggestions", response_model=SpeakerSuggestionResponse)
 async def create_speaker_suggestion(suggestion: SpeakerSuggestionCreate, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
@@ -3032,27 +3328,170 @@ async def create_info_token(
     
     return {"link": f"/speaker/info/{token}", "token": token}
 
+# Link lifetime and the workflow flag set when a link is issued, per token type
+SPEAKER_TOKEN_TYPES = {
+    "availability": (timedelta(days=30), "request_available_dates_sent"),
+    "info": (timedelta(days=30), "speaker_notified_of_date"),
+    "status": (timedelta(days=90), None),
+}
+
+@app.post("/api/v1/seminars/speaker-tokens/bulk")
+async def create_speaker_tokens_bulk(
+    data: SpeakerTokenBulkCreate,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user),
+):
+    """Issue links of one type for every suggestion in a plan (or a subset), in one transaction.
+
+    Still-valid tokens are reused rather than duplicated; info tokens are only
+    reused when they point at the seminar currently assigned to the suggestion.
+    """
+    if data.token_type not in SPEAKER_TOKEN_TYPES:
+        raise HTTPException(status_code=400, detail=f"token_type must be one of: {', '.join(SPEAKER_TOKEN_TYPES)}")
+    plan = db.get(SemesterPlan, data.semester_plan_id)
+    if not plan:
+        raise HTTPException(status_code=404, detail="Semester plan not found")
+
+    stmt = select(SpeakerSuggestion).where(SpeakerSuggestion.semester_plan_id == plan.id)
+    if data.suggestion_ids is not None:
+        stmt = stmt.where(SpeakerSuggestion.id.in_(data.suggestion_ids))
+    suggestions = db.exec(stmt.order_by(SpeakerSuggestion.id)).all()
+    if data.suggestion_ids is not None:
+        missing = sorted(set(data.suggestion_ids) - {s.id for s in suggestions})
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Suggestions not in this plan: {missing}")
+    suggestion_ids = [s.id for s in suggestions]
+
+    now = datetime.utcnow()
+    lifetime, workflow_flag = SPEAKER_TOKEN_TYPES[data.token_type]
+
+    # Seminar each suggestion is assigned to (info links carry it)
+    seminar_by_suggestion: Dict[int, int] = {}
+    if data.token_type == "info" and suggestion_ids:
+        for suggestion_id, seminar_id in db.exec(
+            select(SeminarSlot.assigned_suggestion_id, SeminarSlot.assigned_seminar_id).where(
+                SeminarSlot.assigned_suggestion_id.in_(suggestion_ids),
+                SeminarSlot.assigned_seminar_id.isnot(None),
+            ).order_by(SeminarSlot.date)
+        ).all():
+            seminar_by_suggestion[suggestion_id] = seminar_id  # latest slot wins
+
+    # Newest live token per suggestion
+    live_tokens: Dict[int, SpeakerToken] = {}
+    if suggestion_ids:
+        for db_token in db.exec(
+            select(SpeakerToken).where(
+                SpeakerToken.suggestion_id.in_(suggestion_ids),
+                SpeakerToken.token_type == data.token_type,
+                SpeakerToken.expires_at > now,
+            ).order_by(SpeakerToken.created_at)
+        ).all():
+            if data.token_type == "info" and db_token.seminar_id != seminar_by_suggestion.get(db_token.suggestion_id):
+                continue
+            live_tokens[db_token.suggestion_id] = db_token
+
+    created_tokens: List[SpeakerToken] = []
+    issued = []
+    for suggestion in suggestions:
+        db_token = live_tokens.get(suggestion.id)
+        reused = db_token is not None
+        if not reused:
+            db_token = SpeakerToken(
+                token=generate_token(),
+                suggestion_id=suggestion.id,
+                token_type=data.token_type,
+                seminar_id=seminar_by_suggestion.get(suggestion.id),
+                expires_at=now + lifetime,
+            )
+            created_tokens.append(db_token)
+        issued.append((suggestion, db_token, reused))
+    db.add_all(created_tokens)
+    # Built now: the commit below expires every row, and reading them back would cost a SELECT each
+    links = [
+        {
+            "suggestion_id": suggestion.id,
+            "speaker_name": suggestion.speaker_name,
+            "speaker_email": suggestion.speaker_email,
+            "seminar_id": db_token.seminar_id,
+            "token": db_token.token,
+            "link": f"/speaker/{data.token_type}/{db_token.token}",
+            "expires_at": db_token.expires_at,
+            "reused": reused,
+        }
+        for suggestion, db_token, reused in issued
+    ]
+    plan_id, plan_name = plan.id, plan.name
+
+    if workflow_flag and suggestion_ids:
+        workflows = {
+            w.suggestion_id: w
+            for w in db.exec(select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id.in_(suggestion_ids))).all()
+        }
+        for suggestion_id in suggestion_ids:
+            workflow = workflows.get(suggestion_id) or SpeakerWorkflow(suggestion_id=suggestion_id)
+            if not getattr(workflow, workflow_flag):
+                setattr(workflow, workflow_flag, True)
+                workflow.updated_at = now
+                db.add(workflow)
+
+    if issued:
+        record_activity(
+            db=db,
+            event_type="SPEAKER_LINKS_BULK_CREATED",
+            summary=f"Issued {len(issued)} {data.token_type} links for {plan_name}",
+            semester_plan_id=plan_id,
+            entity_type="semester_plan",
+            entity_id=plan_id,
+            actor=user.get("id"),
+            details=_activity_details_from_changes(
+                _build_activity_changes(
+                    {},
+                    {
+                        "token_type": data.token_type,
+                        "created": len(created_tokens),
+                        "reused": len(issued) - len(created_tokens),
+                    },
+                    labels={
+                        "token_type": "Token Type",
+                        "created": "Links Created",
+                        "reused": "Links Reused",
+                    },
+                )
+            ),
+        )
+        db.commit()
+        refresh_fallback_mirror(db)
+
+    logger.info(
+        f"Bulk {data.token_type} tokens for plan {plan_id}: "
+        f"{len(created_tokens)} created, {len(issued) - len(created_tokens)} reused"
+    )
+    return {
+        "semester_plan_id": plan_id,
+        "token_type": data.token_type,
+        "created": len(created_tokens),
+        "reused": len(issued) - len(created_tokens),
+        "links": links,
+    }
+
 @app.get("/api/v1/seminars/speaker-tokens/verify")
 async def verify_speaker_token(
     token: str,
     db: Session = Depends(get_db)
 ):
     """Verify a speaker token and return associated data."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.expires_at > datetime.utcnow(),
-        SpeakerToken.used_at.is_(None)
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
+    context = resolve_token(db, token)
+    if not context or context.used_at is not None:
         raise HTTPException(status_code=404, detail="Invalid or expired token")
     
-    suggestion = db_token.suggestion
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
+    if not suggestion:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    seminar = db.get(Seminar, context.token_seminar_id) if context.token_seminar_id else None
     
     return {
         "valid": True,
-        "token_type": db_token.token_type,
+        "token_type": context.token_type,
         "suggestion": {
             "id": suggestion.id,
             "speaker_name": suggestion.speaker_name,
@@ -3061,12 +3500,12 @@ async def verify_speaker_token(
             "suggested_topic": suggestion.suggested_topic,
         },
         "seminar": {
-            "id": db_token.seminar.id,
-            "title": db_token.seminar.title,
-            "date": db_token.seminar.date.isoformat(),
-            "start_time": db_token.seminar.start_time,
-            "end_time": db_token.seminar.end_time,
-        } if db_token.seminar else None
+            "id": seminar.id,
+            "title": seminar.title,
+            "date": seminar.date.isoformat(),
+            "start_time": seminar.start_time,
+            "end_time": seminar.end_time,
+        } if seminar else None
     }
 
 @app.post("/api/v1/seminars/speaker-tokens/{token}/submit-availability")
@@ -3076,18 +3515,10 @@ async def submit_speaker_availability(
     db: Session = Depends(get_db)
 ):
     """Submit availability using a speaker token. Replaces existing availability (always updatable)."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'availability',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    context = require_token(db, token, "availability")
     
     # Replace existing availability: delete old entries, add new ones
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
     previous_availability: List[dict] = []
     if suggestion:
         previous_availability = [
@@ -3127,7 +3558,7 @@ async def submit_speaker_availability(
     ]
     for avail in data.availabilities:
         db_avail = SpeakerAvailability(
-            suggestion_id=db_token.suggestion_id,
+            suggestion_id=context.suggestion_id,
             date=avail.date,
             preference=avail.preference
         )
@@ -3169,18 +3600,10 @@ async def submit_speaker_availability(
 @app.get("/api/v1/seminars/speaker-tokens/{token}/availability")
 async def get_speaker_availability_by_token(token: str, db: Session = Depends(get_db)):
     """Get existing availability for a token."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'availability',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    context = require_token(db, token, "availability")
     
     # Get suggestion and availability
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
     if not suggestion:
         raise HTTPException(status_code=404, detail="Suggestion not found")
     
@@ -3192,21 +3615,27 @@ async def get_speaker_availability_by_token(token: str, db: Session = Depends(ge
             "preference": avail.preference
         })
 
+    plan = db.get(SemesterPlan, context.plan_id) if context.plan_id else None
     allowed_slot_dates: List[str] = []
-    if suggestion.semester_plan_id:
-        allowed_slots = db.exec(
-            select(SeminarSlot).where(
-                SeminarSlot.semester_plan_id == suggestion.semester_plan_id
-            )
-        ).all()
-        allowed_slot_dates = [slot.date.isoformat() for slot in allowed_slots]
+    if plan:
+        allowed_slot_dates = sorted({
+            slot_date.isoformat()
+            for slot_date in db.exec(
+                select(SeminarSlot.date).where(SeminarSlot.semester_plan_id == plan.id)
+            ).all()
+        })
     
     return {
         "speaker_name": suggestion.speaker_name,
+        "speaker_email": suggestion.speaker_email,
+        "speaker_affiliation": suggestion.speaker_affiliation,
         "suggested_topic": suggestion.suggested_topic,
+        "semester_plan": plan.name if plan else None,
+        "semester_start": allowed_slot_dates[0] if allowed_slot_dates else None,
+        "semester_end": allowed_slot_dates[-1] if allowed_slot_dates else None,
         "availability": availability,
         "allowed_slot_dates": allowed_slot_dates,
-        "has_submitted": db_token.used_at is not None
+        "has_submitted": context.used_at is not None
     }
 
 @app.post("/api/v1/seminars/speaker-tokens/{token}/submit-info")
@@ -3216,28 +3645,11 @@ async def submit_speaker_info(
     db: Session = Depends(get_db)
 ):
     """Submit speaker information using a token."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
+    context = require_token(db, token, "info")
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
 
-    # Get or create seminar details
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        # If no seminar_id in token, try to find one from the suggestion
-        if suggestion and suggestion.speaker_id:
-            # Find a seminar for this speaker
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
-    
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
     if not seminar_id:
         raise HTTPException(status_code=400, detail="No seminar associated with this token")
 
@@ -3338,6 +3750,7 @@ async def submit_speaker_info(
         if speaker:
             speaker.name = data.speaker_name
     
+    db_token = db.get(SpeakerToken, context.token_id)
     db_token.used_at = datetime.utcnow()
     db.flush()
 
@@ -3373,30 +3786,15 @@ async def submit_speaker_info(
 @app.get("/api/v1/seminars/speaker-tokens/{token}/info")
 async def get_speaker_info_by_token(token: str, db: Session = Depends(get_db)):
     """Get existing speaker information for a token."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    context = require_token(db, token, "info")
     
     # Get suggestion - validate it exists
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
     if not suggestion:
         raise HTTPException(status_code=404, detail="Suggestion not found - may have been deleted")
     
-    # Get seminar from token
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        # Try to find seminar by suggestion's speaker_id
-        if suggestion.speaker_id:
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
     
     if not seminar_id:
         # Return basic suggestion info if no seminar exists yet
@@ -3405,7 +3803,7 @@ async def get_speaker_info_by_token(token: str, db: Session = Depends(get_db)):
             "speaker_email": suggestion.speaker_email,
             "speaker_affiliation": suggestion.speaker_affiliation,
             "final_talk_title": suggestion.suggested_topic,
-            "has_submitted": db_token.used_at is not None
+            "has_submitted": context.used_at is not None
         }
     
     # Get seminar and details
@@ -3417,13 +3815,15 @@ async def get_speaker_info_by_token(token: str, db: Session = Depends(get_db)):
             "speaker_email": suggestion.speaker_email,
             "speaker_affiliation": suggestion.speaker_affiliation,
             "final_talk_title": suggestion.suggested_topic,
-            "has_submitted": db_token.used_at is not None
+            "has_submitted": context.used_at is not None
         }
     
     details_stmt = select(SeminarDetails).where(SeminarDetails.seminar_id == seminar_id)
     details = db.exec(details_stmt).first()
     
     return {
+        "seminar_title": seminar.title,
+        "seminar_date": seminar.date.strftime('%B %d, %Y') if seminar.date else None,
         "speaker_name": seminar.speaker.name if seminar.speaker else suggestion.speaker_name,
         "final_talk_title": seminar.title if seminar else suggestion.suggested_topic,
         "abstract": seminar.abstract if seminar else None,
@@ -3450,22 +3850,15 @@ async def get_speaker_info_by_token(token: str, db: Session = Depends(get_db)):
         "bank_address": details.bank_address if details else None,
         "beneficiary_address": details.beneficiary_address if details else None,
         "currency": details.currency if details else None,
-        "has_submitted": db_token.used_at is not None
+        "has_submitted": context.used_at is not None
     }
 
 @app.post("/api/v1/seminars/speaker-tokens/{token}/finalize")
 async def finalize_speaker_info(token: str, db: Session = Depends(get_db)):
     """Finalize speaker info submission - marks token as used."""
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    context = require_token(db, token, "info")
     
+    db_token = db.get(SpeakerToken, context.token_id)
     db_token.used_at = datetime.utcnow()
     db.commit()
     
@@ -3475,20 +3868,33 @@ async def finalize_speaker_info(token: str, db: Session = Depends(get_db)):
 # API Routes - Planning Board
 # ============================================================================
 
-@app.get("/api/v1/seminars/semester-plans/{plan_id}/planning-board")
-async def get_planning_board(plan_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
-    plan = db.get(SemesterPlan, plan_id)
-    if not plan:
-        raise HTTPException(status_code=404, detail="Semester plan not found")
+def build_planning_board(db: Session, plan: SemesterPlan) -> dict:
+    """Planning board for one plan in a fixed number of queries (slots, seminars, suggestions)."""
+    plan_id = plan.id
     
     # Get slots
     slots_stmt = select(SeminarSlot).where(SeminarSlot.semester_plan_id == plan_id).order_by(SeminarSlot.date)
     slots = db.exec(slots_stmt).all()
     
     # Get suggestions for this plan
-    suggestions_stmt = select(SpeakerSuggestion).where(SpeakerSuggestion.semester_plan_id == plan_id)
+    suggestions_stmt = (
+        select(SpeakerSuggestion)
+        .options(selectinload(SpeakerSuggestion.availability))
+        .where(SpeakerSuggestion.semester_plan_id == plan_id)
+    )
     suggestions = db.exec(suggestions_stmt).all()
     
+    # Assigned seminars for all slots at once, with room and speaker
+    seminar_ids = {s.assigned_seminar_id for s in slots if s.assigned_seminar_id}
+    seminars_by_id = {}
+    if seminar_ids:
+        seminars_stmt = (
+            select(Seminar)
+            .options(selectinload(Seminar.room), selectinload(Seminar.speaker))
+            .where(Seminar.id.in_(seminar_ids))
+        )
+        seminars_by_id = {seminar.id: seminar for seminar in db.exec(seminars_stmt).all()}
+    
     # Build slots response with assigned speaker name
     slots_response = []
     for s in slots:
@@ -3503,12 +3909,7 @@ async def get_planning_board(plan_id: int, db: Session = Depends(get_db), user:
         }
         # If slot has an assigned seminar, get the speaker name and seminar room
         if s.assigned_seminar_id:
-            seminar_stmt = (
-                select(Seminar)
-                .options(selectinload(Seminar.room), selectinload(Seminar.speaker))
-                .where(Seminar.id == s.assigned_seminar_id)
-            )
-            seminar = db.exec(seminar_stmt).first()
+            seminar = seminars_by_id.get(s.assigned_seminar_id)
             if seminar:
                 assigned_suggestion_id = s.assigned_suggestion_id  # Use stored value first
                 
@@ -3516,14 +3917,8 @@ async def get_planning_board(plan_id: int, db: Session = Depends(get_db), user:
                 if seminar.room:
                     slot_data["room"] = seminar.room.name
                 
-                # Get speaker name — eagerly loaded via selectinload, fall back to direct query
-                speaker_name = None
-                if seminar.speaker:
-                    speaker_name = seminar.speaker.name
-                elif seminar.speaker_id:
-                    speaker = db.get(Speaker, seminar.speaker_id)
-                    if speaker:
-                        speaker_name = speaker.name
+                # Speaker name — eagerly loaded via selectinload
+                speaker_name = seminar.speaker.name if seminar.speaker else None
                 if speaker_name:
                     slot_data["assigned_speaker_name"] = speaker_name
                 if seminar.title:
@@ -3580,6 +3975,13 @@ async def get_planning_board(plan_id: int, db: Session = Depends(get_db), user:
         ]
     }
 
+@app.get("/api/v1/seminars/semester-plans/{plan_id}/planning-board", dependencies=[Depends(versioned("semester_plans", "seminar_slots", "seminars", "speakers", "rooms", "speaker_suggestions", "speaker_availability"))])
+async def get_planning_board(plan_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    plan = db.get(SemesterPlan, plan_id)
+    if not plan:
+        raise HTTPException(status_code=404, detail="Semester plan not found")
+    return FastJSONResponse(build_planning_board(db, plan))
+
 @app.post("/api/v1/seminars/planning/assign")
 async def assign_speaker_to_slot(
     request: AssignSpeakerRequest,
@@ -3770,78 +4172,65 @@ async def assign_seminar_to_slot(
 def ensure_uploads_dir():
     Path(settings.uploads_dir).mkdir(parents=True, exist_ok=True)
 
-def save_uploaded_file(file: UploadFile, seminar_id: int, category: Optional[str], db: Session) -> UploadedFile:
-    ensure_uploads_dir()
-    
-    original_filename = file.filename or "unnamed"
+def save_uploaded_file(stored: StoredUpload, seminar_id: int, db: Session) -> UploadedFile:
+    """Place an upload received by receive_upload in the blob store and commit its UploadedFile row.
+
+    Identical content is stored once; the row then shares the existing blob.
+    Waits for blob_lock, so async callers run it through run_in_threadpool.
+    """
+    original_filename = stored.original_filename
     original_ext = original_filename.rsplit(".", 1)[-1].lower() if "." in original_filename else ""
     
-    file_id = uuid.uuid4().hex
-    storage_filename = f"{file_id}.bin"
-    storage_path = Path(settings.uploads_dir) / storage_filename
-    
-    with open(storage_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    file_size = storage_path.stat().st_size
-    content_type = file.content_type or "application/octet-stream"
-    
-    uploaded = UploadedFile(
-        seminar_id=seminar_id,
-        original_filename=original_filename,
-        original_extension=original_ext if original_ext else None,
-        content_type=content_type,
-        file_size=file_size,
-        storage_filename=storage_filename,
-        file_category=category,
-    )
-    db.add(uploaded)
-    db.commit()
+    with blobs.blob_lock:
+        try:
+            storage_filename, created = blobs.place(stored.path, stored.sha256)
+        except OSError:
+            stored.discard()
+            raise
+        uploaded = UploadedFile(
+            seminar_id=seminar_id,
+            original_filename=original_filename,
+            original_extension=original_ext if original_ext else None,
+            content_type=stored.content_type,
+            file_size=stored.file_size,
+            storage_filename=storage_filename,
+            sha256=stored.sha256,
+            file_category=stored.category,
+        )
+        db.add(uploaded)
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            if created:
+                blobs.unplace(stored.sha256)
+            raise
     db.refresh(uploaded)
+    derivatives.schedule(uploaded, Path(settings.uploads_dir) / storage_filename)
     
     return uploaded
 
-@app.post("/api/v1/seminars/speaker-tokens/{token}/upload")
-async def upload_file_with_token(
-    token: str,
-    file: UploadFile = File(...),
-    category: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
-):
-    """Upload file using a speaker token (no regular auth required)."""
-    # Verify token
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
-    
-    # Get seminar_id from token or find it via suggestion
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
-        if suggestion and suggestion.speaker_id:
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
-    
-    if not seminar_id:
-        raise HTTPException(status_code=400, detail="No seminar associated with this token")
-    
-    uploaded = save_uploaded_file(file, seminar_id, category, db)
-    log_audit("FILE_UPLOAD", f"token:{token[:8]}", {"seminar_id": seminar_id, "file": file.filename, "category": category})
-    logger.info(f"File uploaded via token: {file.filename} for seminar {seminar_id}")
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
+ImageVariant = Literal["thumb", "web"]
+
+async def serve_stored_file(request: Request, file_record: UploadedFile, variant: Optional[str] = None) -> Response:
+    """Download response for a stored file, or for its resized image ``variant`` when one can be made."""
+    file_path = Path(settings.uploads_dir) / file_record.storage_filename
+    if variant:
+        derived = await derivatives.derivative_for(file_record, file_path, variant)
+        if derived is not None:
+            return await serve_upload(request, file_record, derived, variant=variant)
+    return await serve_upload(request, file_record, file_path)
+
+def record_token_file_upload(db: Session, context: TokenContext, token: str, uploaded: UploadedFile) -> None:
+    """Audit, activity and mirror refresh for a file a speaker uploaded with a token."""
+    seminar_id = uploaded.seminar_id
+    log_audit("FILE_UPLOAD", f"token:{token[:8]}", {"seminar_id": seminar_id, "file": uploaded.original_filename, "category": uploaded.file_category})
+    logger.info(f"File uploaded via token: {uploaded.original_filename} for seminar {seminar_id}")
     record_activity(
         db=db,
         event_type="FILE_UPLOADED",
-        summary=f"File uploaded by speaker: {file.filename}",
-        semester_plan_id=suggestion.semester_plan_id if suggestion else None,
+        summary=f"File uploaded by speaker: {uploaded.original_filename}",
+        semester_plan_id=context.plan_id,
         entity_type="file",
         entity_id=uploaded.id,
         actor=f"token:{token[:8]}",
@@ -3860,31 +4249,108 @@ async def upload_file_with_token(
     )
     db.commit()
     refresh_fallback_mirror(db)
+
+@app.post("/api/v1/seminars/speaker-tokens/{token}/upload", openapi_extra=UPLOAD_OPENAPI)
+async def upload_file_with_token(
+    token: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """Upload file using a speaker token (no regular auth required)."""
+    context = require_token(db, token, "info")
+    
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
+    
+    if not seminar_id:
+        raise HTTPException(status_code=400, detail="No seminar associated with this token")
+    
+    stored = await receive_upload(request, category_field="category")
+    uploaded = await run_in_threadpool(save_uploaded_file, stored, seminar_id, db)
+    record_token_file_upload(db, context, token, uploaded)
+    return {"success": True, "file_id": uploaded.id, "message": "File uploaded successfully"}
+
+def _token_upload_session(db: Session, token: str, session_id: str):
+    """Token context and the resumable upload session it owns (404 otherwise)."""
+    context = require_token(db, token, "info")
+    session = db.get(UploadSession, session_id)
+    if not session or session.seminar_id != context.seminar_id:
+        file_id = resumable.completed_upload(session_id, context.seminar_id)
+        if file_id is not None:
+            raise resumable.already_completed(file_id)
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return context, session
+
+@app.post("/api/v1/seminars/speaker-tokens/{token}/uploads", status_code=201)
+async def create_upload_session_with_token(token: str, body: UploadSessionCreate, db: Session = Depends(get_db)):
+    """Start a resumable upload; send chunks with PUT, then POST .../complete."""
+    context = require_token(db, token, "info")
+    if not context.seminar_id:
+        raise HTTPException(status_code=400, detail="No seminar associated with this token")
+    session = resumable.create_session(
+        db,
+        seminar_id=context.seminar_id,
+        filename=body.filename,
+        size=body.size,
+        content_type=body.content_type,
+        category=body.category,
+        sha256=body.sha256,
+        created_by=f"token:{token[:8]}",
+    )
+    return resumable.session_status(session)
+
+@app.get("/api/v1/seminars/speaker-tokens/{token}/uploads/{session_id}")
+async def get_upload_session_with_token(token: str, session_id: str, response: Response, db: Session = Depends(get_db)):
+    """Offset to resume a resumable upload from."""
+    _, session = _token_upload_session(db, token, session_id)
+    response.headers["Upload-Offset"] = str(session.received)
+    return resumable.session_status(session)
+
+@app.put("/api/v1/seminars/speaker-tokens/{token}/uploads/{session_id}")
+async def upload_chunk_with_token(
+    token: str,
+    session_id: str,
+    request: Request,
+    response: Response,
+    offset: int = Query(..., ge=0),
+    db: Session = Depends(get_db)
+):
+    """Append the raw request body to a resumable upload at ``offset``."""
+    _, session = _token_upload_session(db, token, session_id)
+    session = await resumable.append_chunk(request, db, session, offset)
+    response.headers["Upload-Offset"] = str(session.received)
+    return resumable.session_status(session)
+
+@app.post("/api/v1/seminars/speaker-tokens/{token}/uploads/{session_id}/complete")
+async def complete_upload_session_with_token(
+    token: str,
+    session_id: str,
+    body: Optional[UploadSessionComplete] = None,
+    db: Session = Depends(get_db)
+):
+    """Verify the SHA-256 of a fully received upload and store it as a seminar file."""
+    context, session = _token_upload_session(db, token, session_id)
+    seminar_id = session.seminar_id
+    uploaded = await resumable.complete_session(
+        db, session, body.sha256 if body else None, lambda stored: save_uploaded_file(stored, seminar_id, db)
+    )
+    record_token_file_upload(db, context, token, uploaded)
     return {"success": True, "file_id": uploaded.id, "message": "File uploaded successfully"}
 
+@app.delete("/api/v1/seminars/speaker-tokens/{token}/uploads/{session_id}")
+async def cancel_upload_session_with_token(token: str, session_id: str, db: Session = Depends(get_db)):
+    """Abandon a resumable upload and delete what was received."""
+    _, session = _token_upload_session(db, token, session_id)
+    await resumable.cancel_session(db, session)
+    return {"success": True}
+
 @app.get("/api/v1/seminars/speaker-tokens/{token}/files")
 async def list_files_with_token(token: str, db: Session = Depends(get_db)):
     """List files for a seminar using a speaker token (no regular auth required)."""
-    # Verify token
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
-    
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    context = require_token(db, token, "info")
     
-    # Get seminar_id from token or find it via suggestion
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
-        if suggestion and suggestion.speaker_id:
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
     
     if not seminar_id:
         return []  # No seminar yet, return empty list
@@ -3905,28 +4371,18 @@ async def list_files_with_token(token: str, db: Session = Depends(get_db)):
     ]
 
 @app.get("/api/v1/seminars/speaker-tokens/{token}/files/{file_id}/download")
-async def download_file_with_token(token: str, file_id: int, db: Session = Depends(get_db)):
+async def download_file_with_token(
+    token: str,
+    file_id: int,
+    request: Request,
+    variant: Optional[ImageVariant] = Query(None, description="Resized image: thumb or web"),
+    db: Session = Depends(get_db)
+):
     """Download a file using a speaker token (no regular auth required)."""
-    # Verify token
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
+    context = require_token(db, token, "info")
     
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
-    
-    # Get seminar_id from token
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
-        if suggestion and suggestion.speaker_id:
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
     
     if not seminar_id:
         raise HTTPException(status_code=404, detail="No seminar associated with this token")
@@ -3936,42 +4392,20 @@ async def download_file_with_token(token: str, file_id: int, db: Session = Depen
     if not file_record or file_record.seminar_id != seminar_id:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = Path(settings.uploads_dir) / file_record.storage_filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found on disk")
+    response = await serve_stored_file(request, file_record, variant)
     
     log_audit("FILE_DOWNLOAD", f"token:{token[:8]}", {"file_id": file_id, "filename": file_record.original_filename})
     logger.info(f"File downloaded via token: {file_record.original_filename}")
     
-    return FileResponse(
-        path=file_path,
-        filename=file_record.original_filename,
-        media_type=file_record.content_type
-    )
+    return response
 
 @app.delete("/api/v1/seminars/speaker-tokens/{token}/files/{file_id}")
 async def delete_file_with_token(token: str, file_id: int, db: Session = Depends(get_db)):
     """Delete a file using a speaker token (no regular auth required)."""
-    # Verify token
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == 'info',
-        SpeakerToken.expires_at > datetime.utcnow()
-    )
-    db_token = db.exec(statement).first()
+    context = require_token(db, token, "info")
     
-    if not db_token:
-        raise HTTPException(status_code=404, detail="Invalid or expired token")
-    
-    # Get seminar_id from token
-    seminar_id = db_token.seminar_id
-    if not seminar_id:
-        suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
-        if suggestion and suggestion.speaker_id:
-            stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id)
-            seminar = db.exec(stmt).first()
-            if seminar:
-                seminar_id = seminar.id
+    # Seminar from the token, or the speaker's seminar if the token has none
+    seminar_id = context.seminar_id
     
     if not seminar_id:
         raise HTTPException(status_code=404, detail="No seminar associated with this token")
@@ -3988,23 +4422,19 @@ async def delete_file_with_token(token: str, file_id: int, db: Session = Depends
         "seminar_id": file_record.seminar_id,
     }
     
-    # Delete from disk
-    file_path = Path(settings.uploads_dir) / file_record.storage_filename
-    if file_path.exists():
-        file_path.unlink()
-    
-    # Delete from database
+    # Delete from database, then the stored file once nothing references it
+    location = blobs.stored_location(file_record)
     db.delete(file_record)
     db.commit()
+    await run_in_threadpool(blobs.release, db, [location])
     
     log_audit("FILE_DELETE", f"token:{token[:8]}", {"file_id": file_id, "filename": file_record.original_filename})
     logger.info(f"File deleted via token: {file_record.original_filename}")
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
     record_activity(
         db=db,
         event_type="FILE_DELETED",
         summary=f"File deleted by speaker: {file_record.original_filename}",
-        semester_plan_id=suggestion.semester_plan_id if suggestion else None,
+        semester_plan_id=context.plan_id,
         entity_type="file",
         entity_id=file_id,
         actor=f"token:{token[:8]}",
@@ -4021,11 +4451,10 @@ async def delete_file_with_token(token: str, file_id: int, db: Session = Depends
     
     return {"success": True, "message": "File deleted successfully"}
 
-@app.post("/api/seminars/{seminar_id}/files")
+@app.post("/api/seminars/{seminar_id}/files", openapi_extra=UPLOAD_OPENAPI)
 async def upload_file(
     seminar_id: int,
-    file: UploadFile = File(...),
-    category: Optional[str] = Form(None),
+    request: Request,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
@@ -4033,14 +4462,15 @@ async def upload_file(
     if not seminar:
         raise HTTPException(status_code=404, detail="Seminar not found")
     
-    uploaded = save_uploaded_file(file, seminar_id, category, db)
-    log_audit("FILE_UPLOAD", user.get('id'), {"seminar_id": seminar_id, "file": file.filename, "category": category})
-    logger.info(f"File uploaded: {file.filename} for seminar {seminar_id} by {user.get('id')}")
+    stored = await receive_upload(request, category_field="category")
+    uploaded = await run_in_threadpool(save_uploaded_file, stored, seminar_id, db)
+    log_audit("FILE_UPLOAD", user.get('id'), {"seminar_id": seminar_id, "file": uploaded.original_filename, "category": uploaded.file_category})
+    logger.info(f"File uploaded: {uploaded.original_filename} for seminar {seminar_id} by {user.get('id')}")
     slot = db.exec(select(SeminarSlot).where(SeminarSlot.assigned_seminar_id == seminar_id)).first()
     record_activity(
         db=db,
         event_type="FILE_UPLOADED",
-        summary=f"File uploaded: {file.filename}",
+        summary=f"File uploaded: {uploaded.original_filename}",
         semester_plan_id=slot.semester_plan_id if slot else None,
         entity_type="file",
         entity_id=uploaded.id,
@@ -4068,27 +4498,24 @@ async def list_files(seminar_id: int, db: Session = Depends(get_db), user: dict
     return db.exec(statement).all()
 
 @app.get("/api/files/{file_id}/download")
-async def download_file(file_id: int, db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+async def download_file(
+    file_id: int,
+    request: Request,
+    variant: Optional[ImageVariant] = Query(None, description="Resized image: thumb or web"),
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
     file_record = db.get(UploadedFile, file_id)
     if not file_record:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = Path(settings.uploads_dir) / file_record.storage_filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found on disk")
-    
-    return FileResponse(
-        path=file_path,
-        filename=file_record.original_filename,
-        media_type=file_record.content_type
-    )
+    return await serve_stored_file(request, file_record, variant)
 
 # Additional upload endpoint for frontend compatibility
-@app.post("/api/v1/seminars/seminars/{seminar_id}/upload")
+@app.post("/api/v1/seminars/seminars/{seminar_id}/upload", openapi_extra=UPLOAD_OPENAPI)
 async def upload_file_v1(
     seminar_id: int,
-    file: UploadFile = File(...),
-    file_category: Optional[str] = Form(None),
+    request: Request,
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
@@ -4097,14 +4524,15 @@ async def upload_file_v1(
     if not seminar:
         raise HTTPException(status_code=404, detail="Seminar not found")
     
-    uploaded = save_uploaded_file(file, seminar_id, file_category, db)
-    log_audit("FILE_UPLOAD", user.get('id'), {"seminar_id": seminar_id, "file": file.filename, "category": file_category})
-    logger.info(f"File uploaded: {file.filename} for seminar {seminar_id} by {user.get('id')}")
+    stored = await receive_upload(request, category_field="file_category")
+    uploaded = await run_in_threadpool(save_uploaded_file, stored, seminar_id, db)
+    log_audit("FILE_UPLOAD", user.get('id'), {"seminar_id": seminar_id, "file": uploaded.original_filename, "category": uploaded.file_category})
+    logger.info(f"File uploaded: {uploaded.original_filename} for seminar {seminar_id} by {user.get('id')}")
     slot = db.exec(select(SeminarSlot).where(SeminarSlot.assigned_seminar_id == seminar_id)).first()
     record_activity(
         db=db,
         event_type="FILE_UPLOADED",
-        summary=f"File uploaded: {file.filename}",
+        summary=f"File uploaded: {uploaded.original_filename}",
         semester_plan_id=slot.semester_plan_id if slot else None,
         entity_type="file",
         entity_id=uploaded.id,
@@ -4164,14 +4592,11 @@ async def delete_file_v1(
         "seminar_id": file_record.seminar_id,
     }
     
-    # Delete from disk
-    file_path = Path(settings.uploads_dir) / file_record.storage_filename
-    if file_path.exists():
-        file_path.unlink()
-    
-    # Delete from database
+    # Delete from database, then the stored file once nothing references it
+    location = blobs.stored_location(file_record)
     db.delete(file_record)
     db.commit()
+    await run_in_threadpool(blobs.release, db, [location])
     slot = db.exec(select(SeminarSlot).where(SeminarSlot.assigned_seminar_id == seminar_id)).first()
     record_activity(
         db=db,
@@ -4197,35 +4622,99 @@ async def delete_file_v1(
 async def download_file_v1(
     seminar_id: int,
     file_id: int,
+    request: Request,
     access_code: Optional[str] = Query(None),
     token: Optional[str] = Query(None),
+    variant: Optional[ImageVariant] = Query(None, description="Resized image: thumb or web"),
     db: Session = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
-    """Download a file (frontend compatibility endpoint)."""
+    """Download a file (frontend compatibility endpoint); supports Range, If-None-Match and ?variant=."""
     file_record = db.get(UploadedFile, file_id)
     if not file_record or file_record.seminar_id != seminar_id:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = Path(settings.uploads_dir) / file_record.storage_filename
-    if not file_path.exists():
-        logger.error(f"File not found on disk: {file_path}")
-        raise HTTPException(status_code=404, detail="File not found on disk")
+    response = await serve_stored_file(request, file_record, variant)
     
     log_audit("FILE_DOWNLOAD", user.get('id'), {"file_id": file_id, "filename": file_record.original_filename})
     logger.info(f"File downloaded: {file_record.original_filename} by {user.get('id')}")
     
-    return FileResponse(
-        path=file_path,
-        filename=file_record.original_filename,
-        media_type=file_record.content_type
+    return response
+
+def files_archive_response(seminars: List[Seminar], files: List[UploadedFile], label: str) -> StreamingResponse:
+    """Stream a ZIP of ``files``, one folder per seminar."""
+    folders = {seminar.id: seminar_folder(seminar) for seminar in seminars}
+    entries = archive_entries(files, folders)
+    filename = archive_filename(label)
+    return StreamingResponse(
+        iter_zip(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(filename), "Cache-Control": "no-store"},
     )
 
+@app.get("/api/v1/seminars/seminars/{seminar_id}/files/archive")
+async def download_seminar_files_archive(
+    seminar_id: int,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """Download all files of a seminar as one ZIP, streamed as it is built."""
+    seminar = db.get(Seminar, seminar_id)
+    if not seminar:
+        raise HTTPException(status_code=404, detail="Seminar not found")
+    files = db.exec(
+        select(UploadedFile).where(UploadedFile.seminar_id == seminar_id).order_by(UploadedFile.id)
+    ).all()
+    log_audit("FILES_ARCHIVE_DOWNLOAD", user.get('id'), {"seminar_id": seminar_id, "files": len(files)})
+    return files_archive_response([seminar], files, f"seminar-{seminar_id}-files")
+
+@app.get("/api/v1/seminars/semester-plans/{plan_id}/files/archive")
+async def download_plan_files_archive(
+    plan_id: int,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user)
+):
+    """Download the files of every seminar assigned to a slot in the plan as one ZIP."""
+    plan = db.get(SemesterPlan, plan_id)
+    if not plan:
+        raise HTTPException(status_code=404, detail="Semester plan not found")
+    seminar_ids = select(SeminarSlot.assigned_seminar_id).where(
+        SeminarSlot.semester_plan_id == plan_id, SeminarSlot.assigned_seminar_id.is_not(None)
+    )
+    seminars = db.exec(select(Seminar).where(Seminar.id.in_(seminar_ids))).all()
+    files = db.exec(
+        select(UploadedFile)
+        .where(UploadedFile.seminar_id.in_(seminar_ids))
+        .order_by(UploadedFile.seminar_id, UploadedFile.id)
+    ).all()
+    log_audit("FILES_ARCHIVE_DOWNLOAD", user.get('id'), {"plan_id": plan_id, "seminars": len(seminars), "files": len(files)})
+    return files_archive_response(seminars, files, f"{plan.name}-files")
+
 # ============================================================================
 # API Routes - Activity, Workflow, Faculty Form, and Speaker Status
 # ============================================================================
 
-@app.get("/api/v1/seminars/activity", response_model=List[ActivityEventResponse])
+def activity_events_json(rows) -> bytes:
+    """Encode activity events; details_json is JSON we wrote ourselves, spliced in as-is."""
+    return json_array(
+        splice_raw_field(
+            dumps({
+                "id": row.id,
+                "semester_plan_id": row.semester_plan_id,
+                "event_type": row.event_type,
+                "summary": row.summary,
+                "entity_type": row.entity_type,
+                "entity_id": row.entity_id,
+                "actor": row.actor,
+                "created_at": row.created_at,
+            }),
+            "details",
+            row.details_json,
+        )
+        for row in rows
+    )
+
+@app.get("/api/v1/seminars/activity", response_model=List[ActivityEventResponse], dependencies=[Depends(versioned("activity_events"))])
 async def list_activity_events(
     plan_id: Optional[int] = Query(None),
     limit: int = Query(100, ge=1, le=500),
@@ -4237,20 +4726,29 @@ async def list_activity_events(
         stmt = stmt.where(ActivityEvent.semester_plan_id == plan_id)
     stmt = stmt.order_by(ActivityEvent.created_at.desc()).limit(limit)
     rows = db.exec(stmt).all()
-    return [
-        ActivityEventResponse(
-            id=row.id,
-            semester_plan_id=row.semester_plan_id,
-            event_type=row.event_type,
-            summary=row.summary,
-            entity_type=row.entity_type,
-            entity_id=row.entity_id,
-            actor=row.actor,
-            details=json.loads(row.details_json) if row.details_json else None,
-            created_at=row.created_at,
-        )
-        for row in rows
-    ]
+    return RawJSONResponse(activity_events_json(rows))
+
+@app.get("/api/v1/seminars/search")
+async def search_v1(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[str] = Query(None, description="Comma-separated: seminar, speaker, suggestion"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user),
+):
+    """Ranked full-text search across seminars, speakers and speaker suggestions."""
+    selected = None
+    if types:
+        selected = [t.strip() for t in types.split(",") if t.strip()]
+        unknown = [t for t in selected if t not in fulltext.SEARCH_INDEXES]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown search type(s): {', '.join(unknown)}")
+    try:
+        results = fulltext.search(db, q, types=selected, limit=limit)
+    except OperationalError as e:
+        logger.error(f"Full-text search failed: {e}")
+        raise HTTPException(status_code=503, detail="Search index unavailable; rebuild it via /api/admin/db/search/rebuild")
+    return {"query": q, "results": results}
 
 @app.get("/api/v1/seminars/system/mode")
 async def seminars_system_mode(user: dict = Depends(get_current_user)):
@@ -4259,6 +4757,99 @@ async def seminars_system_mode(user: dict = Depends(get_current_user)):
         "legacy_write_enabled": not settings.feature_semester_plan_v2,
     }
 
+PLAN_LIST = TypeAdapter(List[SemesterPlanResponse])
+ROOM_LIST = TypeAdapter(List[RoomResponse])
+
+@app.get("/api/v1/seminars/dashboard/stats")
+async def dashboard_stats_v1(db: Session = Depends(get_db), user: dict = Depends(get_current_user)):
+    """Dashboard metrics read from the materialized counters (no row scans)."""
+    return {**dashboard_counts(db), "plans": plan_fill_rates(db)}
+
+@app.get("/api/v1/seminars/bootstrap", dependencies=[Depends(versioned(*VERSIONED_TABLES))])
+async def bootstrap_v1(
+    plan_id: Optional[int] = Query(None, description="Include this plan's planning board; scopes suggestions and activity"),
+    activity_limit: int = Query(50, ge=0, le=500),
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user),
+):
+    """Initial admin UI state in one round trip and one read snapshot.
+
+    Each section has the same shape as its own endpoint (auth/me, system/mode,
+    semester-plans, seminars, speakers, rooms, speaker-suggestions,
+    planning-board and activity), so the client can seed its caches from it.
+    """
+    with read_transaction(db):
+        plan = None
+        if plan_id is not None:
+            plan = db.get(SemesterPlan, plan_id)
+            if not plan:
+                raise HTTPException(status_code=404, detail="Semester plan not found")
+
+        plans = db.exec(select(SemesterPlan).order_by(SemesterPlan.created_at.desc())).all()
+        seminars = db.exec(_seminar_list_statement().order_by(Seminar.date, Seminar.id)).all()
+        speakers = db.exec(select(Speaker).order_by(Speaker.name, Speaker.id)).all()
+        rooms = db.exec(select(Room).order_by(Room.name, Room.id)).all()
+
+        suggestions_stmt = select(SpeakerSuggestion).options(selectinload(SpeakerSuggestion.availability))
+        activity_stmt = select(ActivityEvent)
+        if plan is not None:
+            suggestions_stmt = suggestions_stmt.where(SpeakerSuggestion.semester_plan_id == plan.id)
+            activity_stmt = activity_stmt.where(ActivityEvent.semester_plan_id == plan.id)
+        suggestions = db.exec(
+            suggestions_stmt.order_by(SpeakerSuggestion.created_at.desc(), SpeakerSuggestion.id.desc())
+        ).all()
+        activity = db.exec(activity_stmt.order_by(ActivityEvent.created_at.desc()).limit(activity_limit)).all()
+
+        body = json_object({
+            "user": dumps({
+                "id": user.get("id", "unknown"),
+                "role": user.get("role", "admin"),
+                "name": user.get("name", "User"),
+            }),
+            "system_mode": dumps({
+                "feature_semester_plan_v2": settings.feature_semester_plan_v2,
+                "legacy_write_enabled": not settings.feature_semester_plan_v2,
+            }),
+            "semester_plans": PLAN_LIST.dump_json(PLAN_LIST.validate_python(plans, from_attributes=True)),
+            "seminars": SEMINAR_LIST.dump_json(SEMINAR_LIST.validate_python(seminars, from_attributes=True)),
+            "speakers": SPEAKER_LIST.dump_json(SPEAKER_LIST.validate_python(speakers, from_attributes=True)),
+            "rooms": ROOM_LIST.dump_json(ROOM_LIST.validate_python(rooms, from_attributes=True)),
+            "speaker_suggestions": dumps([_suggestion_payload(s) for s in suggestions]),
+            "planning_board": dumps(build_planning_board(db, plan) if plan is not None else None),
+            "activity": activity_events_json(activity),
+        })
+    return RawJSONResponse(body)
+
+def speaker_workflow_funnel(db: Session, plan_id: int) -> dict:
+    """Count a plan's speakers at each status page step with one GROUP BY.
+
+    The CASE mirrors build_speaker_status; suggestions without a workflow row
+    are still waiting for availability.
+    """
+    step = case(
+        (SpeakerWorkflow.proposal_approved == True, "proposal_approved"),  # noqa: E712
+        (SpeakerWorkflow.proposal_submitted == True, "info_received"),  # noqa: E712
+        (SpeakerWorkflow.speaker_notified_of_date == True, "date_assigned"),  # noqa: E712
+        else_="waiting_availability",
+    )
+    rows = db.exec(
+        select(step, func.count())
+        .select_from(SpeakerSuggestion)
+        .outerjoin(SpeakerWorkflow, SpeakerWorkflow.suggestion_id == SpeakerSuggestion.id)
+        .where(SpeakerSuggestion.semester_plan_id == plan_id)
+        .group_by(step)
+    ).all()
+    counts = dict(rows)
+    return {code: counts.get(code, 0) for code in SPEAKER_STATUS_STEPS}
+
+@app.get("/api/v1/seminars/semester-plans/{plan_id}/speaker-workflows/funnel")
+async def get_speaker_workflow_funnel(
+    plan_id: int,
+    db: Session = Depends(get_db),
+    user: dict = Depends(get_current_user),
+):
+    return speaker_workflow_funnel(db, plan_id)
+
 @app.get("/api/v1/seminars/semester-plans/{plan_id}/speaker-workflows")
 async def list_speaker_workflows(
     plan_id: int,
@@ -4270,9 +4861,18 @@ async def list_speaker_workflows(
         .where(SpeakerSuggestion.semester_plan_id == plan_id)
         .order_by(SpeakerSuggestion.created_at.desc())
     ).all()
+    workflows = {
+        w.suggestion_id: w
+        for w in db.exec(
+            select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id.in_([s.id for s in suggestions]))
+        ).all()
+    }
     items = []
     for suggestion in suggestions:
-        workflow = get_or_create_workflow(db, suggestion.id)
+        # Rows are created by the first workflow PATCH; reads use the defaults without writing
+        workflow = workflows.get(suggestion.id) or SpeakerWorkflow(
+            suggestion_id=suggestion.id, updated_at=suggestion.created_at
+        )
         status_payload = build_speaker_status(workflow, suggestion)
         items.append(
             {
@@ -4294,7 +4894,7 @@ async def list_speaker_workflows(
                 "status_page": status_payload,
             }
         )
-    return {"items": items}
+    return {"items": items, "funnel": speaker_workflow_funnel(db, plan_id)}
 
 @app.patch("/api/v1/seminars/speaker-suggestions/{suggestion_id}/workflow")
 async def update_speaker_workflow(
@@ -4388,301 +4988,123 @@ async def create_status_token(
     return {"link": f"/speaker/status/{token}", "token": token}
 
 @app.get("/speaker/status/{token}", response_class=HTMLResponse)
-async def speaker_status_page(token: str, db: Session = Depends(get_db)):
-    statement = select(SpeakerToken).where(
-        SpeakerToken.token == token,
-        SpeakerToken.token_type == "status",
+async def speaker_status_page(token: str, request: Request):
+    """Public status page; the shell polls /api/v1/seminars/speaker-tokens/{token}/status."""
+    return SPEAKER_STATUS_SHELL.response(request.headers)
+
+def _get_or_create_speaker_token(
+    db: Session,
+    suggestion_id: int,
+    token_type: str,
+    seminar_id: Optional[int] = None,
+    match_seminar: bool = False,
+) -> SpeakerToken:
+    stmt = select(SpeakerToken).where(
+        SpeakerToken.suggestion_id == suggestion_id,
+        SpeakerToken.token_type == token_type,
         SpeakerToken.expires_at > datetime.utcnow(),
     )
-    db_token = db.exec(statement).first()
-    if not db_token:
-        return HTMLResponse(content=get_invalid_token_html(), status_code=404)
-    suggestion = db.get(SpeakerSuggestion, db_token.suggestion_id)
-    if not suggestion:
-        return HTMLResponse(content=get_invalid_token_html(), status_code=404)
-    
-    workflow_stmt = select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id == suggestion.id)
-    workflow = db.exec(workflow_stmt).first()
-    status_payload = build_speaker_status(workflow, suggestion)
-    
-    # Get seminar details tied to this suggestion (for ticket_purchase_info display)
-    seminar = None
-    seminar_details = None
+    if match_seminar:
+        stmt = stmt.where(SpeakerToken.seminar_id == seminar_id)
+    existing = db.exec(stmt.order_by(SpeakerToken.created_at.desc())).first()
+    if existing:
+        return existing
+    created = SpeakerToken(
+        token=generate_token(),
+        suggestion_id=suggestion_id,
+        token_type=token_type,
+        seminar_id=seminar_id,
+        expires_at=datetime.utcnow() + timedelta(days=90),
+    )
+    db.add(created)
+    db.commit()
+    db.refresh(created)
+    return created
 
+def _status_seminar_for_suggestion(db: Session, suggestion: SpeakerSuggestion) -> Optional[Seminar]:
     # 1) Prefer seminar from most recent info token for this suggestion
-    info_token_stmt = select(SpeakerToken).where(
-        SpeakerToken.suggestion_id == suggestion.id,
-        SpeakerToken.token_type == "info",
-        SpeakerToken.seminar_id.isnot(None),
-    ).order_by(SpeakerToken.created_at.desc())
-    info_token = db.exec(info_token_stmt).first()
+    info_token = db.exec(
+        select(SpeakerToken).where(
+            SpeakerToken.suggestion_id == suggestion.id,
+            SpeakerToken.token_type == "info",
+            SpeakerToken.seminar_id.isnot(None),
+        ).order_by(SpeakerToken.created_at.desc())
+    ).first()
     if info_token and info_token.seminar_id:
         seminar = db.get(Seminar, info_token.seminar_id)
+        if seminar:
+            return seminar
 
     # 2) Fallback: seminar assigned to slot for this suggestion
-    if not seminar:
-        slot_stmt = select(SeminarSlot).where(
+    assigned_slot = db.exec(
+        select(SeminarSlot).where(
             SeminarSlot.assigned_suggestion_id == suggestion.id,
             SeminarSlot.assigned_seminar_id.isnot(None),
         ).order_by(SeminarSlot.date.desc())
-        assigned_slot = db.exec(slot_stmt).first()
-        if assigned_slot and assigned_slot.assigned_seminar_id:
-            seminar = db.get(Seminar, assigned_slot.assigned_seminar_id)
+    ).first()
+    if assigned_slot and assigned_slot.assigned_seminar_id:
+        seminar = db.get(Seminar, assigned_slot.assigned_seminar_id)
+        if seminar:
+            return seminar
 
     # 3) Last fallback: latest seminar for speaker
-    if not seminar and suggestion.speaker_id:
-        seminar_stmt = select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id).order_by(Seminar.date.desc())
-        seminar = db.exec(seminar_stmt).first()
+    if suggestion.speaker_id:
+        return db.exec(
+            select(Seminar).where(Seminar.speaker_id == suggestion.speaker_id).order_by(Seminar.date.desc())
+        ).first()
+    return None
+
+@app.get("/api/v1/seminars/speaker-tokens/{token}/status")
+async def get_speaker_status_data(token: str, db: Session = Depends(get_db)):
+    """Data behind the public status page (speaker, seminar, progress step and action links)."""
+    context = require_token(db, token, "status")
+    suggestion = db.get(SpeakerSuggestion, context.suggestion_id)
+    if not suggestion:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
 
-    if seminar:
-        details_stmt = select(SeminarDetails).where(SeminarDetails.seminar_id == seminar.id)
-        seminar_details = db.exec(details_stmt).first()
-    
-    # Build status steps
-    steps = [
-        ("1. Waiting for Date Availability", status_payload['step'] >= 1, status_payload['step'] == 1),
-        ("2. Date Assigned", status_payload['step'] >= 2, status_payload['step'] == 2),
-        ("3. Information Received", status_payload['step'] >= 3, status_payload['step'] == 3),
-        ("4. Proposal Approved", status_payload['step'] >= 4, status_payload['step'] == 4),
-    ]
-    
-    steps_html = "".join(
-        f"<div class='step {'completed' if completed else ''} {'active' if active else ''}'>{label}</div>"
-        for label, completed, active in steps
-    )
-    
-    # Warning box - only show if proposal not approved
-    warning_box = ""
-    if status_payload['step'] < 4:
-        warning_box = """
-        <div class='warning-box'>
-            <div class='warning-title'>⚠️ Ticket Purchase Timing</div>
-            <p>Your seminar is confirmed and you can plan confidently for it to happen. For bureaucratic reimbursement reasons only, <span style='font-weight:700;color:#dc3545;'>please wait for proposal approval before purchasing flight/train tickets.</span></p>
-        </div>
-        """
-    
-    # Get tokens for action links
-    availability_token = None
-    info_token = None
-    
-    # Get availability token (for step 1)
-    avail_stmt = select(SpeakerToken).where(
-        SpeakerToken.suggestion_id == suggestion.id,
-        SpeakerToken.token_type == "availability",
-        SpeakerToken.expires_at > datetime.utcnow(),
-    ).order_by(SpeakerToken.created_at.desc())
-    avail_token = db.exec(avail_stmt).first()
-    if not avail_token:
-        avail_token = SpeakerToken(
-            token=generate_token(),
-            suggestion_id=suggestion.id,
-            token_type="availability",
-            expires_at=datetime.utcnow() + timedelta(days=90),
-        )
-        db.add(avail_token)
-        db.commit()
-        db.refresh(avail_token)
-    availability_token = avail_token.token
-    
-    # Get info token (for step 2)
-    info_token_obj = None
-    if seminar:
-        info_stmt = select(SpeakerToken).where(
-            SpeakerToken.suggestion_id == suggestion.id,
-            SpeakerToken.token_type == "info",
-            SpeakerToken.seminar_id == seminar.id,
-            SpeakerToken.expires_at > datetime.utcnow(),
-        ).order_by(SpeakerToken.created_at.desc())
-        info_token_obj = db.exec(info_stmt).first()
-    else:
-        info_stmt = select(SpeakerToken).where(
-            SpeakerToken.suggestion_id == suggestion.id,
-            SpeakerToken.token_type == "info",
-            SpeakerToken.expires_at > datetime.utcnow(),
-        ).order_by(SpeakerToken.created_at.desc())
-        info_token_obj = db.exec(info_stmt).first()
-
-    if not info_token_obj:
-        info_token_obj = SpeakerToken(
-            token=generate_token(),
-            suggestion_id=suggestion.id,
-            token_type="info",
-            seminar_id=seminar.id if seminar else None,
-            expires_at=datetime.utcnow() + timedelta(days=90),
-        )
-        db.add(info_token_obj)
-        db.commit()
-        db.refresh(info_token_obj)
-    info_token = info_token_obj.token
-    
-    # Build action links based on current step
-    action_links_html = ""
+    workflow = db.exec(
+        select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id == suggestion.id)
+    ).first()
+    status_payload = build_speaker_status(workflow, suggestion)
+    seminar = _status_seminar_for_suggestion(db, suggestion)
 
-    # Ticket purchase info (only used in step 4 approved view)
     ticket_purchase_info = None
-    try:
-        if seminar_details:
-            ticket_purchase_info = getattr(seminar_details, 'ticket_purchase_info', None)
-    except Exception:
-        pass  # Column might not exist yet
-    
-    if status_payload['step'] == 1:
-        action_links_html = f"""
-        <div class='action-section'>
-            <h3>📝 Action Required</h3>
-            <p>Please submit your available dates for the seminar:</p>
-            <a href='/speaker/availability/{availability_token}' class='action-link primary'>Submit Availability</a>
-        </div>
-        """
-    elif status_payload['step'] == 2:
-        action_links_html = f"""
-        <div class='action-section'>
-            <h3>📝 Action Required</h3>
-            <p>Please submit your seminar information and proposal:</p>
-            <a href='/speaker/info/{info_token}' class='action-link primary'>Submit Information</a>
-        </div>
-        """
-    elif status_payload['step'] == 3:
-        action_links_html = """
-        <div class='action-section waiting'>
-            <h3>⏳ Waiting for Review</h3>
-            <p>Your information has been received and is being reviewed. Your seminar remains confirmed and can be planned normally; only ticket purchase must wait until approval.</p>
-        </div>
-        """
-    elif status_payload['step'] == 4:
-        ticket_instructions_html = ""
-        if ticket_purchase_info and str(ticket_purchase_info).strip():
-            ticket_instructions_html = f"""
-            <div class='ticket-info'>{html_escape(str(ticket_purchase_info))}</div>
-            """
-
-        action_links_html = f"""
-        <div class='action-section approved'>
-            <h3>✅ Proposal Approved</h3>
-            <p>Your proposal has been approved! You can now purchase your travel tickets.</p>
-            {ticket_instructions_html}
-        </div>
-        """
-
-    # Keep separate ticket info section only for non-approved flow
-    ticket_info_html = ""
-    if status_payload['step'] != 4 and ticket_purchase_info and str(ticket_purchase_info).strip():
-        ticket_info_html = f"""
-        <div class='info-section'>
-            <h3>🎫 Ticket Purchase Instructions</h3>
-            <div class='ticket-info'>{html_escape(str(ticket_purchase_info))}</div>
-        </div>
-        """
-    
-    # Seminar info
-    seminar_info_html = ""
     if seminar:
-        seminar_info_html = f"""
-        <div class='info-section'>
-            <h3>📅 Seminar Information</h3>
-            <div class='info-row'><span class='label'>Title:</span> <span class='value'>{seminar.title or 'TBD'}</span></div>
-            <div class='info-row'><span class='label'>Date:</span> <span class='value'>{seminar.date}</span></div>
-            <div class='info-row'><span class='label'>Time:</span> <span class='value'>{seminar.start_time or 'TBD'} - {seminar.end_time or 'TBD'}</span></div>
-        </div>
-        """
-    
-    # Speaker info
-    speaker_info_html = f"""
-    <div class='info-section'>
-        <h3>👤 Speaker Information</h3>
-        <div class='info-row'><span class='label'>Name:</span> <span class='value'>{suggestion.speaker_name}</span></div>
-        <div class='info-row'><span class='label'>Affiliation:</span> <span class='value'>{suggestion.speaker_affiliation or 'TBD'}</span></div>
-        <div class='info-row'><span class='label'>Topic:</span> <span class='value'>{suggestion.suggested_topic or 'TBD'}</span></div>
-    </div>
-    """
-    
-    header_html = get_external_header_with_logos()
-    
-    # Remove unused edit_link variable
-    edit_link = ""
-    
-    return HTMLResponse(
-        content=f"""<!doctype html>
-<html lang='en'><head><meta charset='utf-8'><meta name='viewport' content='width=device-width,initial-scale=1'>
-<title>Seminar Status - {suggestion.speaker_name}</title><style>
-:root{{--primary:#003366;--success:#28a745;--warning:#ffc107;--danger:#dc3545;--gray-100:#f8f9fa;--gray-200:#e9ecef;--gray-600:#6c757d;}}
-*{{box-sizing:border-box;}}
-body{{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#f4f6f8;padding:24px;margin:0;line-height:1.6;}}
-.header{{background:var(--primary);color:white;padding:24px 20px;text-align:center;margin:-24px -24px 24px -24px;}}
-.header-logos{{display:flex;flex-direction:column;align-items:center;gap:12px;}}
-.header-logos-inner{{display:flex;align-items:center;justify-content:center;gap:24px;flex-wrap:wrap;}}
-.header .logo-wrap{{background:white;padding:16px 28px;border-radius:12px;box-shadow:0 2px 8px rgba(0,0,0,0.15);}}
-.header .logo{{height:72px;width:auto;object-fit:contain;display:block;}}
-.header .logo-um{{max-height:80px;}}
-.header .logo-econ{{max-height:72px;}}
-.header h1{{font-size:26px;font-weight:600;margin:0;}}
-.header .subtitle{{font-size:15px;opacity:.9;margin-top:6px;}}
-.container{{max-width:800px;margin:0 auto;}}
-.card{{background:#fff;border-radius:12px;padding:28px;box-shadow:0 2px 12px rgba(0,0,0,0.08);margin-bottom:24px;}}
-.warning-box{{background:#fff3cd;border:2px solid #ffc107;border-radius:8px;padding:20px;margin-bottom:24px;}}
-.warning-box .warning-title{{color:#856404;font-weight:bold;font-size:18px;margin-bottom:8px;}}
-.warning-box p{{color:#856404;margin:0;}}
-.status-steps{{display:flex;gap:8px;margin-bottom:24px;flex-wrap:wrap;}}
-.step{{flex:1;min-width:140px;padding:16px 12px;background:var(--gray-200);border-radius:8px;text-align:center;font-size:14px;font-weight:500;color:var(--gray-600);}}
-.step.completed{{background:#d4edda;color:#155724;}}
-.step.active{{background:var(--primary);color:white;box-shadow:0 2px 8px rgba(0,51,102,0.3);}}
-.status-message{{background:var(--gray-100);border-left:4px solid var(--primary);padding:16px 20px;border-radius:0 8px 8px 0;margin-bottom:24px;}}
-.status-message h2{{margin:0 0 8px 0;font-size:20px;color:var(--primary);}}
-.status-message p{{margin:0;color:var(--gray-600);}}
-.info-section{{margin-bottom:24px;padding-bottom:24px;border-bottom:1px solid var(--gray-200);}}
-.info-section:last-child{{border-bottom:none;margin-bottom:0;padding-bottom:0;}}
-.info-section.approved{{background:#d4edda;border:1px solid #28a745;border-radius:8px;padding:20px;}}
-.info-section h3{{margin:0 0 16px 0;font-size:16px;color:var(--primary);text-transform:uppercase;letter-spacing:0.5px;}}
-.info-section.approved h3{{color:#155724;}}
-.info-row{{display:flex;margin-bottom:12px;}}
-.info-row:last-child{{margin-bottom:0;}}
-.info-row .label{{width:120px;font-weight:600;color:var(--gray-600);flex-shrink:0;}}
-.info-row .value{{flex:1;color:#333;}}
-.ticket-info{{background:white;border:1px solid #28a745;border-radius:6px;padding:16px;font-size:15px;line-height:1.8;white-space:pre-wrap;}}
-.action-section{{background:#e7f3ff;border:1px solid #0066cc;border-radius:8px;padding:20px;margin-bottom:24px;}}
-.action-section.waiting{{background:#fff3cd;border-color:#ffc107;}}
-.action-section.approved{{background:#d4edda;border-color:#28a745;}}
-.action-section h3{{margin:0 0 12px 0;font-size:18px;color:#003366;}}
-.action-section.waiting h3{{color:#856404;}}
-.action-section.approved h3{{color:#155724;}}
-.action-section p{{margin:0 0 16px 0;color:#333;}}
-.action-link{{display:inline-block;background:var(--primary);color:white;padding:14px 28px;border-radius:8px;text-decoration:none;font-weight:600;font-size:16px;transition:all 0.2s;box-shadow:0 2px 4px rgba(0,51,102,0.2);}}
-.action-link:hover{{background:#004080;transform:translateY(-1px);box-shadow:0 4px 8px rgba(0,51,102,0.3);}}
-.action-link.primary{{background:#0066cc;}}
-.action-link.primary:hover{{background:#0052a3;}}
-.footer{{text-align:center;color:var(--gray-600);font-size:14px;margin-top:24px;}}
-@media (max-width: 600px){{.step{{min-width:100%;}}.info-row{{flex-direction:column;}}.info-row .label{{width:auto;margin-bottom:4px;}}}}
-</style></head>
-<body>
-<div class='header'>{header_html}</div>
-<div class='container'>
-    {warning_box}
-    
-    <div class='card'>
-        <div class='status-steps'>
-            {steps_html}
-        </div>
-        
-        <div class='status-message'>
-            <h2>{status_payload['title']}</h2>
-            <p>{status_payload['message']}</p>
-        </div>
-    </div>
-    
-    {action_links_html}
-    
-    {ticket_info_html}
-    
-    <div class='card'>
-        {speaker_info_html}
-        {seminar_info_html}
-    </div>
-    
-    <p class='footer'>This page updates automatically when your seminar status changes.<br>Last updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}</p>
-</div>
-</body></html>"""
+        seminar_details = db.exec(
+            select(SeminarDetails).where(SeminarDetails.seminar_id == seminar.id)
+        ).first()
+        info = getattr(seminar_details, "ticket_purchase_info", None) if seminar_details else None
+        if info and str(info).strip():
+            ticket_purchase_info = str(info)
+
+    availability_token = _get_or_create_speaker_token(db, suggestion.id, "availability")
+    info_token = _get_or_create_speaker_token(
+        db,
+        suggestion.id,
+        "info",
+        seminar_id=seminar.id if seminar else None,
+        match_seminar=seminar is not None,
     )
 
+    return {
+        "status": status_payload,
+        "speaker": {
+            "name": suggestion.speaker_name,
+            "affiliation": suggestion.speaker_affiliation,
+            "topic": suggestion.suggested_topic,
+        },
+        "seminar": {
+            "title": seminar.title,
+            "date": seminar.date.isoformat() if seminar.date else None,
+            "start_time": seminar.start_time,
+            "end_time": seminar.end_time,
+        } if seminar else None,
+        "ticket_purchase_info": ticket_purchase_info,
+        "availability_link": f"/speaker/availability/{availability_token.token}",
+        "info_link": f"/speaker/info/{info_token.token}",
+        "updated_at": datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'),
+    }
+
 @app.get("/faculty/suggest-speaker/{plan_id}", response_class=HTMLResponse)
 async def faculty_suggest_speaker_page(plan_id: int, db: Session = Depends(get_db)):
     plan = db.get(SemesterPlan, plan_id)
@@ -4876,42 +5298,26 @@ async def external_stats(secret: str, db: Session = Depends(get_db)):
     if secret != settings.api_secret:
         raise HTTPException(status_code=401, detail="Invalid secret")
     
-    today = date_type.today()
-    
-    upcoming_stmt = select(Seminar).where(Seminar.date >= today)
-    upcoming_count = len(db.exec(upcoming_stmt).all())
-    
-    speakers_stmt = select(Speaker)
-    speakers_count = len(db.exec(speakers_stmt).all())
-    
-    pending_stmt = select(Seminar).where(
-        (Seminar.date >= today) & 
-        ((Seminar.room_booked == False) | 
-         (Seminar.announcement_sent == False) |
-         (Seminar.calendar_invite_sent == False))
-    )
-    pending_count = len(db.exec(pending_stmt).all())
-    
+    counts = dashboard_counts(db)
     return {
-        "upcoming_seminars": upcoming_count,
-        "total_speakers": speakers_count,
-        "pending_tasks": pending_count
+        "upcoming_seminars": counts["upcoming_seminars"],
+        "total_speakers": counts["totals"]["speakers"],
+        "pending_tasks": counts["pending_tasks"],
     }
 
-@app.get("/api/external/upcoming")
-async def external_upcoming(secret: str, limit: int = 5, db: Session = Depends(get_db)):
-    if secret != settings.api_secret:
-        raise HTTPException(status_code=401, detail="Invalid secret")
-    
-    today = date_type.today()
+EXTERNAL_UPCOMING_TABLES = ("seminars", "speakers", "rooms")
+
+_external_upcoming_cache = TTLCache(maxsize=64, ttl=settings.external_upcoming_cache_ttl_seconds)
+
+def _external_upcoming_payload(db: Session, today: date_type, limit: int) -> dict:
     statement = (
         select(Seminar)
+        .options(selectinload(Seminar.speaker), selectinload(Seminar.room))
         .where(Seminar.date >= today)
         .order_by(Seminar.date)
         .limit(limit)
     )
     seminars = db.exec(statement).all()
-    
     return {
         "seminars": [
             {
@@ -4932,6 +5338,21 @@ async def external_upcoming(secret: str, limit: int = 5, db: Session = Depends(g
         ]
     }
 
+def _cached_external_upcoming(limit: int) -> dict:
+    """Cached per (limit, day, table versions); one recomputation per key at a time."""
+    today = date_type.today()
+    with Session(get_engine()) as db:
+        versions = table_versions(db, EXTERNAL_UPCOMING_TABLES)
+        key = (limit, today, current_epoch(), tuple(sorted(versions.items())))
+        return _external_upcoming_cache.get_or_set(key, lambda: _external_upcoming_payload(db, today, limit))
+
+@app.get("/api/external/upcoming")
+async def external_upcoming(secret: str, limit: int = Query(5, ge=1, le=100)):
+    if secret != settings.api_secret:
+        raise HTTPException(status_code=401, detail="Invalid secret")
+    # In the threadpool, so a burst of polls waits on one query instead of blocking the event loop
+    return await run_in_threadpool(_cached_external_upcoming, limit)
+
 # ============================================================================
 # Admin / Backup Endpoints
 # ============================================================================
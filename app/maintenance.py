@@ -0,0 +1,150 @@
+"""
+Background maintenance for the Seminars App.
+
+Speaker tokens are never deleted by the request paths. Every lookup filters
+on expires_at, so expired rows only make the table and its index grow.
+Deleting a suggestion through raw SQL or an old restore can also leave
+availability and workflow rows pointing at nothing. The sweeper removes both,
+along with webhook outbox events delivered more than ``outbox_retention_days`` ago,
+resumable upload sessions idle past their expiry, and upload blobs that no
+file references any more (see app.blobs).
+
+Every batch is its own short transaction (at most ``batch_size`` rows). On
+SQLite the write lock is released between batches, so foreground writes wait
+for one small DELETE at most, never for the whole sweep.
+
+run_sweep() does one pass and returns what it removed. start_sweeper() runs it
+every ``maintenance_sweep_interval_seconds`` from the app lifespan, and
+admins can also trigger it from /api/admin/db/maintenance/sweep.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select
+from sqlmodel import Session
+
+from app import blobs, resumable
+from app.core import get_engine, record_activity, settings
+from app.models import OutboxEvent, SpeakerAvailability, SpeakerSuggestion, SpeakerToken, SpeakerWorkflow
+from app.speaker_tokens import clear_token_cache
+
+logger = logging.getLogger(__name__)
+
+# Pause between batches so queued writers get the lock first
+_BATCH_PAUSE_SECONDS = 0.01
+
+last_sweep_report: Optional[dict] = None
+
+
+def _delete_in_batches(engine, model, condition, batch_size: int) -> int:
+    """Delete rows of ``model`` matching ``condition``, ``batch_size`` rows per transaction."""
+    removed = 0
+    while True:
+        doomed = select(model.id).where(condition).limit(batch_size).scalar_subquery()
+        with engine.begin() as conn:
+            count = conn.execute(delete(model).where(model.id.in_(doomed))).rowcount
+        removed += count
+        if count < batch_size:
+            return removed
+        time.sleep(_BATCH_PAUSE_SECONDS)
+
+
+def run_sweep(
+    engine=None,
+    batch_size: Optional[int] = None,
+    retention_days: Optional[int] = None,
+    actor: str = "system",
+) -> dict:
+    """One maintenance pass. Returns the number of rows removed per kind."""
+    global last_sweep_report
+    engine = engine or get_engine()
+    batch_size = batch_size or settings.maintenance_sweep_batch_size
+    if retention_days is None:
+        retention_days = settings.expired_token_retention_days
+
+    started = time.perf_counter()
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    existing_suggestions = select(SpeakerSuggestion.id)
+    removed: Dict[str, int] = {
+        "expired_tokens": _delete_in_batches(
+            engine, SpeakerToken, SpeakerToken.expires_at < cutoff, batch_size
+        ),
+        "orphaned_tokens": _delete_in_batches(
+            engine, SpeakerToken, SpeakerToken.suggestion_id.not_in(existing_suggestions), batch_size
+        ),
+        "orphaned_availability": _delete_in_batches(
+            engine, SpeakerAvailability, SpeakerAvailability.suggestion_id.not_in(existing_suggestions), batch_size
+        ),
+        "orphaned_workflows": _delete_in_batches(
+            engine, SpeakerWorkflow, SpeakerWorkflow.suggestion_id.not_in(existing_suggestions), batch_size
+        ),
+        "delivered_outbox_events": _delete_in_batches(
+            engine,
+            OutboxEvent,
+            (OutboxEvent.status == "delivered")
+            & (OutboxEvent.delivered_at < datetime.utcnow() - timedelta(days=settings.outbox_retention_days)),
+            batch_size,
+        ),
+    }
+    removed["abandoned_upload_sessions"] = resumable.sweep_expired(engine)
+    with Session(engine) as db:
+        removed["unreferenced_blobs"] = blobs.collect(db)
+    report = {
+        "removed": removed,
+        "expired_before": cutoff.isoformat(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "finished_at": datetime.utcnow().isoformat(),
+    }
+
+    if removed["expired_tokens"] or removed["orphaned_tokens"]:
+        clear_token_cache()  # bulk deletes bypass the ORM invalidation hooks
+
+    total = sum(removed.values())
+    if total:
+        logger.info(f"Maintenance sweep removed {total} rows: {removed}")
+        with Session(engine) as db:
+            record_activity(
+                db,
+                event_type="maintenance_sweep",
+                summary=f"Maintenance sweep removed {total} stale rows",
+                actor=actor,
+                details=report,
+            )
+            db.commit()
+    else:
+        logger.debug("Maintenance sweep found nothing to remove")
+
+    last_sweep_report = report
+    return report
+
+
+async def _sweep_forever(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(run_sweep)
+        except Exception as e:  # keep the loop alive; the next pass retries
+            logger.error(f"Maintenance sweep failed: {e}")
+
+
+def start_sweeper() -> Optional[asyncio.Task]:
+    """Start the periodic sweeper on the running loop (None when disabled)."""
+    interval = settings.maintenance_sweep_interval_seconds
+    if interval <= 0:
+        return None
+    return asyncio.create_task(_sweep_forever(interval), name="maintenance-sweeper")
+
+
+async def stop_sweeper(task: Optional[asyncio.Task]) -> None:
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
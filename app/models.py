@@ -96,7 +96,8 @@ class UploadedFile(SQLModel, table=True):
     original_extension: Optional[str] = None
     content_type: str
     file_size: int
-    storage_filename: str
+    storage_filename: str = Field(index=True)
+    sha256: Optional[str] = Field(default=None, index=True)  # hex digest of the stored bytes
     file_category: Optional[str] = None
     description: Optional[str] = None
     
@@ -105,6 +106,23 @@ class UploadedFile(SQLModel, table=True):
     seminar: Seminar = Relationship(back_populates="files")
 
 
+class UploadSession(SQLModel, table=True):
+    """Resumable upload in progress; chunks are appended to a part file (see app/resumable.py)."""
+    __tablename__ = "upload_sessions"
+
+    id: str = Field(primary_key=True)  # random hex, also the part file name
+    seminar_id: int = Field(foreign_key="seminars.id")
+    original_filename: str
+    content_type: str
+    file_category: Optional[str] = None
+    total_size: int
+    received: int = Field(default=0)  # bytes appended and fsynced so far
+    sha256: Optional[str] = None  # expected digest, when the client sent it up front
+    created_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)  # pushed forward by every chunk
+
+
 class SemesterPlan(SQLModel, table=True):
     __tablename__ = "semester_plans"
     
@@ -257,3 +275,20 @@ class ActivityEvent(SQLModel, table=True):
     actor: Optional[str] = None
     details_json: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class OutboxEvent(SQLModel, table=True):
+    """Change notification written in the same transaction as the change (see app/outbox.py)."""
+    __tablename__ = "outbox_events"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    event_type: str  # e.g. seminar.updated, slot.created, speaker_workflow.deleted
+    entity_type: str
+    entity_id: Optional[int] = None
+    payload_json: str
+    status: str = Field(default="pending", index=True)  # pending, delivered, failed
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    delivered_at: Optional[datetime] = None
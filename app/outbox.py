@@ -0,0 +1,257 @@
+"""
+Transactional outbox and webhook delivery for the Seminars App.
+
+Downstream dashboards used to poll /api/external/stats and /upcoming. Instead,
+every insert, update or delete of a seminar, slot or speaker workflow writes an
+``outbox_events`` row on the same connection and in the same transaction as
+the change. The notification therefore exists exactly when the change
+commits, and a rollback discards both.
+
+A background dispatcher picks up pending events in id order, ``outbox_batch_size``
+at a time, and POSTs each batch as ``{"events": [...]}`` to every URL in
+``WEBHOOK_URLS``. A batch counts as delivered when every URL answers 2xx.
+Otherwise its events are retried with exponential backoff and marked
+``failed`` after ``outbox_max_attempts`` attempts. Delivery is at-least-once,
+so receivers should de-duplicate on the event id.
+
+Nothing is enqueued while no webhook URL is configured.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, func, inspect, insert, update
+from sqlmodel import Session, select
+
+from app.core import get_engine, settings
+from app.fast_json import dumps
+from app.models import OutboxEvent, Seminar, SeminarSlot, SpeakerWorkflow
+
+logger = logging.getLogger(__name__)
+
+# ORM model -> entity name used in event types ("seminar.updated")
+OUTBOX_ENTITIES = {
+    Seminar: "seminar",
+    SeminarSlot: "slot",
+    SpeakerWorkflow: "speaker_workflow",
+}
+
+_outbox = OutboxEvent.__table__
+_dispatch_lock = threading.Lock()
+
+last_dispatch_report: Optional[dict] = None
+
+
+def webhook_urls() -> List[str]:
+    return [url.strip() for url in settings.webhook_urls.split(",") if url.strip()]
+
+
+def enqueue(conn, entity_type: str, action: str, entity_id: Optional[int], data: dict, changed: Optional[List[str]] = None) -> None:
+    """Write one outbox event on ``conn`` (the caller's transaction)."""
+    if not webhook_urls():
+        return
+    payload = {"data": data}
+    if changed is not None:
+        payload["changed"] = changed
+    conn.execute(
+        insert(_outbox),
+        {
+            "event_type": f"{entity_type}.{action}",
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "payload_json": dumps(payload).decode("utf-8"),
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": datetime.utcnow(),
+            "created_at": datetime.utcnow(),
+        },
+    )
+
+
+def _row_data(mapper, target) -> dict:
+    return {attr.key: getattr(target, attr.key) for attr in mapper.column_attrs}
+
+
+def _on_insert(mapper, connection, target) -> None:
+    enqueue(connection, OUTBOX_ENTITIES[mapper.class_], "created", target.id, _row_data(mapper, target))
+
+
+def _on_update(mapper, connection, target) -> None:
+    state = inspect(target)
+    changed = [attr.key for attr in mapper.column_attrs if state.attrs[attr.key].history.has_changes()]
+    if changed:  # after_update also fires for objects that were dirty without net changes
+        enqueue(connection, OUTBOX_ENTITIES[mapper.class_], "updated", target.id, _row_data(mapper, target), changed)
+
+
+def _on_delete(mapper, connection, target) -> None:
+    enqueue(connection, OUTBOX_ENTITIES[mapper.class_], "deleted", target.id, {"id": target.id})
+
+
+for _model in OUTBOX_ENTITIES:
+    event.listen(_model, "after_insert", _on_insert)
+    event.listen(_model, "after_update", _on_update)
+    event.listen(_model, "after_delete", _on_delete)
+
+
+def enqueue_seminar_updates(conn, changed_by_id: Dict[int, List[str]]) -> None:
+    """Outbox events for seminars changed by a bulk UPDATE (which skips the ORM hooks)."""
+    if not changed_by_id or not webhook_urls():
+        return
+    table = Seminar.__table__
+    for row in conn.execute(table.select().where(table.c.id.in_(list(changed_by_id)))).mappings():
+        enqueue(conn, "seminar", "updated", row["id"], dict(row), changed_by_id[row["id"]])
+
+
+# ---------------------------------------------------------------------------
+# Delivery
+# ---------------------------------------------------------------------------
+
+def _retry_delay(attempts: int) -> float:
+    return min(settings.outbox_retry_base_seconds * (2 ** (attempts - 1)), settings.outbox_retry_max_seconds)
+
+
+def _batch_body(rows: Iterable) -> bytes:
+    return b'{"events":[' + b",".join(
+        dumps({
+            "id": row.id,
+            "event_type": row.event_type,
+            "entity_type": row.entity_type,
+            "entity_id": row.entity_id,
+            "created_at": row.created_at,
+        })[:-1] + b',"payload":' + row.payload_json.encode("utf-8") + b"}"
+        for row in rows
+    ) + b"]}"
+
+
+def _post(client: httpx.Client, url: str, body: bytes) -> Optional[str]:
+    """POST one batch; returns an error description, or None on success."""
+    headers = {"Content-Type": "application/json"}
+    if settings.webhook_secret:
+        signature = hmac.new(settings.webhook_secret.encode(), body, hashlib.sha256).hexdigest()
+        headers["X-Seminars-Signature"] = f"sha256={signature}"
+    try:
+        response = client.post(url, content=body, headers=headers)
+    except httpx.HTTPError as e:
+        return f"{url}: {type(e).__name__}: {e}"
+    if not response.is_success:
+        return f"{url}: HTTP {response.status_code}"
+    return None
+
+
+def dispatch_once(engine=None, client: Optional[httpx.Client] = None) -> dict:
+    """Deliver one batch of due events. Returns what was attempted and the outcome."""
+    global last_dispatch_report
+    urls = webhook_urls()
+    if not urls:
+        return {"sent": 0, "delivered": 0, "retrying": 0, "failed": 0, "skipped": "no webhook URLs configured"}
+    if not _dispatch_lock.acquire(blocking=False):
+        return {"sent": 0, "delivered": 0, "retrying": 0, "failed": 0, "skipped": "dispatch already running"}
+    try:
+        engine = engine or get_engine()
+        now = datetime.utcnow()
+        with Session(engine) as db:
+            rows = db.exec(
+                select(OutboxEvent)
+                .where(OutboxEvent.status == "pending", OutboxEvent.next_attempt_at <= now)
+                .order_by(OutboxEvent.id)
+                .limit(settings.outbox_batch_size)
+            ).all()
+            if not rows:
+                return {"sent": 0, "delivered": 0, "retrying": 0, "failed": 0}
+
+            body = _batch_body(rows)
+            own_client = client is None
+            client = client or httpx.Client(timeout=settings.webhook_timeout_seconds)
+            try:
+                errors = [error for error in (_post(client, url, body) for url in urls) if error]
+            finally:
+                if own_client:
+                    client.close()
+
+            ids = [row.id for row in rows]
+            report = {"sent": len(ids), "delivered": 0, "retrying": 0, "failed": 0}
+            if not errors:
+                db.exec(update(OutboxEvent).where(OutboxEvent.id.in_(ids)).values(
+                    status="delivered", attempts=OutboxEvent.attempts + 1, delivered_at=now, last_error=None,
+                ))
+                report["delivered"] = len(ids)
+            else:
+                error = "; ".join(errors)[:1000]
+                for row in rows:
+                    row.attempts += 1
+                    row.last_error = error
+                    if row.attempts >= settings.outbox_max_attempts:
+                        row.status = "failed"
+                        report["failed"] += 1
+                    else:
+                        row.next_attempt_at = now + timedelta(seconds=_retry_delay(row.attempts))
+                        report["retrying"] += 1
+                    db.add(row)
+                logger.warning(f"Webhook delivery of {len(ids)} outbox events failed: {error}")
+            db.commit()
+        report["finished_at"] = now.isoformat()
+        last_dispatch_report = report
+        return report
+    finally:
+        _dispatch_lock.release()
+
+
+def outbox_status(db: Session) -> dict:
+    counts = dict(db.exec(select(OutboxEvent.status, func.count()).group_by(OutboxEvent.status)).all())
+    failures = db.exec(
+        select(OutboxEvent).where(OutboxEvent.status == "failed").order_by(OutboxEvent.id.desc()).limit(20)
+    ).all()
+    return {
+        "webhook_urls": len(webhook_urls()),
+        "counts": {status: counts.get(status, 0) for status in ("pending", "delivered", "failed")},
+        "recent_failures": [
+            {"id": row.id, "event_type": row.event_type, "attempts": row.attempts, "last_error": row.last_error}
+            for row in failures
+        ],
+        "last_dispatch": last_dispatch_report,
+    }
+
+
+def retry_failed(db: Session) -> int:
+    """Put failed events back in the queue, due now."""
+    result = db.exec(update(OutboxEvent).where(OutboxEvent.status == "failed").values(
+        status="pending", attempts=0, next_attempt_at=datetime.utcnow(),
+    ))
+    db.commit()
+    return result.rowcount
+
+
+async def _dispatch_forever(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            report = await run_in_threadpool(dispatch_once)
+            # Keep draining without waiting while full batches are being delivered
+            while report.get("delivered") == settings.outbox_batch_size:
+                report = await run_in_threadpool(dispatch_once)
+        except Exception as e:  # keep the loop alive; the next pass retries
+            logger.error(f"Outbox dispatch failed: {e}")
+
+
+def start_dispatcher() -> Optional[asyncio.Task]:
+    """Start the webhook dispatcher on the running loop (None when no URLs are configured)."""
+    if not webhook_urls() or settings.outbox_poll_interval_seconds <= 0:
+        return None
+    return asyncio.create_task(_dispatch_forever(settings.outbox_poll_interval_seconds), name="outbox-dispatcher")
+
+
+async def stop_dispatcher(task: Optional[asyncio.Task]) -> None:
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
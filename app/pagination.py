@@ -0,0 +1,131 @@
+"""
+Keyset pagination for list endpoints.
+
+List endpoints return plain JSON arrays, and existing clients expect that.
+Pagination is opt-in: pass ``limit`` (and later ``cursor``) and the page comes
+back as the same array, plus two response headers:
+
+- ``X-Next-Cursor``: opaque cursor for the next page (absent on the last page)
+- ``X-Total-Count``: rows matching the filters, only when ``include_total=true``
+
+Cursors encode the sort key of the last row (e.g. ``(date, id)``), and the next
+page is ``WHERE (date, id) > (:date, :id)``. Pages therefore stay stable under
+concurrent inserts and cost the same at any depth, unlike OFFSET.
+
+The composite indexes the sort keys need are created with CREATE INDEX IF NOT
+EXISTS whenever SQLModel.metadata.create_all runs, so existing databases pick
+them up on the next startup.
+"""
+
+import base64
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import event, func, text, tuple_
+from sqlmodel import Session, SQLModel, select
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE_MAX = 500
+
+PAGINATION_HEADERS = ["X-Next-Cursor", "X-Total-Count"]
+
+# Indexes backing the sort keys and filters of the paginated list endpoints
+LIST_INDEXES = {
+    "ix_seminars_date_id": "seminars (date, id)",
+    "ix_seminars_status_date": "seminars (status, date)",
+    "ix_speakers_name_id": "speakers (name, id)",
+    "ix_rooms_name_id": "rooms (name, id)",
+    "ix_speaker_suggestions_created_id": "speaker_suggestions (created_at, id)",
+    "ix_speaker_suggestions_plan_created": "speaker_suggestions (semester_plan_id, created_at)",
+    "ix_seminar_slots_plan_seminar": "seminar_slots (semester_plan_id, assigned_seminar_id)",
+}
+
+
+def ensure_list_indexes(conn) -> None:
+    for name, target in LIST_INDEXES.items():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_list_indexes(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        ensure_list_indexes(connection)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(column, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """Decode a cursor for the given sort columns; 400 if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("wrong number of sort keys")
+        return [_from_json(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+def paginate(
+    db: Session,
+    statement,
+    sort_columns: Sequence,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    descending: bool = False,
+) -> List[Any]:
+    """Run ``statement`` (already filtered, not yet ordered) one keyset page at a time.
+
+    ``sort_columns`` must end with a unique column (the primary key) so the
+    order is total. Without ``limit`` and ``cursor`` every row is returned, as
+    before pagination existed.
+    """
+    if include_total:
+        count_stmt = select(func.count()).select_from(statement.order_by(None).subquery())
+        response.headers["X-Total-Count"] = str(db.exec(count_stmt).one())
+
+    order = [c.desc() for c in sort_columns] if descending else list(sort_columns)
+    statement = statement.order_by(*order)
+    if cursor:
+        after = decode_cursor(cursor, sort_columns)
+        keys = tuple_(*sort_columns)
+        statement = statement.where(keys < tuple_(*after) if descending else keys > tuple_(*after))
+    if limit is None and cursor is None:
+        return db.exec(statement).all()
+
+    page_size = min(limit or PAGE_SIZE_MAX, PAGE_SIZE_MAX)
+    rows = db.exec(statement.limit(page_size + 1)).all()
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor([getattr(last, c.key) for c in sort_columns])
+    return rows
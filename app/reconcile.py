@@ -0,0 +1,257 @@
+"""
+Reconciliation of uploads_dir against the uploaded_files table.
+
+Upload storage drifts from the database. Failed uploads and crashes leave
+part files behind, and old deletion paths unlinked files inline. Restoring a
+backup can bring back UploadedFile rows whose files are gone, or drop rows
+whose files remain. reconcile() measures the drift in two streaming passes,
+with memory bounded by the batch size whatever the number of files:
+
+1. Disk to database. os.scandir walks uploads_dir, and the names found are
+   checked against the database ``batch_size`` at a time with indexed IN
+   queries:
+   - legacy flat files against ``storage_filename``;
+   - blobs and derivatives against ``sha256``;
+   - resumable-upload part files against ``upload_sessions``;
+   - leftover temp files of interrupted uploads and dedupes have no owner.
+   A file with no owner is an orphan.
+2. Database to disk. UploadedFile rows are read in keyset pages
+   (``id > last``) and each stored file is checked with os.stat. Rows whose
+   file is gone are reported as missing. They are never deleted, because the
+   row may be the only record that the file existed.
+
+Only files older than ``min_age_seconds`` count as orphans, so an upload that
+is being written is never mistaken for one. With ``purge=True`` orphans are
+deleted; blobs are rechecked under blob_lock first. The report gives counts,
+bytes reclaimable (or reclaimed) and a bounded sample of paths.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlmodel import Session, select
+
+from app import blobs
+from app.core import get_engine, settings
+from app.derivatives import DERIVATIVE_DIR
+from app.models import UploadedFile
+from app.resumable import SESSIONS_DIR
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_LIMIT = 20  # example paths reported per kind
+
+# Names that interrupted uploads, dedupes and renders leave behind
+_TEMP_SUFFIXES = (".part", ".dedupe", ".tmp")
+
+last_reconcile_report: Optional[dict] = None
+
+
+class _Report:
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+        self.samples: Dict[str, List[str]] = {}
+        self.scanned_files = 0
+        self.purged = 0
+        self.purged_bytes = 0
+
+    def add(self, kind: str, relpath: str, size: int) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.bytes[kind] = self.bytes.get(kind, 0) + size
+        samples = self.samples.setdefault(kind, [])
+        if len(samples) < SAMPLE_LIMIT:
+            samples.append(relpath)
+
+
+def _files(directory: Path) -> Iterator[os.DirEntry]:
+    """Regular files directly in ``directory`` (nothing if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def _subdirs(directory: Path) -> Iterator[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+
+def _walk(root: Path, depth: int) -> Iterator[os.DirEntry]:
+    """Files exactly ``depth`` directory levels below ``root``."""
+    if depth == 0:
+        yield from _files(root)
+        return
+    for subdir in _subdirs(root):
+        yield from _walk(subdir, depth - 1)
+
+
+def _existing(db: Session, query: str, values: List[str]) -> Set[str]:
+    statement = text(query).bindparams(bindparam("values", expanding=True))
+    return {row[0] for row in db.connection().execute(statement, {"values": values})}
+
+
+def _sources(root: Path):
+    """(kind, files to scan, key of a file or None to skip it, owner query or None if files never have one)."""
+    def flat(entry: os.DirEntry) -> Optional[str]:
+        if entry.name.startswith("."):
+            return None  # temp files; see the "temp" source
+        return entry.name
+
+    def temp(entry: os.DirEntry) -> Optional[str]:
+        return entry.name if entry.name.startswith(".") and entry.name.endswith(_TEMP_SUFFIXES) else None
+
+    def blob(entry: os.DirEntry) -> Optional[str]:
+        return None if entry.name.endswith(_TEMP_SUFFIXES) else entry.name
+
+    def derivative(entry: os.DirEntry) -> Optional[str]:
+        if entry.name.endswith(".tmp"):
+            return f"tmp:{entry.name}"
+        return entry.name.split("-", 1)[0]
+
+    def session_part(entry: os.DirEntry) -> Optional[str]:
+        return entry.name[: -len(".part")] if entry.name.endswith(".part") else None
+
+    return [
+        ("legacy_files", _files(root), flat,
+         "SELECT storage_filename FROM uploaded_files WHERE storage_filename IN :values"),
+        ("temp_files", _files(root), temp, None),
+        ("blobs", _walk(root / blobs.BLOB_DIR, 2), blob,
+         f"SELECT DISTINCT sha256 FROM uploaded_files WHERE sha256 IN :values AND storage_filename LIKE '{blobs.BLOB_DIR}/%'"),
+        ("derivatives", _walk(root / DERIVATIVE_DIR, 1), derivative,
+         "SELECT DISTINCT sha256 FROM uploaded_files WHERE sha256 IN :values"),
+        ("session_parts", _files(root / SESSIONS_DIR), session_part,
+         "SELECT id FROM upload_sessions WHERE id IN :values"),
+    ]
+
+
+def _purge(db: Session, kind: str, batch: List[Tuple[str, str, os.DirEntry]], owner_query: Optional[str]) -> List[os.DirEntry]:
+    """Delete orphaned files; blobs are rechecked under blob_lock against uploads committing now."""
+    removed: List[os.DirEntry] = []
+    if kind == "blobs":
+        with blobs.blob_lock:
+            db.rollback()  # see rows committed since the batch was checked
+            still_owned = _existing(db, owner_query, [key for key, _, _ in batch])
+            for key, _, entry in batch:
+                if key not in still_owned:
+                    Path(entry.path).unlink(missing_ok=True)
+                    removed.append(entry)
+            db.connection().execute(
+                text("DELETE FROM file_blobs WHERE ref_count <= 0 AND sha256 IN :values").bindparams(
+                    bindparam("values", expanding=True)
+                ),
+                {"values": [key for key, _, _ in batch]},
+            )
+            db.commit()
+        return removed
+    for _, _, entry in batch:
+        Path(entry.path).unlink(missing_ok=True)
+        removed.append(entry)
+    return removed
+
+
+def _scan_disk(db: Session, root: Path, report: _Report, purge: bool, min_age: float, batch_size: int) -> None:
+    cutoff = time.time() - min_age
+    for kind, entries, key_of, owner_query in _sources(root):
+        batch: List[Tuple[str, str, os.DirEntry]] = []
+
+        def flush() -> None:
+            if not batch:
+                return
+            keys = [key for key, _, _ in batch if not key.startswith("tmp:")]
+            owned = _existing(db, owner_query, keys) if owner_query and keys else set()
+            orphans = [item for item in batch if item[0] not in owned]
+            for _, relpath, entry in orphans:
+                report.add(kind, relpath, entry.stat(follow_symlinks=False).st_size)
+            if purge and orphans:
+                removed = _purge(db, kind, orphans, owner_query)
+                report.purged += len(removed)
+                report.purged_bytes += sum(entry.stat(follow_symlinks=False).st_size for entry in removed)
+            batch.clear()
+
+        for entry in entries:
+            key = key_of(entry)
+            if key is None:
+                continue
+            report.scanned_files += 1
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                    continue  # may belong to an upload in progress
+            except FileNotFoundError:
+                continue
+            batch.append((key, os.path.relpath(entry.path, root), entry))
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+
+
+def _scan_rows(db: Session, root: Path, report: _Report, batch_size: int) -> int:
+    """Keyset-paged pass over UploadedFile; returns the number of rows checked."""
+    last_id, checked = 0, 0
+    while True:
+        page = db.exec(
+            select(UploadedFile.id, UploadedFile.storage_filename, UploadedFile.file_size)
+            .where(UploadedFile.id > last_id)
+            .order_by(UploadedFile.id)
+            .limit(batch_size)
+        ).all()
+        if not page:
+            return checked
+        for file_id, storage_filename, file_size in page:
+            if not (root / storage_filename).is_file():
+                report.add("missing_files", f"uploaded_files/{file_id}: {storage_filename}", file_size or 0)
+        checked += len(page)
+        last_id = page[-1][0]
+
+
+def reconcile(
+    engine=None,
+    purge: bool = False,
+    min_age_seconds: float = 3600,
+    batch_size: int = 500,
+) -> dict:
+    """Compare uploads_dir with uploaded_files; with ``purge``, delete the orphaned files."""
+    global last_reconcile_report
+    started = time.perf_counter()
+    root = Path(settings.uploads_dir)
+    report = _Report()
+    with Session(engine or get_engine()) as db:
+        _scan_disk(db, root, report, purge, min_age_seconds, batch_size)
+        rows_checked = _scan_rows(db, root, report, batch_size)
+
+    missing = report.counts.pop("missing_files", 0)
+    missing_bytes = report.bytes.pop("missing_files", 0)
+    result = {
+        "purge": purge,
+        "scanned_files": report.scanned_files,
+        "rows_checked": rows_checked,
+        "orphans": report.counts,
+        "orphan_bytes": report.bytes,
+        "reclaimable_bytes": sum(report.bytes.values()),
+        "missing_files": missing,
+        "missing_bytes": missing_bytes,
+        "purged_files": report.purged,
+        "purged_bytes": report.purged_bytes,
+        "samples": report.samples,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "finished_at": datetime.utcnow().isoformat(),
+    }
+    logger.info(
+        f"Upload reconcile: {sum(report.counts.values())} orphans ({result['reclaimable_bytes']} bytes), "
+        f"{missing} missing, {report.purged} purged"
+    )
+    last_reconcile_report = result
+    return result
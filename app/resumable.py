@@ -0,0 +1,252 @@
+"""
+Resumable, chunked uploads for the Seminars App.
+
+A single multipart POST of a large talk recording fails over hotel Wi-Fi and
+restarts from zero. A resumable upload goes in steps instead:
+
+1. ``POST .../uploads`` creates an UploadSession with the file name, size,
+   category and, optionally, the expected SHA-256. The size is checked
+   against the category limit up front.
+2. ``PUT .../uploads/{id}?offset=N`` appends the raw request body at byte N.
+   N must equal the bytes already received, otherwise 409 with the current
+   offset. The chunk is streamed to ``uploads_dir/.sessions/<id>.part`` and
+   fsynced before the offset advances. If a chunk is cut off midway, the
+   bytes that did arrive are kept, so nothing is sent twice.
+3. ``GET .../uploads/{id}`` reports the offset to resume from.
+4. ``POST .../uploads/{id}/complete`` checks that the size is complete and
+   hashes the part file. The digest must match the expected SHA-256 given at
+   creation or completion. Only then is the file placed in the blob store,
+   the UploadedFile row created and the session deleted. A retried
+   ``complete`` whose first response was lost gets 409 with the file id.
+
+Each chunk pushes ``expires_at`` forward by ``upload_session_ttl_hours``. The
+maintenance sweeper removes sessions idle longer than that, and their part
+files. Chunks and completion for one session are serialized by a
+per-session lock (the app runs as a single process).
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import aiofiles
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session, select
+from starlette.requests import ClientDisconnect
+
+from app.blobs import file_sha256
+from app.core import settings
+from app.models import UploadedFile, UploadSession
+from app.uploads import StoredUpload, too_large, size_limit
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_DIR = ".sessions"
+
+COMPLETED_MEMORY = 1024  # completed sessions remembered for retried completes
+
+_locks: Dict[str, asyncio.Lock] = {}
+# session id -> (seminar id, file id) of recently completed uploads
+_completed: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+
+
+def session_path(session_id: str) -> Path:
+    return Path(settings.uploads_dir) / SESSIONS_DIR / f"{session_id}.part"
+
+
+def _expiry() -> datetime:
+    return datetime.utcnow() + timedelta(hours=settings.upload_session_ttl_hours)
+
+
+def session_status(session: UploadSession) -> dict:
+    return {
+        "session_id": session.id,
+        "offset": session.received,
+        "size": session.total_size,
+        "complete": session.received == session.total_size,
+        "expires_at": session.expires_at,
+    }
+
+
+def create_session(
+    db: Session,
+    seminar_id: int,
+    filename: str,
+    size: int,
+    content_type: str,
+    category: Optional[str],
+    sha256: Optional[str],
+    created_by: Optional[str],
+) -> UploadSession:
+    limit = size_limit(category)
+    if size > limit:
+        raise too_large(limit)
+    session = UploadSession(
+        id=secrets.token_hex(16),
+        seminar_id=seminar_id,
+        original_filename=filename,
+        content_type=content_type or "application/octet-stream",
+        file_category=category or None,
+        total_size=size,
+        sha256=sha256.lower() if sha256 else None,
+        created_by=created_by,
+        expires_at=_expiry(),
+    )
+    path = session_path(session.id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    db.add(session)
+    db.commit()
+    db.refresh(session)
+    return session
+
+
+def completed_upload(session_id: str, seminar_id: Optional[int]) -> Optional[int]:
+    """File id of a session of ``seminar_id`` that was already completed, if remembered."""
+    done = _completed.get(session_id)
+    return done[1] if done and done[0] == seminar_id else None
+
+
+def already_completed(file_id: int) -> HTTPException:
+    return HTTPException(status_code=409, detail=f"Upload already completed as file {file_id}")
+
+
+def _reload(db: Session, session: UploadSession) -> None:
+    """Re-read the session once its lock is held; it may have been completed or cancelled meanwhile."""
+    session_id = inspect(session).identity[0]  # readable even when the row is gone
+    try:
+        db.refresh(session)
+    except InvalidRequestError:
+        done = _completed.get(session_id)
+        if done is not None:
+            raise already_completed(done[1])
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+
+def _offset_conflict(session: UploadSession) -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail=f"Upload is at offset {session.received}",
+        headers={"Upload-Offset": str(session.received)},
+    )
+
+
+async def append_chunk(request: Request, db: Session, session: UploadSession, offset: int) -> UploadSession:
+    """Append the request body at ``offset``; keeps whatever arrived if the client drops."""
+    async with _locks.setdefault(session.id, asyncio.Lock()):
+        _reload(db, session)
+        if offset != session.received:
+            raise _offset_conflict(session)
+        path = session_path(session.id)
+        written = 0
+        too_large = False
+        disconnected = False
+        async with aiofiles.open(path, "r+b") as out:
+            await out.truncate(offset)  # drop bytes past the last acknowledged offset
+            await out.seek(offset)
+            try:
+                async for chunk in request.stream():
+                    if offset + written + len(chunk) > session.total_size:
+                        too_large = True
+                        break
+                    await out.write(chunk)
+                    written += len(chunk)
+            except ClientDisconnect:
+                disconnected = True
+            await out.flush()
+            if too_large:
+                await out.truncate(offset + written)
+            await run_in_threadpool(os.fsync, out.fileno())
+
+        session.received = offset + written
+        session.expires_at = _expiry()
+        db.add(session)
+        db.commit()
+        if disconnected:
+            logger.info(f"Upload session {session.id[:8]} interrupted at {session.received}/{session.total_size}")
+        if too_large:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Chunk runs past the declared size of {session.total_size} bytes",
+                headers={"Upload-Offset": str(session.received)},
+            )
+        return session
+
+
+async def complete_session(
+    db: Session,
+    session: UploadSession,
+    sha256: Optional[str],
+    store: Callable[[StoredUpload], UploadedFile],
+) -> UploadedFile:
+    """Verify a fully received upload, ``store`` it and delete the session, all under its lock.
+
+    ``store`` runs in the threadpool (it waits for blob_lock).
+    """
+    async with _locks.setdefault(session.id, asyncio.Lock()):
+        _reload(db, session)
+        if session.received != session.total_size:
+            raise _offset_conflict(session)
+        expected = (sha256 or session.sha256 or "").lower()
+        if not expected:
+            raise HTTPException(status_code=400, detail="sha256 of the complete file is required")
+        path = session_path(session.id)
+        try:
+            actual = await run_in_threadpool(file_sha256, path)
+        except FileNotFoundError:
+            discard_session(db, session)
+            raise HTTPException(status_code=410, detail="The uploaded data is gone; start a new upload")
+        if actual != expected:
+            discard_session(db, session)
+            raise HTTPException(status_code=422, detail="SHA-256 mismatch; the upload was discarded")
+        uploaded = await run_in_threadpool(store, StoredUpload(
+            original_filename=session.original_filename,
+            content_type=session.content_type,
+            category=session.file_category,
+            file_size=session.total_size,
+            sha256=actual,
+            path=path,
+        ))
+        _completed[session.id] = (session.seminar_id, uploaded.id)
+        while len(_completed) > COMPLETED_MEMORY:
+            _completed.popitem(last=False)
+        discard_session(db, session)
+        return uploaded
+
+
+async def cancel_session(db: Session, session: UploadSession) -> None:
+    """Discard a session once no chunk or completion for it is running."""
+    async with _locks.setdefault(session.id, asyncio.Lock()):
+        _reload(db, session)
+        discard_session(db, session)
+
+
+def discard_session(db: Session, session: UploadSession) -> None:
+    """Delete the session row and its part file (if still there)."""
+    session_path(session.id).unlink(missing_ok=True)
+    _locks.pop(session.id, None)
+    db.delete(session)
+    db.commit()
+
+
+def sweep_expired(engine, now: Optional[datetime] = None) -> int:
+    """Remove sessions idle past their expiry, with their part files."""
+    now = now or datetime.utcnow()
+    with Session(engine) as db:
+        expired = db.exec(select(UploadSession).where(UploadSession.expires_at < now)).all()
+        for session in expired:
+            session_path(session.id).unlink(missing_ok=True)
+            _locks.pop(session.id, None)
+            db.delete(session)
+        db.commit()
+    if expired:
+        logger.info(f"Removed {len(expired)} abandoned upload sessions")
+    return len(expired)
@@ -0,0 +1,195 @@
+"""
+Full-text search for the Seminars App.
+
+SQLite FTS5 external-content indexes over seminars, speakers and speaker
+suggestions. The indexes hold no copy of the text; they point at the base
+tables by rowid and are kept in sync by AFTER INSERT/UPDATE/DELETE triggers,
+so every write path (ORM, raw SQL, restores) stays searchable without
+application code having to remember to update them.
+
+The tables and triggers are created whenever SQLModel.metadata.create_all runs
+(startup, tests, database reset). A full rebuild is available on demand via
+rebuild_search_index(), e.g. after restoring an old backup.
+"""
+
+import html
+import logging
+import re
+import time
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlmodel import Session, SQLModel
+
+logger = logging.getLogger(__name__)
+
+# Sentinels wrapped around matches by snippet(); replaced with <mark> after escaping.
+_MARK_OPEN = "\ue000"
+_MARK_CLOSE = "\ue001"
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+SEARCH_MAX_TERMS = 8
+
+# name -> index definition. Weights feed bm25(): a title hit outranks a bio hit.
+SEARCH_INDEXES = {
+    "seminar": {
+        "fts": "seminars_fts",
+        "table": "seminars",
+        "columns": ("title", "abstract", "paper_title"),
+        "weights": (10.0, 2.0, 5.0),
+        "title": "c.title",
+        "subtitle": "c.paper_title",
+        "extra": "c.date AS date, NULL AS semester_plan_id",
+    },
+    "speaker": {
+        "fts": "speakers_fts",
+        "table": "speakers",
+        "columns": ("name", "affiliation", "bio"),
+        "weights": (10.0, 4.0, 1.0),
+        "title": "c.name",
+        "subtitle": "c.affiliation",
+        "extra": "NULL AS date, NULL AS semester_plan_id",
+    },
+    "suggestion": {
+        "fts": "speaker_suggestions_fts",
+        "table": "speaker_suggestions",
+        "columns": ("speaker_name", "suggested_topic"),
+        "weights": (10.0, 3.0),
+        "title": "c.speaker_name",
+        "subtitle": "c.suggested_topic",
+        "extra": "NULL AS date, c.semester_plan_id AS semester_plan_id",
+    },
+}
+
+
+def _index_ddl(index: dict) -> List[str]:
+    fts, table, columns = index["fts"], index["table"], index["columns"]
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END",
+        # Only indexed columns fire the update trigger; status/checklist toggles cost nothing.
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def _existing_tables(conn) -> set:
+    rows = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    return {row[0] for row in rows}
+
+
+def ensure_search_index(conn) -> List[str]:
+    """Create missing FTS tables/triggers; backfill any index that was just created.
+
+    Returns the names of the indexes that were created (and therefore rebuilt).
+    """
+    existing = _existing_tables(conn)
+    created = []
+    for index in SEARCH_INDEXES.values():
+        if index["table"] not in existing:
+            continue
+        is_new = index["fts"] not in existing
+        for statement in _index_ddl(index):
+            conn.exec_driver_sql(statement)
+        if is_new:
+            conn.exec_driver_sql(f"INSERT INTO {index['fts']}({index['fts']}) VALUES ('rebuild')")
+            created.append(index["fts"])
+    if created:
+        logger.info(f"Created full-text search indexes: {', '.join(created)}")
+    return created
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_search_index(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        ensure_search_index(connection)
+    except Exception as e:  # FTS5 missing from the SQLite build: search is disabled, app still works
+        logger.warning(f"Could not create full-text search indexes: {e}")
+
+
+def rebuild_search_index(db: Session) -> Dict[str, object]:
+    """Recreate missing indexes and rebuild all of them from the base tables."""
+    started = time.perf_counter()
+    conn = db.connection()
+    ensure_search_index(conn)
+    existing = _existing_tables(conn)
+    rebuilt = {}
+    for name, index in SEARCH_INDEXES.items():
+        fts = index["fts"]
+        if fts not in existing:
+            continue
+        conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('optimize')")
+        rebuilt[name] = conn.exec_driver_sql(f"SELECT COUNT(*) FROM {index['table']}").scalar()
+    db.commit()
+    return {"rebuilt": rebuilt, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted (so FTS5 operators in user input are inert) and the
+    last one is a prefix match, which gives search-as-you-type behaviour.
+    """
+    terms = _TOKEN_RE.findall(query or "")[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _render_snippet(raw: Optional[str]) -> str:
+    escaped = html.escape(raw or "")
+    return escaped.replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def search(db: Session, query: str, types: Optional[Sequence[str]] = None, limit: int = 20) -> List[dict]:
+    """Ranked full-text search. Results are ordered best match first.
+
+    ``snippet`` is HTML-escaped text with matches wrapped in ``<mark>``.
+    """
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    results = []
+    for name in types or SEARCH_INDEXES.keys():
+        index = SEARCH_INDEXES[name]
+        fts = index["fts"]
+        weights = ", ".join(str(w) for w in index["weights"])
+        sql = text(
+            f"SELECT c.id AS id, {index['title']} AS title, {index['subtitle']} AS subtitle, {index['extra']}, "
+            f"snippet({fts}, -1, :open, :close, '…', 12) AS snippet, m.rank AS bm25_rank "
+            # FTS5 sorts by its rank column internally, so snippet() only runs on the top rows
+            f"FROM (SELECT rowid, rank FROM {fts} WHERE {fts} MATCH :match "
+            f"AND rank MATCH 'bm25({weights})' ORDER BY rank LIMIT :limit) m "
+            f"JOIN {fts} ON {fts}.rowid = m.rowid AND {fts} MATCH :match "
+            f"JOIN {index['table']} c ON c.id = m.rowid ORDER BY m.rank"
+        )
+        rows = db.execute(sql, {"match": match, "open": _MARK_OPEN, "close": _MARK_CLOSE, "limit": limit})
+        for row in rows.mappings():
+            results.append({
+                "type": name,
+                "id": row["id"],
+                "title": row["title"],
+                "subtitle": row["subtitle"],
+                "date": row["date"],
+                "semester_plan_id": row["semester_plan_id"],
+                "snippet": _render_snippet(row["snippet"]),
+                "score": round(-row["bm25_rank"], 4),
+            })
+
+    # bm25 is lower-is-better; scores are negated so higher is better across types
+    results.sort(key=lambda r: r["score"], reverse=True)
+    return results[:limit]
@@ -1,12 +1,14 @@
 """
 Speaker Info Page v6 - Single Page Layout
 All sections visible on one page without tabs.
+Static shell: identical for every token; the token is read from the URL and all
+data comes from GET /api/v1/seminars/speaker-tokens/{token}/info.
 """
 
-from app.templates import get_external_header_with_logos
+from app.templates import get_external_header_with_logos, get_invalid_token_message_html
 
 
-def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, seminar_title, seminar_date, token, seminar_id=None):
+def get_speaker_info_page_shell():
     """
     Generate speaker information page with all sections on a single page.
     """
@@ -432,8 +434,8 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
             <div class="card-body">
                 <!-- Event Info Banner -->
                 <div class="info-banner">
-                    <div class="info-banner-title">📅 {seminar_title or 'Seminar'}</div>
-                    <div class="info-banner-text">Scheduled for {seminar_date or 'To be confirmed'}</div>
+                    <div class="info-banner-title">📅 <span id="seminarTitle">Seminar</span></div>
+                    <div class="info-banner-text">Scheduled for <span id="seminarDate">To be confirmed</span></div>
                 </div>
                 
                 <!-- Section 1: Talk Information -->
@@ -448,7 +450,7 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
                     
                     <div class="form-group">
                         <label class="form-label">Speaker Name</label>
-                        <input type="text" id="speakerName" class="form-input" value="{speaker_name or ''}" placeholder="Your full name" required>
+                        <input type="text" id="speakerName" class="form-input" value="" placeholder="Your full name" required>
                     </div>
                     
                     <div class="form-group">
@@ -734,7 +736,7 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
     </div>
     
     <script>
-        const TOKEN = '{token}';
+        const TOKEN = decodeURIComponent(window.location.pathname.split('/').filter(Boolean).pop() || '');
         const API_BASE = '/api/v1/seminars/speaker-tokens';
         let saveTimeout = null;
         let uploadedFiles = {{}};
@@ -753,6 +755,10 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
         async function loadData() {{
             try {{
                 const response = await fetch(`${{API_BASE}}/${{TOKEN}}/info`);
+                if (response.status === 404) {{
+                    document.querySelector('.container').innerHTML = `{get_invalid_token_message_html()}`;
+                    return;
+                }}
                 if (!response.ok) {{
                     const error = await response.text();
                     showStatus('Error loading data: ' + error, 'error');
@@ -768,6 +774,8 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
         }}
         
         function populateForm(data) {{
+            if (data.seminar_title) document.getElementById('seminarTitle').textContent = data.seminar_title;
+            if (data.seminar_date) document.getElementById('seminarDate').textContent = data.seminar_date;
             if (data.speaker_name) document.getElementById('speakerName').value = data.speaker_name;
             if (data.final_talk_title) document.getElementById('talkTitle').value = data.final_talk_title;
             if (data.abstract) document.getElementById('abstract').value = data.abstract;
@@ -991,8 +999,8 @@ def get_speaker_info_page_v6(speaker_name, speaker_email, speaker_affiliation, s
             btn.innerHTML = '<span>⏳</span><span>Uploading...</span>';
             
             const formData = new FormData();
+            formData.append('category', category);  // before the file, so its size limit applies early
             formData.append('file', file);
-            formData.append('category', category);
             
             try {{
                 const response = await fetch(`${{API_BASE}}/${{TOKEN}}/upload`, {{
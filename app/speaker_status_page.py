@@ -0,0 +1,194 @@
+"""
+External speaker status page.
+- Static shell: identical for every token; the token is read from the URL and
+  status data comes from GET /api/v1/seminars/speaker-tokens/{token}/status
+- Rendered client-side and refreshed periodically while the tab is visible
+"""
+
+from app.templates import get_external_header_with_logos, get_invalid_token_message_html
+
+
+def get_speaker_status_page_shell():
+    """Generate the external speaker status page (4-step progress, action links, seminar info)."""
+    return f"""<!doctype html>
+<html lang='en'><head><meta charset='utf-8'><meta name='viewport' content='width=device-width,initial-scale=1'>
+<title>Seminar Status</title><style>
+:root{{--primary:#003366;--success:#28a745;--warning:#ffc107;--danger:#dc3545;--gray-100:#f8f9fa;--gray-200:#e9ecef;--gray-600:#6c757d;}}
+*{{box-sizing:border-box;}}
+body{{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#f4f6f8;padding:24px;margin:0;line-height:1.6;}}
+.header{{background:var(--primary);color:white;padding:24px 20px;text-align:center;margin:-24px -24px 24px -24px;}}
+.header-logos{{display:flex;flex-direction:column;align-items:center;gap:12px;}}
+.header-logos-inner{{display:flex;align-items:center;justify-content:center;gap:24px;flex-wrap:wrap;}}
+.header .logo-wrap{{background:white;padding:16px 28px;border-radius:12px;box-shadow:0 2px 8px rgba(0,0,0,0.15);}}
+.header .logo{{height:72px;width:auto;object-fit:contain;display:block;}}
+.header .logo-um{{max-height:80px;}}
+.header .logo-econ{{max-height:72px;}}
+.header h1{{font-size:26px;font-weight:600;margin:0;}}
+.header .subtitle{{font-size:15px;opacity:.9;margin-top:6px;}}
+.container{{max-width:800px;margin:0 auto;}}
+.card{{background:#fff;border-radius:12px;padding:28px;box-shadow:0 2px 12px rgba(0,0,0,0.08);margin-bottom:24px;}}
+.warning-box{{background:#fff3cd;border:2px solid #ffc107;border-radius:8px;padding:20px;margin-bottom:24px;}}
+.warning-box .warning-title{{color:#856404;font-weight:bold;font-size:18px;margin-bottom:8px;}}
+.warning-box p{{color:#856404;margin:0;}}
+.status-steps{{display:flex;gap:8px;margin-bottom:24px;flex-wrap:wrap;}}
+.step{{flex:1;min-width:140px;padding:16px 12px;background:var(--gray-200);border-radius:8px;text-align:center;font-size:14px;font-weight:500;color:var(--gray-600);}}
+.step.completed{{background:#d4edda;color:#155724;}}
+.step.active{{background:var(--primary);color:white;box-shadow:0 2px 8px rgba(0,51,102,0.3);}}
+.status-message{{background:var(--gray-100);border-left:4px solid var(--primary);padding:16px 20px;border-radius:0 8px 8px 0;margin-bottom:24px;}}
+.status-message h2{{margin:0 0 8px 0;font-size:20px;color:var(--primary);}}
+.status-message p{{margin:0;color:var(--gray-600);}}
+.info-section{{margin-bottom:24px;padding-bottom:24px;border-bottom:1px solid var(--gray-200);}}
+.info-section:last-child{{border-bottom:none;margin-bottom:0;padding-bottom:0;}}
+.info-section.approved{{background:#d4edda;border:1px solid #28a745;border-radius:8px;padding:20px;}}
+.info-section h3{{margin:0 0 16px 0;font-size:16px;color:var(--primary);text-transform:uppercase;letter-spacing:0.5px;}}
+.info-section.approved h3{{color:#155724;}}
+.info-row{{display:flex;margin-bottom:12px;}}
+.info-row:last-child{{margin-bottom:0;}}
+.info-row .label{{width:120px;font-weight:600;color:var(--gray-600);flex-shrink:0;}}
+.info-row .value{{flex:1;color:#333;}}
+.ticket-info{{background:white;border:1px solid #28a745;border-radius:6px;padding:16px;font-size:15px;line-height:1.8;white-space:pre-wrap;}}
+.action-section{{background:#e7f3ff;border:1px solid #0066cc;border-radius:8px;padding:20px;margin-bottom:24px;}}
+.action-section.waiting{{background:#fff3cd;border-color:#ffc107;}}
+.action-section.approved{{background:#d4edda;border-color:#28a745;}}
+.action-section h3{{margin:0 0 12px 0;font-size:18px;color:#003366;}}
+.action-section.waiting h3{{color:#856404;}}
+.action-section.approved h3{{color:#155724;}}
+.action-section p{{margin:0 0 16px 0;color:#333;}}
+.action-link{{display:inline-block;background:var(--primary);color:white;padding:14px 28px;border-radius:8px;text-decoration:none;font-weight:600;font-size:16px;transition:all 0.2s;box-shadow:0 2px 4px rgba(0,51,102,0.2);}}
+.action-link:hover{{background:#004080;transform:translateY(-1px);box-shadow:0 4px 8px rgba(0,51,102,0.3);}}
+.action-link.primary{{background:#0066cc;}}
+.action-link.primary:hover{{background:#0052a3;}}
+.footer{{text-align:center;color:var(--gray-600);font-size:14px;margin-top:24px;}}
+@media (max-width: 600px){{.step{{min-width:100%;}}.info-row{{flex-direction:column;}}.info-row .label{{width:auto;margin-bottom:4px;}}}}
+.loading{{text-align:center;color:var(--gray-600);padding:40px 0;}}
+</style></head>
+<body>
+<div class='header'>{get_external_header_with_logos()}</div>
+<div class='container' id='statusRoot'>
+    <p class='loading'>Loading your seminar status…</p>
+</div>
+<script>
+    const TOKEN = decodeURIComponent(window.location.pathname.split('/').filter(Boolean).pop() || '');
+    const API_BASE = '/api/v1/seminars/speaker-tokens';
+    const REFRESH_MS = 60000;
+    const STEP_LABELS = [
+        '1. Waiting for Date Availability',
+        '2. Date Assigned',
+        '3. Information Received',
+        '4. Proposal Approved',
+    ];
+
+    function escapeHtml(value) {{
+        const div = document.createElement('div');
+        div.textContent = value == null ? '' : String(value);
+        return div.innerHTML;
+    }}
+
+    function infoRow(label, value) {{
+        return `<div class='info-row'><span class='label'>${{label}}:</span> <span class='value'>${{escapeHtml(value)}}</span></div>`;
+    }}
+
+    function renderActions(step, data) {{
+        const ticketInfo = data.ticket_purchase_info && String(data.ticket_purchase_info).trim()
+            ? `<div class='ticket-info'>${{escapeHtml(data.ticket_purchase_info)}}</div>` : '';
+        if (step === 1) {{
+            return `<div class='action-section'>
+                <h3>📝 Action Required</h3>
+                <p>Please submit your available dates for the seminar:</p>
+                <a href='${{escapeHtml(data.availability_link)}}' class='action-link primary'>Submit Availability</a>
+            </div>`;
+        }}
+        if (step === 2) {{
+            return `<div class='action-section'>
+                <h3>📝 Action Required</h3>
+                <p>Please submit your seminar information and proposal:</p>
+                <a href='${{escapeHtml(data.info_link)}}' class='action-link primary'>Submit Information</a>
+            </div>`;
+        }}
+        if (step === 3) {{
+            return `<div class='action-section waiting'>
+                <h3>⏳ Waiting for Review</h3>
+                <p>Your information has been received and is being reviewed. Your seminar remains confirmed and can be planned normally; only ticket purchase must wait until approval.</p>
+            </div>`;
+        }}
+        if (step === 4) {{
+            return `<div class='action-section approved'>
+                <h3>✅ Proposal Approved</h3>
+                <p>Your proposal has been approved! You can now purchase your travel tickets.</p>
+                ${{ticketInfo}}
+            </div>`;
+        }}
+        return '';
+    }}
+
+    function render(data) {{
+        const status = data.status;
+        const step = status.step;
+        const speaker = data.speaker;
+        const seminar = data.seminar;
+        document.title = `Seminar Status - ${{speaker.name}}`;
+
+        const steps = STEP_LABELS.map((label, i) => {{
+            const n = i + 1;
+            return `<div class='step ${{step >= n ? 'completed' : ''}} ${{step === n ? 'active' : ''}}'>${{label}}</div>`;
+        }}).join('');
+
+        const warning = step < 4 ? `<div class='warning-box'>
+            <div class='warning-title'>⚠️ Ticket Purchase Timing</div>
+            <p>Your seminar is confirmed and you can plan confidently for it to happen. For bureaucratic reimbursement reasons only, <span style='font-weight:700;color:#dc3545;'>please wait for proposal approval before purchasing flight/train tickets.</span></p>
+        </div>` : '';
+
+        const ticketSection = step !== 4 && data.ticket_purchase_info && String(data.ticket_purchase_info).trim()
+            ? `<div class='info-section'>
+                <h3>🎫 Ticket Purchase Instructions</h3>
+                <div class='ticket-info'>${{escapeHtml(data.ticket_purchase_info)}}</div>
+            </div>` : '';
+
+        const seminarSection = seminar ? `<div class='info-section'>
+            <h3>📅 Seminar Information</h3>
+            ${{infoRow('Title', seminar.title || 'TBD')}}
+            ${{infoRow('Date', seminar.date)}}
+            ${{infoRow('Time', `${{seminar.start_time || 'TBD'}} - ${{seminar.end_time || 'TBD'}}`)}}
+        </div>` : '';
+
+        document.getElementById('statusRoot').innerHTML = `
+            ${{warning}}
+            <div class='card'>
+                <div class='status-steps'>${{steps}}</div>
+                <div class='status-message'>
+                    <h2>${{escapeHtml(status.title)}}</h2>
+                    <p>${{escapeHtml(status.message)}}</p>
+                </div>
+            </div>
+            ${{renderActions(step, data)}}
+            ${{ticketSection}}
+            <div class='card'>
+                <div class='info-section'>
+                    <h3>👤 Speaker Information</h3>
+                    ${{infoRow('Name', speaker.name)}}
+                    ${{infoRow('Affiliation', speaker.affiliation || 'TBD')}}
+                    ${{infoRow('Topic', speaker.topic || 'TBD')}}
+                </div>
+                ${{seminarSection}}
+            </div>
+            <p class='footer'>This page updates automatically when your seminar status changes.<br>Last updated: ${{escapeHtml(data.updated_at)}}</p>`;
+    }}
+
+    async function loadStatus() {{
+        try {{
+            const res = await fetch(`${{API_BASE}}/${{encodeURIComponent(TOKEN)}}/status`);
+            if (res.status === 404) {{
+                document.getElementById('statusRoot').innerHTML = `{get_invalid_token_message_html()}`;
+                return false;
+            }}
+            if (res.ok) render(await res.json());
+        }} catch (e) {{ console.error('Status load failed:', e); }}
+        return true;
+    }}
+
+    document.addEventListener('DOMContentLoaded', async function() {{
+        if (!(await loadStatus())) return;
+        setInterval(() => {{ if (document.visibilityState === 'visible') loadStatus(); }}, REFRESH_MS);
+    }});
+</script>
+</body></html>"""
@@ -0,0 +1,190 @@
+"""
+Speaker token resolution for the Seminars App.
+
+Every public speaker endpoint (availability/info/status pages, autosave,
+file upload/list/download/delete) starts by turning the URL token into the
+suggestion, plan and seminar it belongs to. resolve_token() does that once per
+token and keeps the result as a small immutable TokenContext in a bounded TTL
+cache, so page polling and autosave stop re-running the same queries.
+
+Cached contexts are dropped whenever the token, its suggestion or a seminar it
+could resolve to is inserted, updated or deleted through the ORM (and again
+when that transaction commits). Expiry is checked on every call, never cached.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+from sqlmodel import Session, select
+
+from app.caching import TTLCache
+from app.core import settings
+from app.models import Seminar, SpeakerSuggestion, SpeakerToken
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TokenContext:
+    """What a speaker token grants access to, resolved once and cached."""
+
+    token_id: int
+    token: str
+    token_type: str
+    suggestion_id: int
+    plan_id: Optional[int]
+    speaker_id: Optional[int]
+    seminar_id: Optional[int]  # token.seminar_id, else the speaker's first seminar
+    token_seminar_id: Optional[int]  # as stored on the token (None means fallback was used)
+    expires_at: datetime
+    used_at: Optional[datetime]
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at <= (now or datetime.utcnow())
+
+
+_token_cache = TTLCache(
+    maxsize=settings.speaker_token_cache_size,
+    ttl=settings.speaker_token_cache_ttl_seconds,
+)
+
+
+def fallback_seminar_id(db: Session, speaker_id: Optional[int]) -> Optional[int]:
+    """First seminar for a speaker; used when a token has no seminar of its own."""
+    if not speaker_id:
+        return None
+    return db.exec(
+        select(Seminar.id).where(Seminar.speaker_id == speaker_id).order_by(Seminar.id).limit(1)
+    ).first()
+
+
+def _load_context(db: Session, token: str) -> Optional[TokenContext]:
+    row = db.exec(
+        select(SpeakerToken, SpeakerSuggestion.semester_plan_id, SpeakerSuggestion.speaker_id)
+        .outerjoin(SpeakerSuggestion, SpeakerSuggestion.id == SpeakerToken.suggestion_id)
+        .where(SpeakerToken.token == token)
+    ).first()
+    if row is None:
+        return None
+    db_token, plan_id, speaker_id = row
+    seminar_id = db_token.seminar_id or fallback_seminar_id(db, speaker_id)
+    return TokenContext(
+        token_id=db_token.id,
+        token=db_token.token,
+        token_type=db_token.token_type,
+        suggestion_id=db_token.suggestion_id,
+        plan_id=plan_id,
+        speaker_id=speaker_id,
+        seminar_id=seminar_id,
+        token_seminar_id=db_token.seminar_id,
+        expires_at=db_token.expires_at,
+        used_at=db_token.used_at,
+    )
+
+
+def resolve_token(db: Session, token: str, token_type: Optional[str] = None) -> Optional[TokenContext]:
+    """Return the context for a live token (optionally of a given type), else None."""
+    if not token:
+        return None
+    context = _token_cache.get(token)
+    if context is None:
+        context = _load_context(db, token)
+        if context is None:
+            return None  # unknown tokens are not cached; they cannot start existing later
+        _token_cache.set(token, context)
+    if token_type is not None and context.token_type != token_type:
+        return None
+    if context.is_expired():
+        return None
+    return context
+
+
+def require_token(db: Session, token: str, token_type: Optional[str] = None) -> TokenContext:
+    """resolve_token() for API endpoints: 404 when the token is invalid or expired."""
+    context = resolve_token(db, token, token_type)
+    if context is None:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    return context
+
+
+def clear_token_cache() -> None:
+    """Forget every cached context (after restores/resets that bypass the ORM)."""
+    _token_cache.clear()
+
+
+def invalidate_seminars(seminar_ids: Iterable[int], speaker_ids: Iterable[Optional[int]]) -> int:
+    """Forget contexts resolving to these seminars, or falling back to these speakers' first seminar.
+
+    For bulk UPDATEs, which bypass the ORM hooks below; pass the old and new
+    speaker ids of the seminars and call it after the commit.
+    """
+    seminars = set(seminar_ids)
+    speakers = {speaker_id for speaker_id in speaker_ids if speaker_id is not None}
+    return _token_cache.invalidate_where(
+        lambda key, ctx: ctx.seminar_id in seminars or (ctx.token_seminar_id is None and ctx.speaker_id in speakers)
+    )
+
+
+def token_cache_stats() -> dict:
+    return _token_cache.stats()
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+_PENDING_KEY = "speaker_token_invalidations"
+
+
+def _invalidate(target, predicate) -> None:
+    _token_cache.invalidate_where(predicate)
+    # Repeat once the transaction commits, so a concurrent request that cached
+    # the pre-commit state between our flush and commit cannot keep it.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, []).append(predicate)
+
+
+def _on_token_change(mapper, connection, target: SpeakerToken) -> None:
+    token, token_id = target.token, target.id
+    _invalidate(target, lambda key, ctx: key == token or ctx.token_id == token_id)
+
+
+def _on_suggestion_change(mapper, connection, target: SpeakerSuggestion) -> None:
+    suggestion_id = target.id
+    _invalidate(target, lambda key, ctx: ctx.suggestion_id == suggestion_id)
+
+
+def _on_seminar_change(mapper, connection, target: Seminar) -> None:
+    seminar_id = target.id
+    speaker_id = target.speaker_id
+    _invalidate(
+        target,
+        lambda key, ctx: ctx.seminar_id == seminar_id
+        or (ctx.token_seminar_id is None and ctx.speaker_id == speaker_id),
+    )
+
+
+for _model, _handler in (
+    (SpeakerToken, _on_token_change),
+    (SpeakerSuggestion, _on_suggestion_change),
+    (Seminar, _on_seminar_change),
+):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _handler)
+
+
+@event.listens_for(Session, "after_commit")
+def _replay_invalidations(session) -> None:
+    for predicate in session.info.pop(_PENDING_KEY, ()):
+        _token_cache.invalidate_where(predicate)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session) -> None:
+    session.info.pop(_PENDING_KEY, None)
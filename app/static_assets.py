@@ -0,0 +1,236 @@
+"""
+Static frontend assets for the Seminars App.
+
+The Vite build in frontend/dist is precompressed once (at image build time and
+again at startup for anything missing or stale), producing ``.br`` and ``.gz``
+siblings next to each text asset. PrecompressedStaticFiles then serves the best
+sibling the client accepts, so no compression work happens per request.
+
+The SPA entry point (index.html) is held in memory by InMemoryFile and only
+re-read when its mtime changes; it is served with an ETag and revalidated on
+every load, while content-hashed bundles are cached for a year.
+
+Generated pages that are identical for every visitor (the speaker page shells)
+are wrapped in PrecompressedBody: compressed once, served from memory.
+
+Usage (build step):
+    python -m app.static_assets frontend/dist
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.compression import brotli, select_encoding
+
+logger = logging.getLogger(__name__)
+
+PRECOMPRESS_EXTENSIONS = {".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".ico", ".webmanifest"}
+PRECOMPRESS_MIN_SIZE = 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Vite output names look like index-DhFmGQto.js: an 8+ char base64url content hash.
+_HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+(\.map)?$")
+
+
+def is_hashed_asset(path: str) -> bool:
+    """True if the file name carries a Vite content hash (safe to cache forever)."""
+    return bool(_HASHED_ASSET_RE.search(path))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def _is_stale(target: Path, source_mtime: float) -> bool:
+    try:
+        return target.stat().st_mtime < source_mtime
+    except FileNotFoundError:
+        return True
+
+
+def precompress_directory(directory: Path, min_size: int = PRECOMPRESS_MIN_SIZE) -> Dict[str, int]:
+    """Write .gz/.br siblings for compressible files under ``directory``.
+
+    Existing siblings newer than their source are left alone, so this is cheap
+    to run on every startup. Returns counts of files written and skipped.
+    """
+    stats = {"gzip": 0, "br": 0, "skipped": 0}
+    directory = Path(directory)
+    if not directory.is_dir():
+        return stats
+
+    for root, _dirs, files in os.walk(directory):
+        for name in files:
+            path = Path(root) / name
+            if path.suffix.lower() not in PRECOMPRESS_EXTENSIONS:
+                continue
+            source_stat = path.stat()
+            if source_stat.st_size < min_size:
+                stats["skipped"] += 1
+                continue
+
+            data = None
+            gz_path = path.with_name(path.name + ".gz")
+            if _is_stale(gz_path, source_stat.st_mtime):
+                data = path.read_bytes()
+                gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+                stats["gzip"] += 1
+
+            br_path = path.with_name(path.name + ".br")
+            if brotli is not None and _is_stale(br_path, source_stat.st_mtime):
+                data = data if data is not None else path.read_bytes()
+                br_path.write_bytes(brotli.compress(data, quality=11))
+                stats["br"] += 1
+
+    return stats
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves precompressed siblings and long-lived cache headers.
+
+    Content-hashed files get ``cache_control`` (immutable by default); anything
+    else falls back to ``REVALIDATE_CACHE_CONTROL`` so an unhashed file can
+    never get stuck in a browser cache.
+    """
+
+    def __init__(self, *args, cache_control: str = IMMUTABLE_CACHE_CONTROL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code not in (200, 304):
+            return response
+
+        if response.status_code == 200 and isinstance(response, FileResponse):
+            request_headers = Headers(scope=scope)
+            encoding = select_encoding(request_headers.get("accept-encoding", ""))
+            if encoding is not None:
+                response = self._precompressed_response(path, encoding, response, request_headers)
+
+        response.headers["Cache-Control"] = self.cache_control if is_hashed_asset(path) else REVALIDATE_CACHE_CONTROL
+        response.headers.setdefault("Vary", "Accept-Encoding")
+        return response
+
+    def _precompressed_response(self, path: str, encoding: str, original: FileResponse, request_headers: Headers) -> Response:
+        full_path, stat_result = self.lookup_path(path + ENCODING_SUFFIXES[encoding])
+        if stat_result is None:
+            return original
+
+        response = FileResponse(
+            full_path,
+            stat_result=stat_result,
+            media_type=original.media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+@dataclass(frozen=True)
+class CachedFileContent:
+    body: bytes
+    etag: str
+    mtime_ns: int
+
+
+class InMemoryFile:
+    """A small file kept in memory and reloaded only when its mtime changes.
+
+    Each ``get()`` costs one ``stat()``; the file itself is read once per
+    change, not once per request.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._content: Optional[CachedFileContent] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[CachedFileContent]:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._content = None
+            return None
+
+        content = self._content
+        if content is not None and content.mtime_ns == mtime_ns:
+            return content
+
+        with self._lock:
+            content = self._content
+            if content is None or content.mtime_ns != mtime_ns:
+                body = self.path.read_bytes()
+                digest = hashlib.sha256(body).hexdigest()[:32]
+                content = CachedFileContent(body=body, etag=f'"{digest}"', mtime_ns=mtime_ns)
+                self._content = content
+                logger.info(f"Loaded {self.path} into memory ({len(body)} bytes)")
+        return content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._content = None
+
+
+class PrecompressedBody:
+    """A constant response body, compressed once and served from memory.
+
+    ``response()`` negotiates br/gzip from the request, answers a matching
+    If-None-Match with 304, and sets ``cache_control`` on every response.
+    """
+
+    def __init__(self, body: bytes, media_type: str = "text/html; charset=utf-8", cache_control: str = REVALIDATE_CACHE_CONTROL):
+        self.body = body
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.variants = {}  # preference order: br before gzip
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=11)
+        self.variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+
+    def response(self, request_headers: Headers) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control, "Vary": "Accept-Encoding"}
+        if etag_matches(request_headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        encoding = select_encoding(request_headers.get("accept-encoding", ""), available=tuple(self.variants))
+        if encoding is None:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(self.variants[encoding], media_type=self.media_type, headers=headers)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    targets = sys.argv[1:] or ["frontend/dist"]
+    for target in targets:
+        result = precompress_directory(Path(target))
+        print(f"Precompressed {target}: {result}")
@@ -1252,3 +1252,15 @@ def get_invalid_token_html():
     </div>
 </body>
 </html>"""
+
+
+def get_invalid_token_message_html():
+    """Self-styled invalid-link notice, swapped in client-side by the speaker page shells."""
+    return (
+        "<div style='max-width:600px;margin:0 auto;background:white;padding:40px;border-radius:12px;"
+        "text-align:center;box-shadow:0 4px 20px rgba(0,0,0,0.1);'>"
+        "<h1 style='color:#003366;font-size:48px;margin-bottom:20px;'>❌ Invalid Link</h1>"
+        "<p style='font-size:18px;color:#666;'>This link is no longer valid or has expired.</p>"
+        "<p style='font-size:18px;color:#666;margin-top:20px;'>If you believe this is an error, please contact the seminar coordinator.</p>"
+        "</div>"
+    )
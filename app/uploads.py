@@ -0,0 +1,242 @@
+"""
+Streaming file uploads for the Seminars App.
+
+FastAPI's UploadFile first spools the whole request body into a temporary
+file, and the handlers then copied that file into uploads_dir: every upload
+was written twice, synchronously, on the event loop.
+
+receive_upload() parses the multipart body itself as it arrives (with the same
+python-multipart parser Starlette uses). The file part goes straight to a
+``.<id>.part`` file in uploads_dir through aiofiles, and the SHA-256 and size
+are computed on the fly. An upload is refused with 413 as soon as it passes
+its category's limit, or before anything is read when Content-Length already
+exceeds the largest limit. Clients should send the category field before the
+file so its limit applies from the first chunk; until it is known the default
+(largest) limit applies.
+
+The finished file is fsynced and handed back as a StoredUpload. The caller
+moves it into the content-addressed store (app.blobs) and commits the
+UploadedFile row, so the store never holds a partial blob.
+"""
+
+import hashlib
+import logging
+import os
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiofiles
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.core import settings
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Per-category upload limits; other categories (and none) use settings.upload_max_bytes
+CATEGORY_SIZE_LIMITS = {
+    "cv": 20 * MB,
+    "photo": 20 * MB,
+    "passport": 20 * MB,
+    "flight": 20 * MB,
+}
+
+# Slack for multipart boundaries, headers and form fields in Content-Length
+_MULTIPART_OVERHEAD = 64 * 1024
+_MAX_FIELD_BYTES = 64 * 1024
+_WRITE_CHUNK = 1 * MB
+
+# Request body schema for OpenAPI, since the endpoints read the body themselves
+UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "category": {"type": "string"},
+                        "file_category": {"type": "string"},
+                        "file": {"type": "string", "format": "binary"},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+def size_limit(category: Optional[str]) -> int:
+    return CATEGORY_SIZE_LIMITS.get(category or "", settings.upload_max_bytes)
+
+
+def too_large(limit: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File is too large (limit {limit // MB} MB)")
+
+
+@dataclass
+class StoredUpload:
+    """A fully written, fsynced upload (still at its ``.part`` path) waiting for its UploadedFile row."""
+
+    original_filename: str
+    content_type: str
+    category: Optional[str]
+    file_size: int
+    sha256: str
+    path: Path
+
+    def discard(self) -> None:
+        """Remove the received file (when it was not placed in the blob store)."""
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class _MultipartState:
+    """Callback state for MultipartParser: small text fields plus one file part."""
+
+    file_field: str
+    fields: Dict[str, str] = field(default_factory=dict)
+    filename: Optional[str] = None
+    content_type: str = "application/octet-stream"
+    file_seen: bool = False
+    file_data: List[bytes] = field(default_factory=list)
+    _headers: Dict[bytes, bytes] = field(default_factory=dict)
+    _header_field: bytes = b""
+    _header_value: bytes = b""
+    _part: Optional[str] = None  # name of the text field being read; None outside fields
+    _in_file: bool = False
+    _buffer: bytearray = field(default_factory=bytearray)
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._part = None
+        self._in_file = False
+        self._buffer = bytearray()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        if filename is not None:
+            if name == self.file_field and not self.file_seen:
+                self.file_seen = True
+                self._in_file = True
+                self.filename = filename.decode("utf-8", "replace") or None
+                self.content_type = (
+                    self._headers.get(b"content-type", b"").decode("latin-1") or "application/octet-stream"
+                )
+        else:
+            self._part = name
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self.file_data.append(data[start:end])
+        elif self._part is not None:
+            self._buffer += data[start:end]
+            if len(self._buffer) > _MAX_FIELD_BYTES:
+                raise HTTPException(status_code=413, detail=f"Form field '{self._part}' is too large")
+
+    def on_part_end(self) -> None:
+        if self._part is not None:
+            self.fields[self._part] = self._buffer.decode("utf-8", "replace")
+        self._in_file = False
+        self._part = None
+
+    def take_file_data(self) -> List[bytes]:
+        data, self.file_data = self.file_data, []
+        return data
+
+
+async def receive_upload(request: Request, category_field: str = "category", file_field: str = "file") -> StoredUpload:
+    """Stream the multipart ``file_field`` of ``request`` into uploads_dir."""
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+    max_limit = max([settings.upload_max_bytes, *CATEGORY_SIZE_LIMITS.values()])
+    try:
+        declared = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        declared = 0
+    if declared > max_limit + _MULTIPART_OVERHEAD:
+        raise too_large(max_limit)
+
+    uploads_dir = Path(settings.uploads_dir)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+    file_id = uuid.uuid4().hex
+    part_path = uploads_dir / f".{file_id}.part"
+
+    state = _MultipartState(file_field=file_field)
+    parser = MultipartParser(params[b"boundary"], state.callbacks())
+    digest = hashlib.sha256()
+    size = 0
+    pending = bytearray()
+    try:
+        async with aiofiles.open(part_path, "wb") as out:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                for data in state.take_file_data():
+                    size += len(data)
+                    limit = size_limit(state.fields.get(category_field))
+                    if size > limit:
+                        raise too_large(limit)
+                    digest.update(data)
+                    pending += data
+                if len(pending) >= _WRITE_CHUNK:
+                    await out.write(bytes(pending))
+                    pending.clear()
+            parser.finalize()
+            if pending:
+                await out.write(bytes(pending))
+            await out.flush()
+            await run_in_threadpool(os.fsync, out.fileno())
+
+        if not state.file_seen:
+            raise HTTPException(status_code=400, detail=f"No '{file_field}' in upload")
+        category = state.fields.get(category_field) or None
+        limit = size_limit(category)  # the category may have arrived after the file
+        if size > limit:
+            raise too_large(limit)
+    except FormParserError as e:
+        part_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Invalid multipart data") from e
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    return StoredUpload(
+        original_filename=state.filename or "unnamed",
+        content_type=state.content_type,
+        category=category,
+        file_size=size,
+        sha256=digest.hexdigest(),
+        path=part_path,
+    )
@@ -0,0 +1,148 @@
+"""
+Table version counters and conditional GETs for the Seminars App.
+
+Each table the admin UI lists has a row in ``table_versions``. SQLite triggers
+bump it on every INSERT, UPDATE or DELETE, so ORM writes, raw SQL, restores and
+the maintenance sweeper are all counted. The counter becomes visible when the
+writing transaction commits.
+
+A GET endpoint opts in with ``dependencies=[Depends(versioned("seminars", ...))]``,
+naming the tables its response is built from. The dependency authenticates the
+request, reads those counters with one primary-key query and derives a weak
+ETag from them plus the path and query string. When If-None-Match matches it
+answers 304 before the handler runs any of its own queries.
+VersionETagMiddleware adds the ETag to the 200 responses.
+
+The ETag also carries a per-process epoch, reset on database restore/reset,
+so a counter value reused by a different database never validates a stale copy.
+"""
+
+import hashlib
+import logging
+import secrets
+from typing import Dict, Sequence
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import bindparam, event, text
+from sqlmodel import Session, SQLModel
+
+from app.core import get_current_user, get_db
+from app.static_assets import etag_matches
+
+logger = logging.getLogger(__name__)
+
+VERSIONED_TABLES = (
+    "seminars",
+    "speakers",
+    "rooms",
+    "semester_plans",
+    "seminar_slots",
+    "speaker_suggestions",
+    "speaker_availability",
+    "activity_events",
+)
+
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+_epoch = secrets.token_hex(4)
+
+
+def _version_ddl(table: str) -> list:
+    bump = f"UPDATE table_versions SET version = version + 1 WHERE name = '{table}'"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_{op[0]} AFTER {op} ON {table} BEGIN {bump}; END"
+        for op in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+def ensure_version_counters(conn) -> None:
+    """Create the counter table, its rows and the bump triggers (idempotent)."""
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS table_versions ("
+        "name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)"
+    ))
+    existing = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+    for table in VERSIONED_TABLES:
+        if table not in existing:
+            continue
+        conn.execute(text("INSERT OR IGNORE INTO table_versions (name, version) VALUES (:name, 0)"), {"name": table})
+        for statement in _version_ddl(table):
+            conn.execute(text(statement))
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_version_counters(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        ensure_version_counters(connection)
+
+
+def current_epoch() -> str:
+    return _epoch
+
+
+def reset_epoch() -> None:
+    """Invalidate every ETag handed out so far (after restore/reset)."""
+    global _epoch
+    _epoch = secrets.token_hex(4)
+
+
+_VERSIONS_QUERY = text("SELECT name, version FROM table_versions WHERE name IN :names").bindparams(
+    bindparam("names", expanding=True)
+)
+
+
+def table_versions(db: Session, tables: Sequence[str]) -> Dict[str, int]:
+    rows = db.connection().execute(_VERSIONS_QUERY, {"names": list(tables)})
+    return dict(rows.all())
+
+
+def compute_etag(request: Request, versions: Dict[str, int]) -> str:
+    key = "|".join(
+        [request.url.path, request.url.query]
+        + [f"{name}={versions.get(name, 0)}" for name in sorted(versions)]
+    )
+    return f'W/"{_epoch}-{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def versioned(*tables: str):
+    """Dependency factory: 304 when the named tables are unchanged since the client's copy."""
+    unknown = set(tables) - set(VERSIONED_TABLES)
+    if unknown:
+        raise ValueError(f"Tables without version counters: {sorted(unknown)}")
+
+    async def _conditional_get(
+        request: Request,
+        db: Session = Depends(get_db),
+        user: dict = Depends(get_current_user),
+    ) -> str:
+        etag = compute_etag(request, table_versions(db, tables))
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL})
+        request.state.etag = etag
+        return etag
+
+    return _conditional_get
+
+
+class VersionETagMiddleware:
+    """Attach the ETag computed by versioned() to successful responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                etag = scope.get("state", {}).get("etag")
+                if etag:
+                    headers = [(k, v) for k, v in message.get("headers", []) if k.lower() not in (b"etag", b"cache-control")]
+                    headers.append((b"etag", etag.encode("latin-1")))
+                    headers.append((b"cache-control", CONDITIONAL_CACHE_CONTROL.encode("latin-1")))
+                    message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -349,8 +349,9 @@ export function SeminarDetailsModal({ seminarId, speakerName, onClose }: Seminar
   const handleFileUpload = async (file: File, fileType: 'cv' | 'photo' | 'passport' | 'flight' | 'other') => {
     setUploadingFile(fileType);
     const uploadData = new FormData();
-    uploadData.append('file', file);
+    // Category first: the server applies its size limit while the file streams in
     uploadData.append('file_category', fileType);
+    uploadData.append('file', file);
     
     try {
       const response = await fetchWithAuth(`/api/v1/seminars/seminars/${seminarId}/upload`, {
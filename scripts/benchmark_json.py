@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark JSON encoding of list responses at 1k, 10k and 100k items.
+
+Compares FastAPI's default path (response_model validation, conversion to
+JSON-compatible Python, stdlib json.dumps) against the app's fast path
+(app.fast_json):
+
+- suggestions: dict rows as built by list_speaker_suggestions
+- seminars:    ORM-like objects serialized through SeminarResponse
+- activity:    events whose details_json is decoded per row (default) vs.
+               spliced in as raw bytes (fast)
+
+Usage:
+    python scripts/benchmark_json.py [--sizes 1000 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app import fast_json  # noqa: E402
+from app.main import ActivityEventResponse, SeminarResponse, SpeakerSuggestionResponse  # noqa: E402
+
+
+def _default_path(adapter: TypeAdapter, content) -> bytes:
+    """What FastAPI does for a response_model endpoint returning ``content``."""
+    validated = adapter.validate_python(content, from_attributes=True)
+    encoded = jsonable_encoder(adapter.dump_python(validated, mode="json"))
+    return json.dumps(encoded, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _suggestions(n: int) -> list:
+    created = datetime(2026, 1, 1)
+    return [
+        {
+            "id": i,
+            "suggested_by": "Faculty Member",
+            "suggested_by_email": "faculty@example.edu",
+            "speaker_id": i,
+            "speaker_name": f"Speaker {i}",
+            "speaker_email": f"speaker{i}@example.edu",
+            "speaker_affiliation": "University of Somewhere",
+            "suggested_topic": "Causal inference in networked markets",
+            "reason": "Strong recent work relevant to the group " * 3,
+            "priority": "medium",
+            "status": "pending",
+            "semester_plan_id": 1,
+            "created_at": created + timedelta(minutes=i),
+            "availability": [{"date": "2026-03-01", "preference": "available"}] * 3,
+        }
+        for i in range(n)
+    ]
+
+
+def _seminars(n: int) -> list:
+    speaker = SimpleNamespace(
+        id=1, name="Speaker", affiliation="University", email="s@example.edu", website=None,
+        bio="Bio text " * 40, notes=None, cv_path=None, photo_path=None,
+    )
+    return [
+        SimpleNamespace(
+            id=i, title=f"Seminar {i}", date=date(2026, 1, 1) + timedelta(days=i % 365), start_time="14:00",
+            end_time="15:00", speaker_id=1, room_id=None, abstract="Abstract text " * 60, paper_title="Paper",
+            status="planned", room_booked=False, announcement_sent=False, calendar_invite_sent=False,
+            website_updated=False, catering_ordered=False, notes=None, speaker=speaker, room=None,
+        )
+        for i in range(n)
+    ]
+
+
+def _activity(n: int) -> list:
+    details = json.dumps({
+        "changes": [
+            {"field": "title", "label": "Title", "change_type": "updated", "before": "Old title", "after": "New title"},
+            {"field": "date", "label": "Date", "change_type": "updated", "before": "2026-03-01", "after": "2026-03-08"},
+        ]
+    })
+    return [
+        SimpleNamespace(
+            id=i, semester_plan_id=1, event_type="SEMINAR_UPDATED", summary=f"Updated seminar {i}",
+            entity_type="seminar", entity_id=i, actor="admin", created_at=datetime(2026, 1, 1) + timedelta(seconds=i),
+            details_json=details,
+        )
+        for i in range(n)
+    ]
+
+
+def _activity_default(adapter: TypeAdapter, rows) -> bytes:
+    content = [
+        {
+            "id": r.id, "semester_plan_id": r.semester_plan_id, "event_type": r.event_type, "summary": r.summary,
+            "entity_type": r.entity_type, "entity_id": r.entity_id, "actor": r.actor,
+            "details": json.loads(r.details_json) if r.details_json else None, "created_at": r.created_at,
+        }
+        for r in rows
+    ]
+    return _default_path(adapter, content)
+
+
+def _activity_fast(rows) -> bytes:
+    return fast_json.json_array(
+        fast_json.splice_raw_field(
+            fast_json.dumps({
+                "id": r.id, "semester_plan_id": r.semester_plan_id, "event_type": r.event_type, "summary": r.summary,
+                "entity_type": r.entity_type, "entity_id": r.entity_id, "actor": r.actor, "created_at": r.created_at,
+            }),
+            "details",
+            r.details_json,
+        )
+        for r in rows
+    )
+
+
+def _best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; best is reported (default 3)")
+    args = parser.parse_args()
+
+    suggestion_list = TypeAdapter(List[SpeakerSuggestionResponse])
+    seminar_list = TypeAdapter(List[SeminarResponse])
+    activity_list = TypeAdapter(List[ActivityEventResponse])
+    encoder = "orjson" if fast_json.orjson is not None else "stdlib json (orjson not installed)"
+    print(f"fast path encoder: {encoder}")
+    print(f"{'case':<12}{'items':>9}{'default ms':>13}{'fast ms':>10}{'speedup':>9}")
+
+    for n in args.sizes:
+        cases = {
+            "suggestions": (_suggestions(n), lambda c: _default_path(suggestion_list, c), fast_json.dumps),
+            "seminars": (
+                _seminars(n),
+                lambda c: _default_path(seminar_list, c),
+                lambda c: seminar_list.dump_json(seminar_list.validate_python(c, from_attributes=True)),
+            ),
+            "activity": (_activity(n), lambda c: _activity_default(activity_list, c), _activity_fast),
+        }
+        for name, (content, default, fast) in cases.items():
+            assert json.loads(default(content)) == json.loads(fast(content)), f"{name}: outputs differ"
+            default_ms = _best_of(args.repeat, lambda: default(content))
+            fast_ms = _best_of(args.repeat, lambda: fast(content))
+            print(f"{name:<12}{n:>9,}{default_ms:>13.1f}{fast_ms:>10.1f}{default_ms / fast_ms:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-text search latency on a synthetic database.
+
+Creates a throwaway SQLite database with N rows in each of seminars, speakers
+and speaker_suggestions (default 50,000), lets the FTS triggers index them,
+then times a mix of one-word, multi-word and prefix queries through
+app.search.search().
+
+Usage:
+    python scripts/benchmark_search.py [--rows 50000] [--queries 200]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlmodel import Session, create_engine  # noqa: E402
+
+from app.models import SQLModel  # noqa: E402
+from app.search import rebuild_search_index, search  # noqa: E402
+
+WORDS = (
+    "market labor growth inflation monetary fiscal trade network causal inference "
+    "bayesian learning auction matching contract housing climate energy health "
+    "education migration banking credit risk volatility equilibrium dynamic games "
+    "experiment survey panel macro micro policy welfare inequality innovation firm"
+).split()
+FIRST_NAMES = "Ada Alan Grace Kurt John Emmy Paul Joan Amartya Elinor Esther Claudia".split()
+LAST_NAMES = "Lovelace Turing Hopper Godel Nash Noether Samuelson Robinson Sen Ostrom Duflo Goldin".split()
+UNIVERSITIES = "Oxford Cambridge MIT Stanford Chicago Bocconi LSE Toulouse Macau Tokyo".split()
+
+# Real text is Zipf-distributed: a few common words plus a long tail. Sampling a
+# 40-word list uniformly would put every query term in ~all rows, which
+# measures bm25 over the whole table rather than realistic search latency.
+VOCABULARY = WORDS + [f"{word}{i}" for i, word in enumerate(WORDS * 100)]
+ZIPF_WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, weights=ZIPF_WEIGHTS, k=n))
+
+
+def populate(engine, rows: int, seed: int = 7) -> float:
+    """Insert synthetic rows; returns seconds spent (including trigger indexing)."""
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO speakers (id, name, affiliation, bio, created_at) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+            [
+                (i, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", f"University of {rng.choice(UNIVERSITIES)}", _sentence(rng, 40))
+                for i in range(1, rows + 1)
+            ],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO seminars (id, title, date, start_time, speaker_id, abstract, paper_title, status, "
+            "room_booked, announcement_sent, calendar_invite_sent, website_updated, catering_ordered, created_at, updated_at) "
+            "VALUES (?, ?, '2026-01-01', '14:00', ?, ?, ?, 'planned', 0, 0, 0, 0, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            [
+                (i, _sentence(rng, 6).title(), rng.randint(1, rows), _sentence(rng, 120), _sentence(rng, 8))
+                for i in range(1, rows + 1)
+            ],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO speaker_suggestions (id, suggested_by, speaker_name, suggested_topic, priority, status, created_at) "
+            "VALUES (?, 'bench', ?, ?, 'medium', 'pending', CURRENT_TIMESTAMP)",
+            [
+                (i, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", _sentence(rng, 5))
+                for i in range(1, rows + 1)
+            ],
+        )
+    return time.perf_counter() - started
+
+
+def _queries(count: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            queries.append(rng.choice(VOCABULARY))
+        elif kind == 1:
+            queries.append(f"{rng.choice(WORDS)} {rng.choice(VOCABULARY)}")
+        else:
+            queries.append(rng.choice(LAST_NAMES)[:3])  # search-as-you-type prefix
+    return queries
+
+
+def _percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="rows per table (default 50000)")
+    parser.add_argument("--queries", type=int, default=200, help="number of timed queries (default 200)")
+    parser.add_argument("--limit", type=int, default=20, help="results per query (default 20)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)  # also creates the FTS tables and triggers
+
+        insert_s = populate(engine, args.rows)
+        print(f"Inserted {args.rows:,} rows per table (indexed by triggers) in {insert_s:.2f}s")
+
+        with Session(engine) as db:
+            rebuild = rebuild_search_index(db)
+            print(f"Full rebuild: {rebuild['elapsed_ms']:.0f} ms")
+
+            queries = _queries(args.queries)
+            search(db, queries[0], limit=args.limit)  # warm the page cache
+            timings = []
+            hits = 0
+            for q in queries:
+                started = time.perf_counter()
+                hits += len(search(db, q, limit=args.limit))
+                timings.append((time.perf_counter() - started) * 1000)
+
+    print(f"{len(timings)} queries, {hits} results")
+    print(
+        f"latency ms: p50={statistics.median(timings):.2f} "
+        f"p95={_percentile(timings, 95):.2f} p99={_percentile(timings, 99):.2f} max={max(timings):.2f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ Pytest fixtures for seminars-app tests.
 import os
 import shutil
 import tempfile
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -60,3 +60,31 @@ def db_session():
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         yield session
+
+
+@pytest.fixture
+def seminar(db_session):
+    """A seminar with its speaker, dated in the past so it never counts as upcoming."""
+    speaker = Speaker(name="File Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="File Seminar", date=date(2020, 1, 15), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    return seminar
+
+
+@pytest.fixture
+def upload_file(client, auth_headers, seminar):
+    """Upload through the API to ``seminar``; returns the new file id."""
+    def upload(content: bytes, name: str = "file.pdf", content_type: str = "application/pdf", category: str = "slides") -> int:
+        response = client.post(
+            f"/api/v1/seminars/seminars/{seminar.id}/upload",
+            data={"file_category": category},
+            files={"file": (name, content, content_type)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200, response.text
+        return response.json()["file_id"]
+
+    return upload
@@ -0,0 +1,86 @@
+"""
+Tests for the activity-event pipeline: synchronous and buffered write modes.
+"""
+
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import select
+
+from app import activity
+from app.core import get_engine, record_activity, settings
+from app.models import ActivityEvent
+
+
+def _events(db, marker):
+    db.expire_all()
+    return db.exec(
+        select(ActivityEvent).where(ActivityEvent.summary.startswith(marker)).order_by(ActivityEvent.id)
+    ).all()
+
+
+def test_sync_mode_writes_in_the_callers_transaction(db_session):
+    marker = f"sync {uuid4().hex[:8]}"
+    assert settings.activity_write_mode == "sync"
+    record_activity(db_session, "test_event", f"{marker} kept", details={"n": 1})
+    db_session.commit()
+    record_activity(db_session, "test_event", f"{marker} dropped")
+    db_session.rollback()
+    events = _events(db_session, marker)
+    assert [e.summary for e in events] == [f"{marker} kept"]
+    assert events[0].details_json == '{"n": 1}'
+
+
+def test_buffered_mode_batches_committed_events_into_one_insert(db_session, monkeypatch):
+    marker = f"buffered {uuid4().hex[:8]}"
+    monkeypatch.setattr(settings, "activity_write_mode", "buffered")
+    monkeypatch.setattr(settings, "activity_flush_interval_ms", 60_000)  # only the shutdown flush runs
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO activity_events"):
+            inserts.append(len(parameters) if executemany else 1)
+
+    async def run():
+        writer = activity.start_writer()
+        assert activity.buffering()
+        for i in range(5):
+            record_activity(db_session, "test_event", f"{marker} {i}", entity_id=i)
+            db_session.commit()
+        record_activity(db_session, "test_event", f"{marker} rolled back")
+        db_session.rollback()
+        assert _events(db_session, marker) == []  # kept out of the callers' transactions
+        assert activity.pending_count() == 5
+        await activity.stop_writer(writer)
+
+    event.listen(get_engine(), "before_cursor_execute", count_inserts)
+    try:
+        asyncio.run(run())
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", count_inserts)
+
+    assert not activity.buffering()
+    assert inserts == [5]
+    events = _events(db_session, marker)
+    assert [e.entity_id for e in events] == [0, 1, 2, 3, 4]
+    assert all(e.created_at is not None for e in events)
+    assert activity.pending_count() == 0
+
+
+def test_full_buffer_is_written_by_the_committing_request(db_session, monkeypatch):
+    marker = f"full {uuid4().hex[:8]}"
+    monkeypatch.setattr(settings, "activity_write_mode", "buffered")
+    monkeypatch.setattr(settings, "activity_flush_interval_ms", 60_000)
+    monkeypatch.setattr(settings, "activity_buffer_max_events", 3)
+
+    async def run():
+        writer = activity.start_writer()
+        for i in range(3):
+            record_activity(db_session, "test_event", f"{marker} {i}")
+        db_session.commit()
+        assert activity.pending_count() == 0
+        assert len(_events(db_session, marker)) == 3
+        await activity.stop_writer(writer)
+
+    asyncio.run(run())
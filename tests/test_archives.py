@@ -0,0 +1,92 @@
+"""
+Tests for streamed ZIP archives of seminar files.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+from uuid import uuid4
+
+from sqlmodel import select
+
+from app import archives
+from app.archives import ArchiveEntry, archive_entries, iter_zip
+from app.main import SemesterPlan, SeminarSlot, UploadedFile
+
+
+UPLOADS = [
+    ("cv", "notes.txt", b"plain text " * 2000, "text/plain"),
+    ("photo", "face.jpg", b"\xff\xd8jpeg" * 500, "image/jpeg"),
+    ("cv", "notes.txt", b"second copy " * 10, "text/plain"),
+]
+
+
+def _add_files(db_session, seminar, upload_file):
+    seminar.title = "Archive: Talk"  # ":" is not allowed in the folder name
+    db_session.add(seminar)
+    db_session.commit()
+    for category, name, content, content_type in UPLOADS:
+        upload_file(content, name, content_type, category)
+
+
+def test_seminar_archive_streams_all_files(client, auth_headers, db_session, seminar, upload_file):
+    _add_files(db_session, seminar, upload_file)
+    db_session.add(UploadedFile(
+        seminar_id=seminar.id, original_filename="gone.pdf", content_type="application/pdf",
+        file_size=1, storage_filename="missing.bin",
+    ))
+    db_session.commit()
+
+    response = client.get(f"/api/v1/seminars/seminars/{seminar.id}/files/archive", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    infos = {info.filename: info for info in archive.infolist()}
+    folder = "2020-01-15 Archive_ Talk"
+    assert archive.read(f"{folder}/cv/notes.txt") == UPLOADS[0][2]
+    assert infos[f"{folder}/cv/notes.txt"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos[f"{folder}/photo/face.jpg"].compress_type == zipfile.ZIP_STORED
+    duplicate = next(name for name in infos if name.startswith(f"{folder}/cv/notes (") and name.endswith(").txt"))
+    assert archive.read(duplicate) == UPLOADS[2][2]
+    assert "gone.pdf" in archive.read("MISSING.txt").decode()
+
+    assert client.get("/api/v1/seminars/seminars/999999/files/archive", headers=auth_headers).status_code == 404
+
+
+def test_plan_archive_and_chunked_output(client, auth_headers, db_session, seminar, upload_file):
+    _add_files(db_session, seminar, upload_file)
+    plan = SemesterPlan(name=f"Seminários {uuid4().hex[:6]} — Outono", academic_year="2019-2020", semester="spring")
+    db_session.add(plan)
+    db_session.commit()
+    db_session.add(SeminarSlot(
+        semester_plan_id=plan.id, date=seminar.date, start_time="14:00", end_time="15:00", room="A",
+        assigned_seminar_id=seminar.id,
+    ))
+    db_session.commit()
+
+    response = client.get(f"/api/v1/seminars/semester-plans/{plan.id}/files/archive", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith("attachment; filename*=utf-8''Semin%C3%A1rios%20")
+    assert len(zipfile.ZipFile(io.BytesIO(response.content)).namelist()) == 3
+
+    files = db_session.exec(select(UploadedFile).where(UploadedFile.seminar_id == seminar.id)).all()
+    chunks = list(iter_zip(archive_entries(files, {}), chunk_size=1024))
+    assert max(len(chunk) for chunk in chunks) < 4 * 1024
+    assert len(zipfile.ZipFile(io.BytesIO(b"".join(chunks))).namelist()) == 3
+
+
+def test_archive_survives_unlink_of_an_open_file(tmp_path, monkeypatch):
+    path = tmp_path / "talk.txt"
+    path.write_bytes(b"recording " * 1000)
+
+    def open_then_unlink(file, mode="r"):
+        f = open(file, mode)
+        Path(file).unlink()  # e.g. its blob was released right after the open
+        return f
+
+    monkeypatch.setattr(archives, "open", open_then_unlink, raising=False)
+    entry = ArchiveEntry("talk.txt", path, zipfile.ZIP_DEFLATED, (2020, 1, 1, 0, 0, 0))
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_zip([entry]))))
+    assert archive.read("talk.txt") == b"recording " * 1000
+    assert "MISSING.txt" not in archive.namelist()
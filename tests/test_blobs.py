@@ -0,0 +1,116 @@
+"""
+Tests for content-addressed, reference-counted upload storage.
+"""
+
+import asyncio
+import threading
+import uuid
+from pathlib import Path
+
+import httpx
+from sqlalchemy import text
+
+from app import blobs
+from app.main import UploadedFile, app, settings
+
+
+def _ref_count(db_session, sha256):
+    return db_session.connection().execute(
+        text("SELECT ref_count FROM file_blobs WHERE sha256 = :sha"), {"sha": sha256}
+    ).scalar()
+
+
+def test_identical_uploads_share_one_blob(client, auth_headers, db_session, seminar, upload_file):
+    content = f"same cv {uuid.uuid4()}".encode() * 1000
+    ids = [upload_file(content, name, category="cv") for name in ("cv.pdf", "cv-again.pdf")]
+
+    first, second = (db_session.get(UploadedFile, file_id) for file_id in ids)
+    sha256 = first.sha256
+    assert first.storage_filename == second.storage_filename == blobs.blob_relpath(sha256)
+    blob_path = Path(settings.uploads_dir) / first.storage_filename
+    assert blob_path.read_bytes() == content
+    assert _ref_count(db_session, sha256) == 2
+
+    url = f"/api/v1/seminars/seminars/{seminar.id}/files"
+    assert client.delete(f"{url}/{ids[0]}", headers=auth_headers).status_code == 200
+    db_session.expire_all()
+    assert blob_path.exists()
+    assert _ref_count(db_session, sha256) == 1
+    assert client.get(f"{url}/{ids[1]}/download", headers=auth_headers).content == content
+
+    assert client.delete(f"{url}/{ids[1]}", headers=auth_headers).status_code == 200
+    assert not blob_path.exists()
+    assert _ref_count(db_session, sha256) is None
+
+
+def test_dedupe_moves_legacy_files_into_blobs(db_session, seminar):
+    uploads_dir = Path(settings.uploads_dir)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+    content = f"legacy {uuid.uuid4()}".encode()
+    rows = []
+    for _ in range(2):
+        name = f"{uuid.uuid4().hex}.bin"
+        (uploads_dir / name).write_bytes(content)
+        row = UploadedFile(
+            seminar_id=seminar.id, original_filename="old.pdf", content_type="application/pdf",
+            file_size=len(content), storage_filename=name,
+        )
+        db_session.add(row)
+        rows.append(row)
+    db_session.commit()
+    legacy = [uploads_dir / row.storage_filename for row in rows]
+
+    report = blobs.dedupe_existing(db_session)
+    assert report["migrated"] >= 2
+    assert report["bytes_freed"] >= len(content)
+    for row in rows:
+        db_session.refresh(row)
+    assert rows[0].storage_filename == rows[1].storage_filename
+    assert blobs.is_blob(rows[0].storage_filename)
+    assert (uploads_dir / rows[0].storage_filename).read_bytes() == content
+    assert not any(path.exists() for path in legacy)
+    assert _ref_count(db_session, rows[0].sha256) == 2
+    assert blobs.dedupe_existing(db_session)["migrated"] == 0
+
+
+def test_uploads_wait_for_blob_lock_off_the_event_loop(auth_headers, seminar):
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock():  # e.g. the sweeper collecting blobs
+        with blobs.blob_lock:
+            held.set()
+            release.wait(5)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        async def upload():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                return await http.post(
+                    f"/api/v1/seminars/seminars/{seminar.id}/upload",
+                    data={"file_category": "cv"},
+                    files={"file": ("cv.pdf", f"locked {uuid.uuid4()}".encode(), "application/pdf")},
+                    headers=auth_headers,
+                )
+
+        async def unlock_later():
+            await asyncio.sleep(0.3)
+            release.set()
+
+        response, _, _ = await asyncio.gather(upload(), ticker(), unlock_later())
+        return response, ticks
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(5)
+    response, ticks = asyncio.run(run())
+    holder.join()
+    assert response.status_code == 200
+    assert ticks >= 10  # the loop kept running while the upload waited for the lock
@@ -0,0 +1,50 @@
+"""
+Tests for the dashboard bootstrap endpoint.
+"""
+
+from uuid import uuid4
+
+from app.main import SemesterPlan, SpeakerSuggestion
+
+
+def test_bootstrap_matches_individual_endpoints(client, auth_headers, db_session):
+    """Each section equals what its own endpoint returns; plan_id scopes suggestions."""
+    marker = uuid4().hex[:6]
+    plan = SemesterPlan(academic_year="2031-2032", semester="fall", name=f"Boot {marker}")
+    db_session.add(plan)
+    db_session.commit()
+    db_session.refresh(plan)
+    db_session.add(SpeakerSuggestion(
+        suggested_by="Faculty", speaker_name=f"Boot Speaker {marker}", semester_plan_id=plan.id,
+    ))
+    db_session.commit()
+
+    response = client.get("/api/v1/seminars/bootstrap", params={"plan_id": plan.id}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+    data = response.json()
+
+    def get(path, **params):
+        return client.get(path, params=params, headers=auth_headers).json()
+
+    assert data["user"] == get("/api/auth/me")
+    assert data["system_mode"] == get("/api/v1/seminars/system/mode")
+    assert data["semester_plans"] == get("/api/v1/seminars/semester-plans")
+    assert data["seminars"] == get("/api/v1/seminars/seminars")
+    assert data["speakers"] == get("/api/v1/seminars/speakers")
+    assert data["rooms"] == get("/api/rooms")
+    assert data["speaker_suggestions"] == get("/api/v1/seminars/speaker-suggestions", plan_id=plan.id)
+    assert [s["speaker_name"] for s in data["speaker_suggestions"]] == [f"Boot Speaker {marker}"]
+    assert data["planning_board"] == get(f"/api/v1/seminars/semester-plans/{plan.id}/planning-board")
+    assert data["activity"] == get("/api/v1/seminars/activity", plan_id=plan.id, limit=50)
+
+    unscoped = client.get("/api/v1/seminars/bootstrap", headers=auth_headers).json()
+    assert unscoped["planning_board"] is None
+    assert client.get("/api/v1/seminars/bootstrap", params={"plan_id": 10**9}, headers=auth_headers).status_code == 404
+
+    not_modified = client.get(
+        "/api/v1/seminars/bootstrap",
+        params={"plan_id": plan.id},
+        headers={**auth_headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert not_modified.status_code == 304
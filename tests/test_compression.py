@@ -0,0 +1,122 @@
+"""
+Tests for response compression, precompressed static assets and the cached SPA index.
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+import brotli
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from app.static_assets import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    InMemoryFile,
+    PrecompressedStaticFiles,
+    precompress_directory,
+)
+
+
+def test_public_page_is_gzip_compressed(client):
+    """Large HTML pages are gzip-compressed when the client asks for gzip."""
+    response = client.get("/public", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert "Seminar" in response.text
+
+
+def test_brotli_preferred_when_accepted(client):
+    """Brotli wins over gzip when the client accepts both."""
+    response = client.get("/public", headers={"Accept-Encoding": "gzip, br"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+
+
+def test_small_responses_are_not_compressed(client):
+    """Responses under the size threshold are sent as-is."""
+    response = client.get("/api/health", headers={"Accept-Encoding": "gzip, br"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_precompressed_assets_served_with_immutable_cache(tmp_path):
+    """Precompressed siblings are served directly with long-lived cache headers."""
+    bundle = tmp_path / "index-DhFmGQto.js"
+    source = b"console.log('seminars');\n" * 200
+    bundle.write_bytes(source)
+
+    stats = precompress_directory(tmp_path)
+    assert stats["gzip"] == 1
+    assert stats["br"] == 1
+    assert gzip.decompress((tmp_path / "index-DhFmGQto.js.gz").read_bytes()) == source
+    assert brotli.decompress((tmp_path / "index-DhFmGQto.js.br").read_bytes()) == source
+
+    # Second run finds nothing stale
+    assert precompress_directory(tmp_path)["gzip"] == 0
+
+    test_app = Starlette()
+    test_app.mount("/assets", PrecompressedStaticFiles(directory=str(tmp_path)), name="assets")
+    with TestClient(test_app) as static_client:
+        br_response = static_client.get("/assets/index-DhFmGQto.js", headers={"Accept-Encoding": "br"})
+        assert br_response.status_code == 200
+        assert br_response.headers["content-encoding"] == "br"
+        assert br_response.headers["content-type"].startswith("text/javascript")
+        assert br_response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert br_response.content == source
+
+        plain_response = static_client.get("/assets/index-DhFmGQto.js", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain_response.headers
+        assert plain_response.content == source
+
+
+def test_unhashed_assets_are_revalidated(tmp_path):
+    """Files without a content hash in their name are never cached as immutable."""
+    (tmp_path / "robots.txt").write_text("User-agent: *\n")
+    test_app = Starlette()
+    test_app.mount("/assets", PrecompressedStaticFiles(directory=str(tmp_path)), name="assets")
+    with TestClient(test_app) as static_client:
+        response = static_client.get("/assets/robots.txt")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+def test_index_served_from_memory_with_etag(client, monkeypatch):
+    """index.html is read once, then served from memory and revalidated via ETag."""
+    from app import main
+
+    monkeypatch.setattr(main, "SPA_INDEX", InMemoryFile(main.FRONTEND_DIST_DIR / "index.html"))
+    first = client.get("/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("index.html read from disk on a cached request")
+
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+    monkeypatch.setattr(Path, "open", fail_read)
+    again = client.get("/")
+    assert again.status_code == 200
+    assert again.content == first.content
+
+    not_modified = client.get("/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_in_memory_file_reloads_on_mtime_change(tmp_path):
+    """A changed mtime (e.g. a redeployed build) triggers a single re-read."""
+    index_file = tmp_path / "index.html"
+    index_file.write_text("<html>v1</html>")
+    cached = InMemoryFile(index_file)
+    first = cached.get()
+    assert first.body == b"<html>v1</html>"
+
+    index_file.write_text("<html>v2</html>")
+    os.utime(index_file, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+    second = cached.get()
+    assert second.body == b"<html>v2</html>"
+    assert second.etag != first.etag
@@ -0,0 +1,89 @@
+"""
+Tests for the trigger-maintained dashboard counters.
+"""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlmodel import func, select
+
+from app.counters import CHECKLIST_FLAGS, dashboard_counts, plan_fill_rates, rebuild_counters
+from app.main import SemesterPlan, Seminar, SeminarSlot, Speaker
+
+
+def _counted(db, today):
+    """The same metrics counted directly from the base tables."""
+    upcoming = Seminar.date >= today
+    return {
+        "upcoming_seminars": db.exec(select(func.count()).where(upcoming)).one(),
+        "pending_tasks": db.exec(select(func.count()).where(
+            upcoming,
+            (Seminar.room_booked == False) | (Seminar.announcement_sent == False) | (Seminar.calendar_invite_sent == False),  # noqa: E712
+        )).one(),
+        "pending_by_task": {
+            flag: db.exec(select(func.count()).where(upcoming, getattr(Seminar, flag) == False)).one()  # noqa: E712
+            for flag in CHECKLIST_FLAGS
+        },
+        "speakers": db.exec(select(func.count()).select_from(Speaker)).one(),
+    }
+
+
+def _from_counters(db, today):
+    counts = dashboard_counts(db, today)
+    return {
+        "upcoming_seminars": counts["upcoming_seminars"],
+        "pending_tasks": counts["pending_tasks"],
+        "pending_by_task": counts["pending_by_task"],
+        "speakers": counts["totals"]["speakers"],
+    }
+
+
+def test_counters_follow_inserts_updates_and_deletes(client, auth_headers, db_session):
+    today = date.today()
+    speaker = Speaker(name=f"Counter {uuid4().hex[:6]}")
+    plan = SemesterPlan(name=f"Counter plan {uuid4().hex[:6]}", academic_year="2030-2031", semester="fall")
+    db_session.add_all([speaker, plan])
+    db_session.commit()
+    seminars = [
+        Seminar(title="Counted", date=today + timedelta(days=offset), start_time="14:00", speaker_id=speaker.id, room_booked=booked)
+        for offset, booked in ((-3, False), (0, True), (5, False), (9, True))
+    ]
+    db_session.add_all(seminars)
+    db_session.commit()
+    assert _from_counters(db_session, today) == _counted(db_session, today)
+
+    # Bulk checklist update, a date moved into the past, and a delete
+    client.patch(
+        "/api/v1/seminars/seminars/batch",
+        json={"items": [{"seminar_id": seminars[2].id, "room_booked": True, "announcement_sent": True, "calendar_invite_sent": True}]},
+        headers=auth_headers,
+    )
+    seminars[3].date = today - timedelta(days=1)
+    db_session.add(seminars[3])
+    db_session.delete(seminars[1])
+    db_session.commit()
+    assert _from_counters(db_session, today) == _counted(db_session, today)
+
+    db_session.add_all([
+        SeminarSlot(semester_plan_id=plan.id, date=today, start_time="14:00", end_time="15:00", room="A", assigned_seminar_id=seminars[0].id),
+        SeminarSlot(semester_plan_id=plan.id, date=today, start_time="16:00", end_time="17:00", room="A"),
+    ])
+    db_session.commit()
+    fill = next(p for p in plan_fill_rates(db_session) if p["plan_id"] == plan.id)
+    assert (fill["slots"], fill["assigned"], fill["fill_rate"]) == (2, 1, 0.5)
+
+    rebuild_counters(db_session)
+    assert _from_counters(db_session, today) == _counted(db_session, today)
+
+    stats = client.get("/api/v1/seminars/dashboard/stats", headers=auth_headers).json()
+    assert stats["upcoming_seminars"] == _counted(db_session, today)["upcoming_seminars"]
+    assert any(p["plan_id"] == plan.id for p in stats["plans"])
+
+    # Leave no upcoming seminars behind for tests that count them
+    for slot in db_session.exec(select(SeminarSlot).where(SeminarSlot.semester_plan_id == plan.id)).all():
+        db_session.delete(slot)
+    db_session.commit()
+    for seminar in db_session.exec(select(Seminar).where(Seminar.speaker_id == speaker.id)).all():
+        db_session.delete(seminar)
+    db_session.commit()
+    assert _from_counters(db_session, today) == _counted(db_session, today)
@@ -0,0 +1,55 @@
+"""
+Tests for resized image derivatives of uploaded photos.
+"""
+
+import io
+
+import pytest
+
+from app import derivatives
+from app.main import UploadedFile
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _url(seminar, file_id):
+    return f"/api/v1/seminars/seminars/{seminar.id}/files/{file_id}/download"
+
+
+def _png(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGBA", (width, height), (200, 40, 90, 255)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_photo_variants_are_resized_and_cached(client, auth_headers, db_session, seminar, upload_file):
+    file_id = upload_file(_png(2400, 1600), "portrait.png", "image/png", "photo")
+    record, url = db_session.get(UploadedFile, file_id), _url(seminar, file_id)
+
+    original = client.get(url, headers=auth_headers)
+    thumb = client.get(f"{url}?variant=thumb", headers=auth_headers)
+    assert thumb.status_code == 200
+    assert thumb.headers["content-type"] == "image/jpeg"
+    assert thumb.headers["content-disposition"] == 'inline; filename="portrait-thumb.jpg"'
+    assert thumb.headers["etag"] not in (original.headers["etag"], None)
+    assert Image.open(io.BytesIO(thumb.content)).size == (320, 213)
+    assert derivatives.derivative_path(record.sha256, "thumb").exists()
+
+    web = client.get(f"{url}?variant=web", headers=auth_headers)
+    assert Image.open(io.BytesIO(web.content)).size == (1280, 853)
+    revalidated = client.get(f"{url}?variant=web", headers={**auth_headers, "If-None-Match": web.headers["etag"]})
+    assert revalidated.status_code == 304
+
+    assert client.get(f"{url}?variant=huge", headers=auth_headers).status_code == 422
+
+
+def test_non_images_fall_back_to_the_original(client, auth_headers, seminar, upload_file):
+    url = _url(seminar, upload_file(b"not a picture", "notes.txt", "text/plain", "photo"))
+    response = client.get(f"{url}?variant=thumb", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content == b"not a picture"
+
+    url = _url(seminar, upload_file(b"\x89PNG garbage", "broken.png", "image/png", "photo"))
+    response = client.get(f"{url}?variant=thumb", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content == b"\x89PNG garbage"
@@ -0,0 +1,128 @@
+"""
+Tests for conditional and ranged file downloads.
+"""
+
+import asyncio
+
+from app.compression import CompressionMiddleware
+from app.downloads import UploadFileResponse
+from app.main import app
+
+
+def _url(seminar, file_id):
+    return f"/api/v1/seminars/seminars/{seminar.id}/files/{file_id}/download"
+
+
+def test_download_validators_and_304(client, auth_headers, seminar, upload_file):
+    content = b"slides " * 50000
+    url = _url(seminar, upload_file(content, "deck.pdf"))
+
+    response = client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(content))
+    assert response.headers["content-disposition"] == 'attachment; filename="deck.pdf"'
+    etag = response.headers["etag"]
+    assert len(etag) == 66 and not etag.startswith("W/")
+
+    cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert client.get(url, headers={**auth_headers, "If-None-Match": '"other"'}).status_code == 200
+    since = response.headers["last-modified"]
+    assert client.get(url, headers={**auth_headers, "If-Modified-Since": since}).status_code == 304
+
+
+def test_download_ranges_resume(client, auth_headers, seminar, upload_file):
+    content = bytes(range(256)) * 4000
+    size = len(content)
+    url = _url(seminar, upload_file(content, "deck.pdf"))
+    etag = client.get(url, headers=auth_headers).headers["etag"]
+
+    part = client.get(url, headers={**auth_headers, "Range": "bytes=1000-"})
+    assert part.status_code == 206
+    assert part.content == content[1000:]
+    assert part.headers["content-range"] == f"bytes 1000-{size - 1}/{size}"
+
+    assert client.get(url, headers={**auth_headers, "Range": "bytes=10-19"}).content == content[10:20]
+    assert client.get(url, headers={**auth_headers, "Range": "bytes=-5"}).content == content[-5:]
+
+    resumed = client.get(url, headers={**auth_headers, "Range": "bytes=500-", "If-Range": etag})
+    assert resumed.status_code == 206 and resumed.content == content[500:]
+    stale = client.get(url, headers={**auth_headers, "Range": "bytes=500-", "If-Range": '"stale"'})
+    assert stale.status_code == 200 and stale.content == content
+
+    unsatisfiable = client.get(url, headers={**auth_headers, "Range": f"bytes={size}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{size}"
+    assert client.get(url, headers={**auth_headers, "Range": "bytes=0-1,5-6"}).status_code == 200
+
+
+def _asgi_get(asgi_app, url, headers, extensions):
+    """Run one GET against ``asgi_app`` as a server offering ``extensions`` would."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    path, _, query = url.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+        "root_path": "", "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80), "extensions": extensions, "state": {},
+    }
+    asyncio.run(asgi_app(scope, receive, send))
+    return messages
+
+
+def test_pathsend_passes_through_compression(auth_headers, seminar, upload_file, tmp_path):
+    content = b"speaker notes, line after line\n" * 2000
+    url = _url(seminar, upload_file(content, "notes.txt", "text/plain"))
+    headers = {**auth_headers, "Accept-Encoding": "gzip"}
+
+    # pathsend through the whole app, compressible type and all
+    messages = _asgi_get(app, url, headers, {"http.response.pathsend": {}})
+    assert [m["type"] for m in messages] == ["http.response.start", "http.response.pathsend"]
+    start = dict(messages[0]["headers"])
+    assert b"content-encoding" not in start
+    assert start[b"content-length"] == str(len(content)).encode()
+    with open(messages[1]["path"], "rb") as f:
+        assert f.read() == content
+
+    # Behind compression, for a compressible response without Accept-Ranges
+    path = tmp_path / "notes.txt"
+    path.write_bytes(content)
+    response = UploadFileResponse(path, 0, len(content), 200, {}, "text/plain")
+    messages = _asgi_get(CompressionMiddleware(response), "/", {"Accept-Encoding": "gzip"}, {"http.response.pathsend": {}})
+    assert [m["type"] for m in messages] == ["http.response.start", "http.response.pathsend"]
+    assert messages[1]["path"] == str(path)
+
+    # Ranges are streamed even when pathsend is offered
+    messages = _asgi_get(app, url, {**headers, "Range": "bytes=100-"}, {"http.response.pathsend": {}})
+    assert messages[0]["status"] == 206
+    assert {m["type"] for m in messages[1:]} == {"http.response.body"}
+    assert b"".join(m.get("body", b"") for m in messages[1:]) == content[100:]
+
+
+def test_compressible_download_resumes_with_matching_offsets(client, auth_headers, seminar, upload_file):
+    content = b"".join(f"{i},speaker-{i},room-{i % 7}\n".encode() for i in range(12000))
+    url = _url(seminar, upload_file(content, "roster.csv", "text/csv"))
+    headers = {**auth_headers, "Accept-Encoding": "gzip"}
+
+    full = client.get(url, headers=headers)
+    assert full.status_code == 200
+    assert "content-encoding" not in full.headers
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-length"] == str(len(content))
+    assert not full.headers["etag"].startswith("W/")
+
+    resumed = client.get(url, headers={**headers, "Range": "bytes=100-", "If-Range": full.headers["last-modified"]})
+    assert resumed.status_code == 206
+    assert "content-encoding" not in resumed.headers
+    assert content[:100] + resumed.content == content
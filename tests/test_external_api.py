@@ -2,9 +2,14 @@
 Tests for external API (dashboard integration).
 """
 
-import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
+import pytest
+
+from app import main
+from app.caching import TTLCache
 from app.main import Seminar, Speaker, Room, settings
 
 
@@ -53,3 +58,41 @@ def test_external_invalid_secret(client):
     """Test external endpoint with invalid secret returns 401."""
     response = client.get("/api/external/stats?secret=invalid-secret")
     assert response.status_code == 401
+
+
+def test_external_upcoming_is_cached_until_a_write(client, db_session):
+    """Repeat polls are served from cache; a seminar write changes the response."""
+    params = {"secret": settings.api_secret, "limit": 50}
+    first = client.get("/api/external/upcoming", params=params).json()
+    hits = main._external_upcoming_cache.hits
+    assert client.get("/api/external/upcoming", params=params).json() == first
+    assert main._external_upcoming_cache.hits == hits + 1
+
+    speaker = Speaker(name="Cache Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Cache Seminar", date=date.today() + timedelta(days=3), start_time="10:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    titles = [s["title"] for s in client.get("/api/external/upcoming", params=params).json()["seminars"]]
+    assert "Cache Seminar" in titles
+
+    db_session.delete(seminar)
+    db_session.commit()
+
+
+def test_ttl_cache_single_flight():
+    """Concurrent misses for one key run the factory once."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: cache.get_or_set("key", factory), range(8)))
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert not cache._flights
@@ -0,0 +1,37 @@
+"""
+Tests for the fast JSON response path.
+"""
+
+import json
+from datetime import date, datetime
+
+from app import fast_json
+from app.core import record_activity
+from app.fast_json import dumps, json_array, splice_raw_field
+
+
+def test_dumps_matches_stdlib_fallback(monkeypatch):
+    """orjson and the stdlib fallback produce the same document."""
+    content = {"when": datetime(2026, 3, 1, 14, 30, 5, 120), "day": date(2026, 3, 1), "name": "Zoë", 3: None}
+    fast = dumps(content)
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert json.loads(dumps(content)) == json.loads(fast)
+    assert json.loads(fast) == {"when": "2026-03-01T14:30:05.000120", "day": "2026-03-01", "name": "Zoë", "3": None}
+
+
+def test_splice_raw_field():
+    """Stored JSON is embedded byte-for-byte; missing values become null."""
+    assert json.loads(splice_raw_field(dumps({"id": 1}), "details", '{"a": [1, 2]}')) == {"id": 1, "details": {"a": [1, 2]}}
+    assert json.loads(splice_raw_field(b"{}", "details", None)) == {"details": None}
+    assert json_array([]) == b"[]"
+
+
+def test_activity_details_pass_through(client, auth_headers, db_session):
+    """The activity feed returns stored details unchanged without decoding them server-side."""
+    record_activity(db_session, "FAST_JSON_TEST", "fast json", details={"changes": [{"field": "title", "after": "Ünïcode"}]})
+    db_session.commit()
+    response = client.get("/api/v1/seminars/activity", params={"limit": 500}, headers=auth_headers)
+    assert response.status_code == 200
+    event = next(e for e in response.json() if e["event_type"] == "FAST_JSON_TEST")
+    assert event["details"] == {"changes": [{"field": "title", "after": "Ünïcode"}]}
+    assert set(event) == {"id", "semester_plan_id", "event_type", "summary", "entity_type", "entity_id", "actor", "created_at", "details"}
@@ -0,0 +1,60 @@
+"""
+Tests for the background maintenance sweeper.
+"""
+
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from app import maintenance
+from app.main import SpeakerAvailability, SpeakerSuggestion, SpeakerToken, SpeakerWorkflow
+
+
+def _token(suggestion_id, expires_at):
+    return SpeakerToken(
+        token=uuid4().hex,
+        suggestion_id=suggestion_id,
+        token_type="availability",
+        expires_at=expires_at,
+    )
+
+
+def test_sweep_removes_expired_tokens_and_orphans(client, auth_headers, db_session):
+    """Long-expired tokens and rows of deleted suggestions go; everything else stays."""
+    suggestion = SpeakerSuggestion(suggested_by="tester", speaker_name="Sweep Speaker")
+    db_session.add(suggestion)
+    db_session.commit()
+    db_session.refresh(suggestion)
+    now = datetime.utcnow()
+    old = _token(suggestion.id, now - timedelta(days=45))
+    recently_expired = _token(suggestion.id, now - timedelta(days=1))
+    live = _token(suggestion.id, now + timedelta(days=1))
+    missing_suggestion_id = suggestion.id + 100_000
+    orphan_availability = SpeakerAvailability(suggestion_id=missing_suggestion_id, date=date.today())
+    orphan_workflow = SpeakerWorkflow(suggestion_id=missing_suggestion_id)
+    kept_availability = SpeakerAvailability(suggestion_id=suggestion.id, date=date.today())
+    db_session.add_all([old, recently_expired, live, orphan_availability, orphan_workflow, kept_availability])
+    db_session.commit()
+    ids = {name: row.id for name, row in {
+        "old": old, "recent": recently_expired, "live": live,
+        "orphan_availability": orphan_availability, "orphan_workflow": orphan_workflow,
+        "kept_availability": kept_availability,
+    }.items()}
+
+    report = maintenance.run_sweep(batch_size=1)  # one row per transaction exercises the batching
+    assert report["removed"]["expired_tokens"] >= 1
+    assert report["removed"]["orphaned_availability"] >= 1
+    assert report["removed"]["orphaned_workflows"] >= 1
+
+    db_session.expire_all()
+    assert db_session.get(SpeakerToken, ids["old"]) is None
+    assert db_session.get(SpeakerToken, ids["recent"]) is not None
+    assert db_session.get(SpeakerToken, ids["live"]) is not None
+    assert db_session.get(SpeakerAvailability, ids["orphan_availability"]) is None
+    assert db_session.get(SpeakerWorkflow, ids["orphan_workflow"]) is None
+    assert db_session.get(SpeakerAvailability, ids["kept_availability"]) is not None
+
+    response = client.post("/api/admin/db/maintenance/sweep", headers=auth_headers)
+    assert response.status_code == 200
+    assert sum(response.json()["removed"].values()) == 0
+    response = client.get("/api/admin/db/maintenance/sweep", headers=auth_headers)
+    assert response.json()["last_sweep"]["removed"]["expired_tokens"] == 0
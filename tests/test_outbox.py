@@ -0,0 +1,127 @@
+"""
+Tests for the transactional outbox and webhook dispatcher, against a local receiver.
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app import outbox
+from app.main import Seminar, Speaker, settings
+from app.models import OutboxEvent
+
+
+class _Receiver(BaseHTTPRequestHandler):
+    batches = []
+    fail_next = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if _Receiver.fail_next:
+            _Receiver.fail_next -= 1
+            self.send_response(503)
+        else:
+            _Receiver.batches.append((dict(self.headers), json.loads(body), body))
+            self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def receiver(monkeypatch):
+    server = HTTPServer(("127.0.0.1", 0), _Receiver)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Receiver.batches = []
+    _Receiver.fail_next = 0
+    monkeypatch.setattr(settings, "webhook_urls", f"http://127.0.0.1:{server.server_port}/hook")
+    monkeypatch.setattr(settings, "webhook_secret", "test-secret")
+    yield _Receiver
+    server.shutdown()
+    server.server_close()
+
+
+def _events(db, seminar_id):
+    db.expire_all()
+    return db.exec(
+        select(OutboxEvent).where(OutboxEvent.entity_type == "seminar", OutboxEvent.entity_id == seminar_id).order_by(OutboxEvent.id)
+    ).all()
+
+
+def test_changes_are_delivered_in_signed_batches(receiver, client, auth_headers, db_session):
+    speaker = Speaker(name=f"Outbox {uuid4().hex[:6]}")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Outbox seminar", date=date(2034, 1, 5), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    client.patch(
+        "/api/v1/seminars/seminars/batch",
+        json={"items": [{"seminar_id": seminar.id, "room_booked": True}]},
+        headers=auth_headers,
+    )
+
+    # A rolled-back change leaves no event behind
+    seminar.title = "Never committed"
+    db_session.add(seminar)
+    db_session.flush()
+    db_session.rollback()
+
+    events = _events(db_session, seminar.id)
+    assert [e.event_type for e in events] == ["seminar.created", "seminar.updated"]
+    assert json.loads(events[1].payload_json)["changed"] == ["room_booked", "updated_at"]
+
+    report = outbox.dispatch_once()
+    assert report["delivered"] >= 2
+    headers, batch, raw = receiver.batches[-1]
+    expected = hmac.new(b"test-secret", raw, hashlib.sha256).hexdigest()
+    assert headers["X-Seminars-Signature"] == f"sha256={expected}"
+    delivered = [e for e in batch["events"] if e["entity_id"] == seminar.id]
+    assert [e["event_type"] for e in delivered] == ["seminar.created", "seminar.updated"]
+    assert delivered[1]["payload"]["data"]["room_booked"] is True
+    assert all(e.status == "delivered" for e in _events(db_session, seminar.id))
+
+
+def test_failed_delivery_backs_off_then_retries(receiver, db_session):
+    speaker = Speaker(name=f"Outbox retry {uuid4().hex[:6]}")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Retry seminar", date=date(2034, 2, 5), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+
+    receiver.fail_next = 1
+    report = outbox.dispatch_once()
+    assert report["retrying"] >= 1
+    [event] = _events(db_session, seminar.id)
+    assert (event.status, event.attempts) == ("pending", 1)
+    assert "HTTP 503" in event.last_error
+    assert event.next_attempt_at > datetime.utcnow()
+    assert outbox.dispatch_once()["sent"] == 0  # not due yet
+
+    event.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.add(event)
+    db_session.commit()
+    assert outbox.dispatch_once()["delivered"] >= 1
+    [event] = _events(db_session, seminar.id)
+    assert (event.status, event.attempts, event.last_error) == ("delivered", 2, None)
+
+
+def test_nothing_is_enqueued_without_webhooks(db_session):
+    assert settings.webhook_urls == ""
+    speaker = Speaker(name=f"No hooks {uuid4().hex[:6]}")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Quiet seminar", date=date(2034, 3, 5), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    assert _events(db_session, seminar.id) == []
@@ -0,0 +1,99 @@
+"""
+Tests for keyset pagination and filters on list endpoints.
+"""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+from app.main import Seminar, Speaker
+from app.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Cursors restore typed sort keys (dates come back as dates)."""
+    cursor = encode_cursor([date(2026, 3, 1), 7])
+    assert decode_cursor(cursor, (Seminar.date, Seminar.id)) == [date(2026, 3, 1), 7]
+
+
+def test_seminar_pages_follow_cursor(client, auth_headers, db_session):
+    """Pages are disjoint, ordered by (date, id) and cover every matching row."""
+    prefix = f"Page{uuid4().hex[:6]}"
+    speaker = Speaker(name=f"{prefix} Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    start = date(2031, 1, 1)
+    seminars = [
+        Seminar(title=f"{prefix} {i}", date=start + timedelta(days=i // 2), start_time="14:00", speaker_id=speaker.id)
+        for i in range(5)
+    ]
+    db_session.add_all(seminars)
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"q": prefix, "limit": 2, "include_total": "true"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/seminars/seminars", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == "5"
+        seen.extend((row["date"], row["id"]) for row in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert pages == 3
+    assert seen == sorted(seen)
+    assert len(set(seen)) == 5
+
+    # Filters combine with paging; unpaginated requests still return everything
+    response = client.get(
+        "/api/seminars",
+        params={"q": prefix, "date_from": (start + timedelta(days=1)).isoformat(), "date_to": (start + timedelta(days=1)).isoformat()},
+        headers=auth_headers,
+    )
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/api/v1/seminars/seminars", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+    response = client.get("/api/v1/seminars/seminars", params={"limit": 10_000}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_speaker_prefix_filter_escapes_wildcards(client, auth_headers, db_session):
+    """A literal % in the prefix is not a LIKE wildcard."""
+    marker = uuid4().hex[:6]
+    db_session.add_all([Speaker(name=f"{marker}%Ada"), Speaker(name=f"{marker}xAda")])
+    db_session.commit()
+    response = client.get("/api/v1/seminars/speakers", params={"q": f"{marker}%"}, headers=auth_headers)
+    assert [s["name"] for s in response.json()] == [f"{marker}%Ada"]
+
+
+def test_summary_view_projects_list_columns(client, auth_headers, db_session):
+    """view=summary returns only list columns, flattened, and still paginates."""
+    prefix = f"Sum{uuid4().hex[:6]}"
+    speaker = Speaker(name=f"{prefix} Speaker", affiliation="Summary U", bio="Long bio " * 50)
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    db_session.add_all([
+        Seminar(title=f"{prefix} {i}", date=date(2032, 1, 1 + i), start_time="14:00", speaker_id=speaker.id, abstract="Long abstract " * 50)
+        for i in range(3)
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/seminars/seminars", params={"q": prefix, "view": "summary", "limit": 2}, headers=auth_headers)
+    assert response.status_code == 200
+    rows = response.json()
+    assert set(rows[0]) == {"id", "title", "date", "start_time", "end_time", "status", "speaker_id", "speaker_name", "room"}
+    assert rows[0]["speaker_name"] == speaker.name
+    assert [r["title"] for r in rows] == [f"{prefix} 0", f"{prefix} 1"]
+    assert response.headers["X-Next-Cursor"]
+
+    response = client.get("/api/speakers", params={"q": prefix, "view": "summary"}, headers=auth_headers)
+    assert response.json() == [{"id": speaker.id, "name": speaker.name, "affiliation": "Summary U", "email": None}]
+    assert client.get("/api/speakers", params={"view": "everything"}, headers=auth_headers).status_code == 422
@@ -0,0 +1,73 @@
+"""
+Tests for reconciling the uploads directory with uploaded_files.
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from datetime import date
+from pathlib import Path
+
+from app import blobs, reconcile
+from app.derivatives import derivative_path
+from app.main import Seminar, Speaker, UploadedFile, settings
+from app.resumable import session_path
+
+
+def _old(path: Path, content: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    past = time.time() - 7200
+    os.utime(path, (past, past))
+    return path
+
+
+def test_reconcile_reports_and_purges_orphans(client, auth_headers, db_session):
+    speaker = Speaker(name="Reconcile Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Reconcile Talk", date=date(2020, 7, 1), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    kept = client.post(
+        f"/api/v1/seminars/seminars/{seminar.id}/upload",
+        data={"file_category": "cv"},
+        files={"file": ("kept.pdf", f"kept {uuid.uuid4()}".encode(), "application/pdf")},
+        headers=auth_headers,
+    )
+    kept_path = Path(settings.uploads_dir) / db_session.get(UploadedFile, kept.json()["file_id"]).storage_filename
+    os.utime(kept_path, (time.time() - 7200, time.time() - 7200))
+
+    root = Path(settings.uploads_dir)
+    stray_sha = hashlib.sha256(uuid.uuid4().bytes).hexdigest()
+    orphans = [
+        _old(root / f"{uuid.uuid4().hex}.bin", b"x" * 100),
+        _old(root / f".{uuid.uuid4().hex}.part", b"x" * 10),
+        _old(root / blobs.blob_relpath(stray_sha), b"x" * 1000),
+        _old(derivative_path(stray_sha, "thumb"), b"x" * 5),
+        _old(session_path(uuid.uuid4().hex), b"x" * 7),
+    ]
+    fresh = root / f"{uuid.uuid4().hex}.bin"
+    fresh.write_bytes(b"in progress")
+    db_session.add(UploadedFile(
+        seminar_id=seminar.id, original_filename="lost.pdf", content_type="application/pdf",
+        file_size=321, storage_filename=f"{uuid.uuid4().hex}.bin",
+    ))
+    db_session.commit()
+
+    report = reconcile.reconcile(batch_size=2)
+    assert report["purge"] is False
+    for kind in ("legacy_files", "temp_files", "blobs", "derivatives", "session_parts"):
+        assert report["orphans"][kind] >= 1
+    assert report["reclaimable_bytes"] >= 1122
+    assert report["missing_files"] >= 1 and report["missing_bytes"] >= 321
+    assert report["samples"]["missing_files"]
+    assert all(path.exists() for path in orphans)
+
+    purged = reconcile.reconcile(purge=True, batch_size=2)
+    assert purged["purged_files"] >= len(orphans)
+    assert purged["purged_bytes"] >= 1122
+    assert not any(path.exists() for path in orphans)
+    assert kept_path.exists() and fresh.exists()
+    fresh.unlink()
@@ -0,0 +1,139 @@
+"""
+Tests for resumable, chunked speaker uploads.
+"""
+
+import asyncio
+import hashlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app import resumable
+from app.main import (
+    Seminar,
+    Speaker,
+    SpeakerSuggestion,
+    SpeakerToken,
+    UploadedFile,
+    UploadSession,
+    get_engine,
+    save_uploaded_file,
+    settings,
+)
+
+
+def _token(db_session):
+    speaker = Speaker(name="Resumable Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Resumable Talk", date=date(2020, 5, 1), start_time="14:00", speaker_id=speaker.id)
+    suggestion = SpeakerSuggestion(suggested_by="tester", speaker_name=speaker.name, speaker_id=speaker.id)
+    db_session.add_all([seminar, suggestion])
+    db_session.commit()
+    token = SpeakerToken(
+        token=uuid4().hex,
+        suggestion_id=suggestion.id,
+        token_type="info",
+        seminar_id=seminar.id,
+        expires_at=datetime.utcnow() + timedelta(days=1),
+    )
+    db_session.add(token)
+    db_session.commit()
+    return token.token
+
+
+def test_chunked_upload_resumes_and_verifies_hash(client, db_session):
+    token = _token(db_session)
+    content = bytes(range(256)) * 3000
+    digest = hashlib.sha256(content).hexdigest()
+    base = f"/api/v1/seminars/speaker-tokens/{token}/uploads"
+
+    created = client.post(base, json={"filename": "talk.mp4", "size": len(content), "category": "slides", "content_type": "video/mp4"})
+    assert created.status_code == 201
+    session_id = created.json()["session_id"]
+    url = f"{base}/{session_id}"
+
+    first = client.put(f"{url}?offset=0", content=content[:300000])
+    assert first.status_code == 200
+    assert first.json()["offset"] == 300000 and first.headers["upload-offset"] == "300000"
+
+    # A retried chunk with a stale offset is refused with the offset to resume from
+    stale = client.put(f"{url}?offset=0", content=content[:1000])
+    assert stale.status_code == 409 and stale.headers["upload-offset"] == "300000"
+    assert client.get(url).json()["offset"] == 300000
+
+    assert client.post(f"{url}/complete", json={"sha256": digest}).status_code == 409
+    assert client.put(f"{url}?offset=300000", content=content[300000:]).json()["complete"] is True
+
+    done = client.post(f"{url}/complete", json={"sha256": digest})
+    assert done.status_code == 200
+    record = db_session.get(UploadedFile, done.json()["file_id"])
+    assert (record.sha256, record.file_size, record.original_filename) == (digest, len(content), "talk.mp4")
+    assert (Path(settings.uploads_dir) / record.storage_filename).read_bytes() == content
+    assert db_session.get(UploadSession, session_id) is None
+    assert not resumable.session_path(session_id).exists()
+
+    # The first response was lost: a retried complete reports the stored file
+    retried = client.post(f"{url}/complete", json={"sha256": digest})
+    assert retried.status_code == 409
+    assert str(record.id) in retried.json()["detail"]
+
+
+def test_concurrent_completes_store_the_file_once(client, db_session):
+    token = _token(db_session)
+    content = b"recording " * 5000
+    digest = hashlib.sha256(content).hexdigest()
+    base = f"/api/v1/seminars/speaker-tokens/{token}/uploads"
+    session_id = client.post(base, json={"filename": "talk.mp3", "size": len(content)}).json()["session_id"]
+    assert client.put(f"{base}/{session_id}?offset=0", content=content).status_code == 200
+
+    async def complete(db):
+        session = db.get(UploadSession, session_id)
+        seminar_id = session.seminar_id
+        uploaded = await resumable.complete_session(db, session, digest, lambda stored: save_uploaded_file(stored, seminar_id, db))
+        return uploaded.id, uploaded.seminar_id
+
+    async def both():
+        with Session(get_engine()) as first, Session(get_engine()) as second:
+            return await asyncio.gather(complete(first), complete(second), return_exceptions=True)
+
+    results = asyncio.run(both())
+    stored = [r for r in results if isinstance(r, tuple)]
+    refused = [r for r in results if isinstance(r, HTTPException)]
+    assert len(stored) == 1 and len(refused) == 1
+    assert refused[0].status_code == 409 and str(stored[0][0]) in refused[0].detail
+    assert resumable.completed_upload(session_id, stored[0][1] + 1) is None  # other seminars see 404
+
+
+def test_hash_mismatch_and_oversized_chunks_are_refused(client, db_session):
+    token = _token(db_session)
+    base = f"/api/v1/seminars/speaker-tokens/{token}/uploads"
+    session_id = client.post(base, json={"filename": "a.bin", "size": 10, "sha256": "0" * 64}).json()["session_id"]
+    url = f"{base}/{session_id}"
+
+    too_long = client.put(f"{url}?offset=0", content=b"x" * 11)
+    assert too_long.status_code == 413
+    assert client.put(f"{url}?offset=0", content=b"x" * 10).status_code == 200
+    mismatch = client.post(f"{url}/complete")
+    assert mismatch.status_code == 422
+    assert client.get(url).status_code == 404
+
+    big = client.post(base, json={"filename": "cv.pdf", "size": 50 * 1024 * 1024, "category": "cv"})
+    assert big.status_code == 413
+
+
+def test_expired_sessions_are_swept(client, db_session):
+    token = _token(db_session)
+    session_id = client.post(
+        f"/api/v1/seminars/speaker-tokens/{token}/uploads", json={"filename": "old.bin", "size": 5}
+    ).json()["session_id"]
+    assert resumable.session_path(session_id).exists()
+
+    removed = resumable.sweep_expired(get_engine(), now=datetime.utcnow() + timedelta(hours=settings.upload_session_ttl_hours + 1))
+    assert removed >= 1
+    db_session.expire_all()
+    assert db_session.get(UploadSession, session_id) is None
+    assert not resumable.session_path(session_id).exists()
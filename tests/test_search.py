@@ -0,0 +1,71 @@
+"""
+Tests for full-text search.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+from app.main import Seminar, Speaker
+from app.search import build_match_query
+
+
+def test_build_match_query_neutralises_operators():
+    """User input never reaches FTS5 as syntax; the last term is a prefix match."""
+    assert build_match_query('econ NEAR "growth') == '"econ" "NEAR" "growth"*'
+    assert build_match_query("  -*()  ") is None
+
+
+def test_search_ranks_and_tracks_updates(client, auth_headers, db_session):
+    """Triggers keep the index in sync with inserts, updates and deletes."""
+    marker = f"zq{uuid4().hex[:8]}"
+    speaker = Speaker(name=f"Ada {marker}", affiliation="Lovelace Institute", bio="Works on <b>engines</b>")
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    seminar = Seminar(
+        title=f"Analytical {marker} engines",
+        abstract="Notes on the difference engine",
+        date=date.today(),
+        start_time="14:00",
+        speaker_id=speaker.id,
+    )
+    db_session.add(seminar)
+    db_session.commit()
+    db_session.refresh(seminar)
+
+    response = client.get(f"/api/v1/seminars/search?q={marker}", headers=auth_headers)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert {(r["type"], r["id"]) for r in results} == {("seminar", seminar.id), ("speaker", speaker.id)}
+    seminar_hit = next(r for r in results if r["type"] == "seminar")
+    assert f"<mark>{marker}</mark>" in seminar_hit["snippet"]
+
+    # Prefix match on the last term, restricted to one type
+    response = client.get(f"/api/v1/seminars/search?q={marker[:5]}&types=speaker", headers=auth_headers)
+    assert [r["id"] for r in response.json()["results"]] == [speaker.id]
+
+    seminar.title = f"Renamed {marker[::-1]}"
+    db_session.add(seminar)
+    db_session.commit()
+    response = client.get(f"/api/v1/seminars/search?q={marker}&types=seminar", headers=auth_headers)
+    assert response.json()["results"] == []
+    response = client.get(f"/api/v1/seminars/search?q={marker[::-1]}&types=seminar", headers=auth_headers)
+    assert [r["id"] for r in response.json()["results"]] == [seminar.id]
+
+    db_session.delete(seminar)
+    db_session.commit()
+    response = client.get(f"/api/v1/seminars/search?q={marker[::-1]}&types=seminar", headers=auth_headers)
+    assert response.json()["results"] == []
+
+
+def test_search_rejects_unknown_type(client, auth_headers):
+    """Unknown result types are a client error, not an empty result."""
+    response = client.get("/api/v1/seminars/search?q=x&types=rooms", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_rebuild_search_index(client, auth_headers):
+    """Admins can rebuild every index on demand."""
+    response = client.post("/api/admin/db/search/rebuild", headers=auth_headers)
+    assert response.status_code == 200
+    assert set(response.json()["rebuilt"]) == {"seminar", "speaker", "suggestion"}
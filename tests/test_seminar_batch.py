@@ -0,0 +1,114 @@
+"""
+Tests for the batch seminar update endpoint.
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import select
+
+from app import speaker_tokens
+from app.core import get_engine
+from app.main import ActivityEvent, Seminar, Speaker, SpeakerSuggestion, SpeakerToken
+from app.speaker_tokens import resolve_token
+
+
+def test_batch_update_applies_changes_in_one_commit(client, auth_headers, db_session):
+    """Changed seminars are written together with one grouped activity event."""
+    marker = uuid4().hex[:6]
+    speaker = Speaker(name=f"Batch {marker}")
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    seminars = [Seminar(title=f"Batch {marker} {i}", date=date(2033, 2, 1 + i), start_time="14:00", speaker_id=speaker.id) for i in range(3)]
+    db_session.add_all(seminars)
+    db_session.commit()
+    first, second, third = (s.id for s in seminars)
+
+    commits = []
+    engine = get_engine()
+    listener = lambda conn: commits.append(conn)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    try:
+        response = client.patch(
+            "/api/v1/seminars/seminars/batch",
+            json={"items": [
+                {"seminar_id": first, "room_booked": True, "catering_ordered": True},
+                {"seminar_id": second, "room_booked": False},
+                {"seminar_id": third, "announcement_sent": True, "notes": "Sent"},
+                {"seminar_id": 10**9, "room_booked": True},
+            ]},
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "commit", listener)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["updated"], body["unchanged"], body["not_found"]) == (2, 1, 1)
+    assert [r["status"] for r in body["results"]] == ["updated", "unchanged", "updated", "not_found"]
+    assert len(commits) == 1
+
+    db_session.expire_all()
+    assert db_session.get(Seminar, first).room_booked is True
+    assert db_session.get(Seminar, first).catering_ordered is True
+    assert db_session.get(Seminar, third).notes == "Sent"
+
+    event_row = db_session.exec(
+        select(ActivityEvent).where(ActivityEvent.event_type == "SEMINARS_BATCH_UPDATED").order_by(ActivityEvent.id.desc())
+    ).first()
+    details = json.loads(event_row.details_json)
+    assert details["seminar_ids"] == [first, third]
+    assert {(c["seminar_id"], c["field"]) for c in details["changes"]} == {
+        (first, "room_booked"), (first, "catering_ordered"), (third, "announcement_sent"), (third, "notes"),
+    }
+
+
+def test_batch_update_rejects_duplicates(client, auth_headers):
+    response = client.patch(
+        "/api/v1/seminars/seminars/batch",
+        json={"items": [{"seminar_id": 1, "room_booked": True}, {"seminar_id": 1, "room_booked": False}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert client.patch("/api/v1/seminars/seminars/batch", json={"items": []}, headers=auth_headers).status_code == 422
+
+
+def _fallback_token(db_session, speaker):
+    """An info token without a seminar of its own: it resolves to the speaker's first seminar."""
+    suggestion = SpeakerSuggestion(suggested_by="tester", speaker_name=speaker.name, speaker_id=speaker.id)
+    db_session.add(suggestion)
+    db_session.commit()
+    token = SpeakerToken(
+        token=uuid4().hex, suggestion_id=suggestion.id, token_type="info",
+        expires_at=datetime.utcnow() + timedelta(days=1),
+    )
+    db_session.add(token)
+    db_session.commit()
+    return token.token
+
+
+def test_batch_speaker_change_invalidates_only_affected_token_contexts(client, auth_headers, db_session):
+    marker = uuid4().hex[:6]
+    old, new, bystander = (Speaker(name=f"Batch token {marker} {i}") for i in range(3))
+    db_session.add_all([old, new, bystander])
+    db_session.commit()
+    moved = Seminar(title=f"Moved {marker}", date=date(2020, 6, 1), start_time="14:00", speaker_id=old.id)
+    kept = Seminar(title=f"Kept {marker}", date=date(2020, 6, 2), start_time="14:00", speaker_id=bystander.id)
+    db_session.add_all([moved, kept])
+    db_session.commit()
+    moved_token, kept_token = _fallback_token(db_session, old), _fallback_token(db_session, bystander)
+    assert resolve_token(db_session, moved_token).seminar_id == moved.id
+    assert resolve_token(db_session, kept_token).seminar_id == kept.id
+
+    response = client.patch(
+        "/api/v1/seminars/seminars/batch",
+        json={"items": [{"seminar_id": moved.id, "speaker_id": new.id}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200 and response.json()["updated"] == 1
+
+    assert moved_token not in speaker_tokens._token_cache
+    assert kept_token in speaker_tokens._token_cache
+    assert resolve_token(db_session, moved_token).seminar_id is None  # the old speaker has no seminar left
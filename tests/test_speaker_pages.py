@@ -0,0 +1,74 @@
+"""
+Tests for the static speaker page shells and the status data endpoint.
+"""
+
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from app.main import Seminar, Speaker, SpeakerSuggestion, SpeakerToken
+
+
+def _make_status_token(db_session):
+    speaker = Speaker(name="Shell Speaker", affiliation="Shell University")
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    seminar = Seminar(title="Shell <Talk>", date=date(2026, 11, 5), start_time="14:00", speaker_id=speaker.id)
+    suggestion = SpeakerSuggestion(
+        suggested_by="tester",
+        speaker_name=speaker.name,
+        speaker_affiliation=speaker.affiliation,
+        speaker_id=speaker.id,
+    )
+    db_session.add(seminar)
+    db_session.add(suggestion)
+    db_session.commit()
+    db_session.refresh(seminar)
+    token = SpeakerToken(
+        token=uuid4().hex,
+        suggestion_id=suggestion.id,
+        token_type="status",
+        expires_at=datetime.utcnow() + timedelta(days=1),
+    )
+    db_session.add(token)
+    db_session.commit()
+    db_session.refresh(token)
+    return token, seminar
+
+
+def test_speaker_page_shells_are_token_independent(client):
+    """Every token gets the same compressed, revalidatable shell with no speaker data in it."""
+    for page in ("availability", "info", "status"):
+        first = client.get(f"/speaker/{page}/{uuid4().hex}", headers={"Accept-Encoding": "gzip"})
+        second = client.get(f"/speaker/{page}/{uuid4().hex}", headers={"Accept-Encoding": "gzip"})
+        assert first.status_code == 200
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.content == second.content
+        assert "max-age" in first.headers["cache-control"]
+
+        revalidated = client.get(f"/speaker/{page}/{uuid4().hex}", headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+
+def test_status_data_endpoint(client, db_session):
+    """The status page data comes from JSON, with links to the speaker's other pages."""
+    token, seminar = _make_status_token(db_session)
+
+    response = client.get(f"/api/v1/seminars/speaker-tokens/{token.token}/status")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"]["step"] == 1
+    assert data["speaker"] == {"name": "Shell Speaker", "affiliation": "Shell University", "topic": None}
+    assert data["seminar"]["title"] == seminar.title  # escaped client-side, returned verbatim
+    assert data["seminar"]["date"] == "2026-11-05"
+    assert data["availability_link"].startswith("/speaker/availability/")
+    assert data["info_link"].startswith("/speaker/info/")
+
+    # Links are stable across polls (existing tokens are reused)
+    assert client.get(f"/api/v1/seminars/speaker-tokens/{token.token}/status").json()["info_link"] == data["info_link"]
+
+    # A status token does not unlock other token types, and unknown tokens 404
+    assert client.get(f"/api/v1/seminars/speaker-tokens/{token.token}/info").status_code == 404
+    assert client.get(f"/api/v1/seminars/speaker-tokens/{uuid4().hex}/status").status_code == 404
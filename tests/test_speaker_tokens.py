@@ -0,0 +1,221 @@
+"""
+Tests for cached speaker token resolution.
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import select
+
+from app.caching import TTLCache
+from app.main import (
+    ActivityEvent,
+    SemesterPlan,
+    Seminar,
+    SeminarSlot,
+    Speaker,
+    SpeakerSuggestion,
+    SpeakerToken,
+    SpeakerWorkflow,
+    get_engine,
+)
+from app.speaker_tokens import resolve_token
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+    engine = get_engine()
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _make_token(db_session, token_type="info", seminar_id=None):
+    speaker = Speaker(name="Token Speaker")
+    db_session.add(speaker)
+    db_session.commit()
+    db_session.refresh(speaker)
+    seminar = Seminar(title="Token Talk", date=date.today(), start_time="14:00", speaker_id=speaker.id)
+    suggestion = SpeakerSuggestion(suggested_by="tester", speaker_name=speaker.name, speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.add(suggestion)
+    db_session.commit()
+    db_session.refresh(seminar)
+    db_session.refresh(suggestion)
+    token = SpeakerToken(
+        token=uuid4().hex,
+        suggestion_id=suggestion.id,
+        token_type=token_type,
+        seminar_id=seminar_id,
+        expires_at=datetime.utcnow() + timedelta(days=1),
+    )
+    db_session.add(token)
+    db_session.commit()
+    db_session.refresh(token)
+    return token, seminar
+
+
+def test_ttl_cache_expires_and_evicts():
+    """Entries expire after ttl and the least recently used entry is evicted first."""
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 11
+    assert cache.get("a") is None
+
+
+def test_resolve_token_is_cached_and_invalidated(db_session):
+    """The seminar fallback is resolved once; changing the token's seminar is seen immediately."""
+    token, seminar = _make_token(db_session)
+
+    context = resolve_token(db_session, token.token, "info")
+    assert context.seminar_id == seminar.id  # via suggestion -> speaker -> first seminar
+    assert context.token_seminar_id is None
+
+    with _count_queries() as statements:
+        assert resolve_token(db_session, token.token, "info") == context
+    assert statements == []
+
+    assert resolve_token(db_session, token.token, "availability") is None
+
+    other = Seminar(title="Other Talk", date=date.today(), start_time="15:00", speaker_id=context.speaker_id)
+    db_session.add(other)
+    db_session.commit()
+    db_session.refresh(other)
+    token.seminar_id = other.id
+    db_session.add(token)
+    db_session.commit()
+    assert resolve_token(db_session, token.token, "info").seminar_id == other.id
+
+    token.expires_at = datetime.utcnow() - timedelta(minutes=1)
+    db_session.add(token)
+    db_session.commit()
+    assert resolve_token(db_session, token.token, "info") is None
+
+
+def test_finalize_is_reflected_in_cached_context(client, db_session):
+    """Marking a token used invalidates its cached context."""
+    token, _ = _make_token(db_session)
+
+    response = client.get(f"/api/v1/seminars/speaker-tokens/{token.token}/info")
+    assert response.status_code == 200
+    assert response.json()["has_submitted"] is False
+
+    assert client.post(f"/api/v1/seminars/speaker-tokens/{token.token}/finalize").status_code == 200
+
+    response = client.get(f"/api/v1/seminars/speaker-tokens/{token.token}/info")
+    assert response.json()["has_submitted"] is True
+    assert client.get(f"/api/v1/seminars/speaker-tokens/{uuid4().hex}/files").status_code == 404
+
+
+def test_bulk_token_issuance_reuses_live_tokens(client, auth_headers, db_session):
+    """One request issues a link per suggestion, reusing tokens that are still valid."""
+    plan = SemesterPlan(name="Bulk Plan", academic_year="2026-2027", semester="Fall")
+    db_session.add(plan)
+    db_session.commit()
+    db_session.refresh(plan)
+    suggestions = [
+        SpeakerSuggestion(suggested_by="tester", speaker_name=f"Bulk {i}", semester_plan_id=plan.id)
+        for i in range(3)
+    ]
+    db_session.add_all(suggestions)
+    db_session.commit()
+    for suggestion in suggestions:
+        db_session.refresh(suggestion)
+    existing = SpeakerToken(
+        token=uuid4().hex,
+        suggestion_id=suggestions[0].id,
+        token_type="availability",
+        expires_at=datetime.utcnow() + timedelta(days=5),
+    )
+    db_session.add(existing)
+    db_session.commit()
+
+    commits = []
+    row_reloads = []
+    engine = get_engine()
+    record_commit = lambda conn: commits.append(conn)  # noqa: E731
+
+    def record_reload(conn, cursor, statement, parameters, context, executemany):
+        if "WHERE speaker_tokens.id = ?" in statement or "WHERE speaker_suggestions.id = ?" in statement:
+            row_reloads.append(statement)
+
+    event.listen(engine, "commit", record_commit)
+    event.listen(engine, "before_cursor_execute", record_reload)
+    try:
+        response = client.post(
+            "/api/v1/seminars/speaker-tokens/bulk",
+            json={"semester_plan_id": plan.id, "token_type": "availability"},
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "commit", record_commit)
+        event.remove(engine, "before_cursor_execute", record_reload)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["reused"]) == (2, 1)
+    assert data["links"][0]["link"] == f"/speaker/availability/{existing.token}"
+    assert len(commits) == 1
+    assert row_reloads == []  # links are built before the commit expires the rows
+
+    db_session.expire_all()
+    workflows = db_session.exec(
+        select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id.in_([s.id for s in suggestions]))
+    ).all()
+    assert len(workflows) == 3 and all(w.request_available_dates_sent for w in workflows)
+    events = db_session.exec(
+        select(ActivityEvent).where(
+            ActivityEvent.semester_plan_id == plan.id, ActivityEvent.event_type == "SPEAKER_LINKS_BULK_CREATED"
+        )
+    ).all()
+    assert len(events) == 1
+
+    # Info links carry the assigned seminar; a subset can be selected
+    speaker = Speaker(name="Bulk 1")
+    db_session.add(speaker)
+    db_session.commit()
+    seminar = Seminar(title="Bulk Talk", date=date.today(), start_time="14:00", speaker_id=speaker.id)
+    db_session.add(seminar)
+    db_session.commit()
+    db_session.add(
+        SeminarSlot(
+            semester_plan_id=plan.id,
+            date=date.today(),
+            start_time="14:00",
+            end_time="15:00",
+            room="TBD",
+            assigned_seminar_id=seminar.id,
+            assigned_suggestion_id=suggestions[1].id,
+        )
+    )
+    db_session.commit()
+    response = client.post(
+        "/api/v1/seminars/speaker-tokens/bulk",
+        json={"semester_plan_id": plan.id, "token_type": "info", "suggestion_ids": [suggestions[1].id]},
+        headers=auth_headers,
+    )
+    assert [link["seminar_id"] for link in response.json()["links"]] == [seminar.id]
+
+    other_plan = SemesterPlan(name="Other Plan", academic_year="2026-2027", semester="Spring")
+    db_session.add(other_plan)
+    db_session.commit()
+    response = client.post(
+        "/api/v1/seminars/speaker-tokens/bulk",
+        json={"semester_plan_id": other_plan.id, "token_type": "info", "suggestion_ids": [suggestions[0].id]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
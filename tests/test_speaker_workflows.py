@@ -0,0 +1,44 @@
+"""
+Tests for the speaker workflow list and status funnel.
+"""
+
+from uuid import uuid4
+
+from sqlmodel import select
+
+from app.main import SemesterPlan, SpeakerSuggestion, SpeakerWorkflow
+
+
+def test_workflow_list_reads_without_writing_and_counts_funnel(client, auth_headers, db_session):
+    plan = SemesterPlan(name=f"Funnel {uuid4().hex[:6]}", academic_year="2033-2034", semester="spring")
+    db_session.add(plan)
+    db_session.commit()
+    db_session.refresh(plan)
+    suggestions = [SpeakerSuggestion(suggested_by="Faculty", speaker_name=f"Speaker {i}", semester_plan_id=plan.id) for i in range(4)]
+    db_session.add_all(suggestions)
+    db_session.commit()
+    db_session.add_all([
+        SpeakerWorkflow(suggestion_id=suggestions[0].id, speaker_notified_of_date=True),
+        SpeakerWorkflow(suggestion_id=suggestions[1].id, speaker_notified_of_date=True, proposal_submitted=True, proposal_approved=True),
+        SpeakerWorkflow(suggestion_id=suggestions[2].id, request_available_dates_sent=True),
+    ])
+    db_session.commit()
+
+    response = client.get(f"/api/v1/seminars/semester-plans/{plan.id}/speaker-workflows", headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    expected = {"waiting_availability": 2, "date_assigned": 1, "info_received": 0, "proposal_approved": 1}
+    assert body["funnel"] == expected
+    by_step = {}
+    for item in body["items"]:
+        by_step[item["status_page"]["code"]] = by_step.get(item["status_page"]["code"], 0) + 1
+    assert {code: by_step.get(code, 0) for code in expected} == expected
+
+    # The suggestion without a workflow row gets defaults, and no row is created by the read
+    missing = next(i for i in body["items"] if i["suggestion_id"] == suggestions[3].id)
+    assert missing["workflow"]["request_available_dates_sent"] is False
+    db_session.expire_all()
+    assert db_session.exec(select(SpeakerWorkflow).where(SpeakerWorkflow.suggestion_id == suggestions[3].id)).first() is None
+
+    funnel = client.get(f"/api/v1/seminars/semester-plans/{plan.id}/speaker-workflows/funnel", headers=auth_headers)
+    assert funnel.json() == expected
@@ -0,0 +1,44 @@
+"""
+Tests for streaming file uploads.
+"""
+
+import hashlib
+from pathlib import Path
+
+from sqlmodel import select
+
+from app import uploads
+from app.main import UploadedFile, settings
+
+
+def _leftover_parts():
+    return list(Path(settings.uploads_dir).glob(".*.part"))
+
+
+def test_upload_streams_to_disk_with_hash(upload_file, db_session):
+    content = b"%PDF-1.7 " + bytes(range(256)) * 9000  # ~2.3 MB, several write chunks
+    record = db_session.get(UploadedFile, upload_file(content, "talk.pdf", category="cv"))
+    assert record.sha256 == hashlib.sha256(content).hexdigest()
+    assert (record.file_size, record.file_category, record.content_type) == (len(content), "cv", "application/pdf")
+    assert record.original_filename == "talk.pdf"
+    assert (Path(settings.uploads_dir) / record.storage_filename).read_bytes() == content
+    assert not _leftover_parts()
+
+
+def test_upload_over_category_limit_is_rejected(client, auth_headers, db_session, seminar, monkeypatch):
+    monkeypatch.setitem(uploads.CATEGORY_SIZE_LIMITS, "photo", 1024)
+    before = db_session.exec(select(UploadedFile).where(UploadedFile.seminar_id == seminar.id)).all()
+    response = client.post(
+        f"/api/seminars/{seminar.id}/files",
+        data={"category": "photo"},
+        files={"file": ("big.jpg", b"x" * 4096, "image/jpeg")},
+        headers=auth_headers,
+    )
+    assert response.status_code == 413
+    assert db_session.exec(select(UploadedFile).where(UploadedFile.seminar_id == seminar.id)).all() == before
+    assert not _leftover_parts()
+
+    # Without a file part
+    response = client.post(f"/api/seminars/{seminar.id}/files", data={"category": "cv"}, files={"other": ("a.txt", b"a")}, headers=auth_headers)
+    assert response.status_code == 400
+    assert not _leftover_parts()
@@ -0,0 +1,45 @@
+"""
+Tests for table-version ETags and conditional GETs.
+"""
+
+from sqlalchemy import text
+
+from app.main import Room
+
+
+def test_conditional_get_returns_304_until_table_changes(client, auth_headers, db_session):
+    """A matching If-None-Match short-circuits; any write to a listed table changes the ETag."""
+    first = client.get("/api/rooms", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    cached = client.get("/api/rooms", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    # Query parameters are part of the representation
+    filtered = client.get("/api/rooms", params={"q": "Lecture"}, headers={**auth_headers, "If-None-Match": etag})
+    assert filtered.status_code == 200
+
+    # Unrelated tables do not invalidate; the versioned ones do, including raw SQL writes
+    client.get("/api/v1/seminars/activity", headers=auth_headers)
+    assert client.get("/api/rooms", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+    db_session.add(Room(name="Versioned Room"))
+    db_session.commit()
+    changed = client.get("/api/rooms", headers={**auth_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+    etag = changed.headers["etag"]
+    db_session.exec(text("UPDATE rooms SET capacity = 12 WHERE name = 'Versioned Room'"))
+    db_session.commit()
+    assert client.get("/api/rooms", headers={**auth_headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_conditional_get_still_requires_auth(client, auth_headers):
+    """A valid ETag never bypasses authentication."""
+    etag = client.get("/api/v1/seminars/speakers", headers=auth_headers).headers["etag"]
+    assert client.get("/api/v1/seminars/speakers", headers={"If-None-Match": etag}).status_code == 401